@@ -183,9 +183,8 @@ class _BaccaratView(discord.ui.View):
             await interaction.response.send_message("Table is full.", ephemeral=True)
             return
 
-        new_bal = await wallet_service.withdraw(uid, self.bet)
-        if new_bal is None:
-            bal = await wallet_service.get_balance(uid)
+        ok, bal = await wallet_service.try_withdraw(uid, self.bet)
+        if not ok:
             await interaction.response.send_message(
                 f"Not enough to join. Balance: **{fmt_money(bal)}** (need **{fmt_money(self.bet)}**)", ephemeral=True
             )
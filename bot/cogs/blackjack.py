@@ -1,6 +1,7 @@
 import asyncio
 import logging
 import random
+import time
 from dataclasses import dataclass, field
 
 import discord
@@ -15,46 +16,91 @@ log = logging.getLogger(__name__)
 RANKS = ["A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K"]
 SUITS = ["♠", "♥", "♦", "♣"]
 MAX_PLAYERS = 6
-
-
-def _draw() -> str:
-    return random.choice(RANKS) + random.choice(SUITS)
-
-
-def _value(hand: list[str]) -> int:
+MIN_EDIT_GAP = 0.6  # seconds; closer non-forced message edits are dropped
+
+# Cards are ints: rank index (0 = A … 12 = K) in the low nibble, suit above it.
+_ACE = 0
+_RANK_VALUE = (11, 2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10)
+_CARDS = tuple(suit << 4 | rank for suit in range(len(SUITS)) for rank in range(len(RANKS)))
+_CARD_GLYPHS = [""] * (len(SUITS) << 4)
+for _c in _CARDS:
+    _CARD_GLYPHS[_c] = RANKS[_c & 0xF] + SUITS[_c >> 4]
+del _c
+
+_DEFAULT_COLOR = discord.Color.blurple()
+_PHASE_COLORS = {
+    "joining": discord.Color.yellow(),
+    "playing": _DEFAULT_COLOR,
+    "dealer": discord.Color.orange(),
+    "done": discord.Color.dark_grey(),
+}
+
+
+# The table's own generator, bound once so draws skip the module lookup
+_rng = random.Random()
+_getrandbits = _rng.getrandbits
+
+
+def _draw() -> int:
+    # One 6-bit draw per card; reject the 12 values past the deck (~1.2 draws avg)
+    while True:
+        i = _getrandbits(6)
+        if i < 52:
+            return _CARDS[i]
+
+
+def _tally(hand: list[int]) -> tuple[int, int]:
+    """Return (best total, aces still counted as 11)."""
+    rank_value = _RANK_VALUE
     total = 0
     aces = 0
     for card in hand:
-        rank = card[:-1]  # strip suit (last char)
-        if rank in ("J", "Q", "K"):
-            total += 10
-        elif rank == "A":
+        rank = card & 0xF
+        total += rank_value[rank]
+        if rank == _ACE:
             aces += 1
-            total += 11
-        else:
-            total += int(rank)
     while total > 21 and aces:
         total -= 10
         aces -= 1
-    return total
+    return total, aces
+
+
+def _add_card(total: int, aces: int, card: int) -> tuple[int, int]:
+    """Fold one more card into a running ``_tally`` result."""
+    rank = card & 0xF
+    total += _RANK_VALUE[rank]
+    if rank == _ACE:
+        aces += 1
+    while total > 21 and aces:
+        total -= 10
+        aces -= 1
+    return total, aces
+
 
+def _value(hand: list[int]) -> int:
+    return _tally(hand)[0]
 
-def _is_bj(hand: list[str]) -> bool:
-    return len(hand) == 2 and _value(hand) == 21
 
+def _is_bj(hand: list[int]) -> bool:
+    # Two cards make 21 only as an ace plus a ten-value card
+    if len(hand) != 2:
+        return False
+    r1, r2 = hand[0] & 0xF, hand[1] & 0xF
+    return (r1 == _ACE and _RANK_VALUE[r2] == 10) or (r2 == _ACE and _RANK_VALUE[r1] == 10)
 
-def _rank(card: str) -> str:
-    return card[:-1]
 
+def _rank(card: int) -> int:
+    return card & 0xF
 
-def _can_split(hand: list[str]) -> bool:
+
+def _can_split(hand: list[int]) -> bool:
     return len(hand) == 2 and _rank(hand[0]) == _rank(hand[1])
 
 
-def _fmt(hand: list[str], hide_hole: bool = False) -> str:
+def _fmt(hand: list[int], hide_hole: bool = False) -> str:
     if hide_hole and len(hand) >= 2:
-        return f"{hand[0]}  ??"
-    return "  ".join(hand)
+        return f"{_CARD_GLYPHS[hand[0]]}  ??"
+    return "  ".join(_CARD_GLYPHS[c] for c in hand)
 
 
 @dataclass
@@ -62,16 +108,80 @@ class _Player:
     user_id: int
     name: str
     bet: float
-    hand: list[str] = field(default_factory=list)
+    hand: list[int] = field(default_factory=list)
     stood: bool = False
     doubled: bool = False
     result: str | None = None  # "blackjack" | "win" | "push" | "lose"
     final_balance: int | None = None
     is_split: bool = False  # True for hands created via split (no re-split, no 3:2)
+    reservation_id: int | None = None  # wallet hold covering this hand's bet
+    hand_str: str = field(default="", repr=False)  # _fmt(hand), grown one card at a time
+    _val_cache: int | None = field(default=None, repr=False)
+    _render_cache: tuple[tuple, str] | None = field(default=None, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.hand and not self.hand_str:
+            self.hand_str = _fmt(self.hand)
+
+    def add_card(self, card: int) -> None:
+        self.hand.append(card)
+        glyph = _CARD_GLYPHS[card]
+        self.hand_str = f"{self.hand_str}  {glyph}" if self.hand_str else glyph
+        self._val_cache = None
+        self._render_cache = None
+
+    def split_off(self) -> int:
+        """Remove and return the second card of a pair."""
+        card = self.hand.pop(1)
+        self.hand_str = _fmt(self.hand)
+        self._val_cache = None
+        self._render_cache = None
+        return card
+
+    def render(self, phase: str) -> str:
+        """Embed field body for this hand, rebuilt only when its state changes."""
+        key = (phase, self.stood, self.result, self.bet, self.final_balance)
+        if self._render_cache is not None and self._render_cache[0] == key:
+            return self._render_cache[1]
+
+        v = self.val
+        if self.result == "blackjack":
+            status = "🃏 Blackjack!"
+        elif self.result == "win":
+            status = "✅ Win"
+        elif self.result == "push":
+            status = "🔁 Push"
+        elif self.result == "lose":
+            status = "❌ Lose"
+        elif v > 21:
+            status = "💀 Bust"
+        elif v == 21 and len(self.hand) == 2 and phase != "joining":
+            status = "🃏 Blackjack!"
+        elif self.stood:
+            status = "Stand"
+        else:
+            status = ""
+
+        lines = []
+        if self.hand:
+            lines.append(f"{self.hand_str} ({v})")
+        else:
+            lines.append("—")
+        lines.append(f"Bet: **{fmt_money(self.bet)}**")
+        if status:
+            lines.append(status)
+        if phase == "done" and self.final_balance is not None:
+            lines.append(f"Balance: **{fmt_money(self.final_balance)}**")
+
+        value = "\n".join(lines)
+        self._render_cache = (key, value)
+        return value
 
     @property
     def val(self) -> int:
-        return _value(self.hand)
+        if self._val_cache is None:
+            self._val_cache = _value(self.hand)
+        return self._val_cache
 
     @property
     def busted(self) -> bool:
@@ -79,11 +189,14 @@ class _Player:
 
     @property
     def blackjack(self) -> bool:
-        return _is_bj(self.hand)
+        return len(self.hand) == 2 and self.val == 21
 
     @property
     def done(self) -> bool:
-        return self.stood or self.busted or self.blackjack or self.result is not None
+        if self.stood or self.result is not None:
+            return True
+        v = self.val
+        return v > 21 or (v == 21 and len(self.hand) == 2)
 
 
 # ── View ──────────────────────────────────────────────────────────────────────
@@ -95,25 +208,41 @@ class _BlackjackView(discord.ui.View):
         self.host = host
         self.bet = bet
         self.players: list[_Player] = []
-        self.dealer_hand: list[str] = []
+        self.dealer_hand: list[int] = []
+        self.dealer_hand_str = ""  # full dealer hand, grown as the dealer draws
+        self._dealer_hidden_str = ""  # up card + "??", fixed once dealt
         self.phase = "joining"  # joining | playing | dealer | done
         self.current_idx: int = 0
         self.message: discord.PartialMessage | None = None
+        self._dealer_task: asyncio.Task | None = None
+        self._last_edit_ts = 0.0
         self._update_buttons()
 
     # ── helpers ───────────────────────────────────────────────────────────────
 
     async def _safe_edit(self, interaction: discord.Interaction) -> None:
         """Edit via the button interaction if still valid, else fall back to direct message edit."""
+        content, embed = self._build_content(), self._build_embed()
+        self._last_edit_ts = time.monotonic()
         try:
-            await interaction.response.edit_message(content=self._build_content(), embed=self._build_embed(), view=self)
+            await interaction.response.edit_message(content=content, embed=embed, view=self)
         except discord.NotFound:
             if self.message:
                 try:
-                    await self.message.edit(content=self._build_content(), embed=self._build_embed(), view=self)
+                    await self.message.edit(content=content, embed=embed, view=self)
                 except discord.HTTPException:
                     pass
 
+    async def _maybe_edit(self, force: bool = False) -> None:
+        """Redraw the table message unless another edit went out under MIN_EDIT_GAP ago."""
+        if not self.message:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_edit_ts < MIN_EDIT_GAP:
+            return
+        self._last_edit_ts = now
+        await self.message.edit(content=self._build_content(), embed=self._build_embed(), view=self)
+
     def _update_buttons(self) -> None:
         joining = self.phase == "joining"
         playing = self.phase == "playing"
@@ -134,26 +263,20 @@ class _BlackjackView(discord.ui.View):
             lines.append(f"Waiting for players · Joined: {joined}")
         elif self.dealer_hand:
             hide = self.phase == "playing"
-            dealer_str = _fmt(self.dealer_hand, hide_hole=hide)
+            dealer_str = self._dealer_hidden_str if hide else self.dealer_hand_str
             val_str = f" ({_value(self.dealer_hand)})" if not hide else ""
             lines.append(f"Dealer: {dealer_str}{val_str}")
             for i, p in enumerate(self.players):
                 arrow = " ←" if self.phase == "playing" and i == self.current_idx and not p.done else ""
-                hand_str = _fmt(p.hand) if p.hand else "—"
+                hand_str = p.hand_str or "—"
                 val = f" ({p.val})" if p.hand else ""
                 lines.append(f"{p.name}{arrow}: {hand_str}{val} · bet {fmt_money(p.bet)}")
         return "\n".join(lines)
 
     def _build_embed(self) -> discord.Embed:
-        colors = {
-            "joining": discord.Color.yellow(),
-            "playing": discord.Color.blurple(),
-            "dealer": discord.Color.orange(),
-            "done": discord.Color.dark_grey(),
-        }
         embed = discord.Embed(
             title=f"🃏 Blackjack — {fmt_money(self.bet)}",
-            color=colors.get(self.phase, discord.Color.blurple()),
+            color=_PHASE_COLORS.get(self.phase, _DEFAULT_COLOR),
         )
         embed.set_author(
             name=self.host.display_name,
@@ -166,7 +289,7 @@ class _BlackjackView(discord.ui.View):
             val_str = f" ({_value(self.dealer_hand)})" if not hide else ""
             embed.add_field(
                 name=f"Dealer{val_str}",
-                value=_fmt(self.dealer_hand, hide_hole=hide),
+                value=self._dealer_hidden_str if hide else self.dealer_hand_str,
                 inline=False,
             )
         else:
@@ -176,40 +299,14 @@ class _BlackjackView(discord.ui.View):
         if not self.players:
             embed.add_field(name="Players", value="None yet — press Join!", inline=False)
         else:
+            add_field = embed.add_field
+            phase = self.phase
+            current = self.current_idx if phase == "playing" else -1
             for i, p in enumerate(self.players):
                 label = p.name
-                if self.phase == "playing" and i == self.current_idx and not p.done:
+                if i == current and not p.done:
                     label += " ←"
-
-                if p.result == "blackjack":
-                    status = "🃏 Blackjack!"
-                elif p.result == "win":
-                    status = "✅ Win"
-                elif p.result == "push":
-                    status = "🔁 Push"
-                elif p.result == "lose":
-                    status = "❌ Lose"
-                elif p.busted:
-                    status = "💀 Bust"
-                elif p.blackjack and self.phase != "joining":
-                    status = "🃏 Blackjack!"
-                elif p.stood:
-                    status = "Stand"
-                else:
-                    status = ""
-
-                lines = []
-                if p.hand:
-                    lines.append(f"{_fmt(p.hand)} ({p.val})")
-                else:
-                    lines.append("—")
-                lines.append(f"Bet: **{fmt_money(p.bet)}**")
-                if status:
-                    lines.append(status)
-                if self.phase == "done" and p.final_balance is not None:
-                    lines.append(f"Balance: **{fmt_money(p.final_balance)}**")
-
-                embed.add_field(name=label, value="\n".join(lines), inline=True)
+                add_field(name=label, value=p.render(phase), inline=True)
 
         if self.phase == "joining":
             embed.set_footer(text=f"Bet: {fmt_money(self.bet)} · Up to {MAX_PLAYERS} players · Host presses Deal to start")
@@ -234,15 +331,16 @@ class _BlackjackView(discord.ui.View):
             await interaction.response.send_message("Table is full.", ephemeral=True)
             return
 
-        new_bal = await wallet_service.withdraw(uid, self.bet)
-        if new_bal is None:
-            bal = await wallet_service.get_balance(uid)
+        reservation_id, bal = await wallet_service.try_reserve(uid, self.bet)
+        if reservation_id is None:
             await interaction.response.send_message(
                 f"Not enough to join. Balance: **{fmt_money(bal)}** (need **{fmt_money(self.bet)}**)", ephemeral=True
             )
             return
 
-        self.players.append(_Player(user_id=uid, name=interaction.user.display_name, bet=self.bet))
+        self.players.append(_Player(
+            user_id=uid, name=interaction.user.display_name, bet=self.bet, reservation_id=reservation_id,
+        ))
         await interaction.response.edit_message(content=self._build_content(), embed=self._build_embed(), view=self)
 
     @discord.ui.button(label="Deal", style=discord.ButtonStyle.primary)
@@ -269,14 +367,15 @@ class _BlackjackView(discord.ui.View):
             await interaction.response.send_message("Not your turn.", ephemeral=True)
             return
 
-        p.hand.append(_draw())
+        p.add_card(_draw())
         # Disable double/split — can't use them after hitting
         self.double_btn.disabled = True
         self.split_btn.disabled = True
 
-        await self._safe_edit(interaction)
         if p.busted:
-            await self._advance()
+            await self._advance(interaction)
+        else:
+            await self._safe_edit(interaction)
 
     @discord.ui.button(label="Stand", style=discord.ButtonStyle.danger)
     async def stand_btn(
@@ -291,8 +390,7 @@ class _BlackjackView(discord.ui.View):
             return
 
         p.stood = True
-        await self._safe_edit(interaction)
-        await self._advance()
+        await self._advance(interaction)
 
     @discord.ui.button(label="Restart", style=discord.ButtonStyle.secondary, disabled=True)
     async def restart_btn(
@@ -302,17 +400,17 @@ class _BlackjackView(discord.ui.View):
             await interaction.response.send_message("Only the host can restart.", ephemeral=True)
             return
 
-        new_bal = await wallet_service.withdraw(self.host.id, self.bet)
-        if new_bal is None:
-            bal = await wallet_service.get_balance(self.host.id)
+        reservation_id, bal = await wallet_service.try_reserve(self.host.id, self.bet)
+        if reservation_id is None:
             await interaction.response.send_message(
                 f"Not enough to restart. Balance: **{fmt_money(bal)}** (need **{fmt_money(self.bet)}**)",
                 ephemeral=True,
             )
             return
 
-        self.players = [_Player(self.host.id, self.host.display_name, self.bet)]
+        self.players = [_Player(self.host.id, self.host.display_name, self.bet, reservation_id=reservation_id)]
         self.dealer_hand = []
+        self.dealer_hand_str = self._dealer_hidden_str = ""
         self.phase = "joining"
         self.current_idx = 0
         self._update_buttons()
@@ -335,9 +433,8 @@ class _BlackjackView(discord.ui.View):
             )
             return
 
-        new_bal = await wallet_service.withdraw(p.user_id, p.bet)
-        if new_bal is None:
-            bal = await wallet_service.get_balance(p.user_id)
+        rid, bal = await wallet_service.try_reserve(p.user_id, p.bet, p.reservation_id)
+        if rid is None:
             await interaction.response.send_message(
                 f"Not enough to double. Balance: **{fmt_money(bal)}**", ephemeral=True
             )
@@ -345,11 +442,10 @@ class _BlackjackView(discord.ui.View):
 
         p.bet *= 2
         p.doubled = True
-        p.hand.append(_draw())
+        p.add_card(_draw())
         p.stood = True  # must stand after doubling
 
-        await self._safe_edit(interaction)
-        await self._advance()
+        await self._advance(interaction)
 
     @discord.ui.button(label="Split", style=discord.ButtonStyle.secondary)
     async def split_btn(
@@ -371,28 +467,28 @@ class _BlackjackView(discord.ui.View):
             await interaction.response.send_message("Cannot re-split.", ephemeral=True)
             return
 
-        new_bal = await wallet_service.withdraw(p.user_id, p.bet)
-        if new_bal is None:
-            bal = await wallet_service.get_balance(p.user_id)
+        reservation_id, bal = await wallet_service.try_reserve(p.user_id, p.bet)
+        if reservation_id is None:
             await interaction.response.send_message(
                 f"Not enough to split. Balance: **{fmt_money(bal)}**", ephemeral=True
             )
             return
 
         # Give each hand one new card; insert split hand after current player
-        split_card = p.hand.pop(1)
-        p.hand.append(_draw())
+        split_card = p.split_off()
+        p.add_card(_draw())
         split_player = _Player(
             user_id=p.user_id,
             name=p.name + " (split)",
             bet=p.bet,
             hand=[split_card, _draw()],
             is_split=True,
+            reservation_id=reservation_id,
         )
         self.players.insert(self.current_idx + 1, split_player)
 
         # Splitting aces: auto-stand both hands (one card each, standard rule)
-        if _rank(p.hand[0]) == "A":
+        if _rank(p.hand[0]) == _ACE:
             p.stood = True
             split_player.stood = True
 
@@ -400,17 +496,21 @@ class _BlackjackView(discord.ui.View):
         self.double_btn.disabled = True
         self.split_btn.disabled = True
 
-        await self._safe_edit(interaction)
         if p.done:
-            await self._advance()
+            await self._advance(interaction)
+        else:
+            await self._safe_edit(interaction)
 
     # ── game logic ────────────────────────────────────────────────────────────
 
     async def _deal(self, interaction: discord.Interaction) -> None:
         self.phase = "playing"
         for p in self.players:
-            p.hand = [_draw(), _draw()]
+            p.add_card(_draw())
+            p.add_card(_draw())
         self.dealer_hand = [_draw(), _draw()]
+        self.dealer_hand_str = _fmt(self.dealer_hand)
+        self._dealer_hidden_str = _fmt(self.dealer_hand, hide_hole=True)
 
         # Find first non-done player (skip instant blackjacks)
         self.current_idx = 0
@@ -421,50 +521,76 @@ class _BlackjackView(discord.ui.View):
 
         if self.current_idx >= len(self.players):
             # All players have blackjack — go straight to dealer
-            await self._safe_edit(interaction)
-            await self._dealer_play()
+            await self._dealer_play(interaction)
         else:
             p0 = self.players[self.current_idx]
             self.double_btn.disabled = False
             self.split_btn.disabled = not _can_split(p0.hand)
             await self._safe_edit(interaction)
 
-    async def _advance(self) -> None:
+    async def _advance(self, interaction: discord.Interaction | None = None) -> None:
+        """Move to the next unfinished hand and show it in a single edit.
+
+        When called from a button, the edit goes through that interaction
+        instead of acking it with a stale state and editing again.
+        """
         self.current_idx += 1
         while self.current_idx < len(self.players) and self.players[self.current_idx].done:
             self.current_idx += 1
 
         if self.current_idx >= len(self.players):
-            await self._dealer_play()
+            await self._dealer_play(interaction)
         else:
             p = self.players[self.current_idx]
             self.double_btn.disabled = len(p.hand) != 2
             self.split_btn.disabled = not _can_split(p.hand) or p.is_split
-            if self.message:
-                await self.message.edit(content=self._build_content(), embed=self._build_embed(), view=self)
+            if interaction is not None:
+                await self._safe_edit(interaction)
+            else:
+                await self._maybe_edit(force=True)
 
-    async def _dealer_play(self) -> None:
+    async def _dealer_play(self, interaction: discord.Interaction | None = None) -> None:
         self.phase = "dealer"
         self._update_buttons()
         # Reveal hole card
-        if self.message:
-            await self.message.edit(content=self._build_content(), embed=self._build_embed(), view=self)
+        if interaction is not None:
+            await self._safe_edit(interaction)
+        else:
+            try:
+                await self._maybe_edit(force=True)
+            except discord.HTTPException:
+                pass  # the draw below still has to run and settle the table
 
-        while _value(self.dealer_hand) < 17:
-            await asyncio.sleep(1.5)
-            self.dealer_hand.append(_draw())
-            if self.message:
-                await self.message.edit(content=self._build_content(), embed=self._build_embed(), view=self)
+        # The draw animation runs for several seconds; don't hold the button
+        # handler open for it. Keep a reference so the task isn't collected.
+        self._dealer_task = asyncio.create_task(self._dealer_draw())
 
-        await self._resolve()
+    async def _dealer_draw(self) -> None:
+        try:
+            total, aces = _tally(self.dealer_hand)
+            while total < 17:
+                await asyncio.sleep(1.5)
+                card = _draw()
+                self.dealer_hand.append(card)
+                self.dealer_hand_str += "  " + _CARD_GLYPHS[card]
+                total, aces = _add_card(total, aces, card)
+                # The card that ends the turn is shown by _resolve's edit
+                if total < 17:
+                    try:
+                        await self._maybe_edit()
+                    except discord.HTTPException:
+                        pass  # a dropped frame must not stop settlement
+
+            await self._resolve()
+        except Exception:
+            log.exception("Blackjack dealer turn failed")
 
     async def _resolve(self) -> None:
-        self.phase = "done"
-        self._update_buttons()
-
         dealer_val = _value(self.dealer_hand)
         dealer_bj = _is_bj(self.dealer_hand)
 
+        # Settle every hand first, then close the whole table's holds in one write
+        returns: list[float] = []
         for p in self.players:
             returned = 0.0
             if p.busted:
@@ -473,48 +599,77 @@ class _BlackjackView(discord.ui.View):
                 if p.is_split:
                     p.result = "win"
                     returned = p.bet * 2
-                    await leaderboard_notifier.deposit_and_notify(p.user_id, returned, "blackjack")
                 else:
                     p.result = "blackjack"
                     returned = p.bet + int(p.bet * 1.5)
-                    await leaderboard_notifier.deposit_and_notify(p.user_id, returned, "blackjack")
             elif p.blackjack and dealer_bj:
                 p.result = "push"
                 returned = p.bet
-                await wallet_service.deposit(p.user_id, p.bet)
             elif dealer_bj:
                 p.result = "lose"
             elif dealer_val > 21 or p.val > dealer_val:
                 p.result = "win"
                 returned = p.bet * 2
-                await leaderboard_notifier.deposit_and_notify(p.user_id, returned, "blackjack")
             elif p.val == dealer_val:
                 p.result = "push"
                 returned = p.bet
-                await wallet_service.deposit(p.user_id, p.bet)
             else:
                 p.result = "lose"
-            p.final_balance = await wallet_service.get_balance(p.user_id)
-            try:
-                await wallet_service.record_game(
+            returns.append(returned)
+
+        winners: dict[int, float] = {}
+        for p, returned in zip(self.players, returns):
+            if p.result in ("win", "blackjack"):
+                winners[p.user_id] = winners.get(p.user_id, 0) + returned
+        board_before = await leaderboard_notifier.snapshot() if winners else []
+        balances = await wallet_service.settle_many(
+            [(p.reservation_id, returned) for p, returned in zip(self.players, returns)]
+        )
+        # Only now is the table "done": if anything above fails, on_timeout
+        # still sees "dealer" and releases the holds
+        self.phase = "done"
+        self._update_buttons()
+        for p in self.players:
+            p.final_balance = balances.get(p.user_id)
+        for uid, amount in winners.items():
+            await leaderboard_notifier.notify_if_passed(uid, amount, board_before, "blackjack")
+
+        # Stats are best-effort; a failure here shouldn't break the table
+        await asyncio.gather(
+            *(
+                wallet_service.record_game(
                     p.user_id, "blackjack", p.bet, returned,
                     won=p.result in ("win", "blackjack"),
                     pushed=p.result == "push",
                 )
-            except Exception:
-                pass
+                for p, returned in zip(self.players, returns)
+            ),
+            return_exceptions=True,
+        )
 
-        if self.message:
-            await self.message.edit(content=self._build_content(), embed=self._build_embed(), view=self)
+        try:
+            await self._maybe_edit(force=True)
+        except discord.HTTPException:
+            pass  # already settled; on_timeout closes the view regardless
 
     async def on_timeout(self) -> None:
+        # Let a running dealer turn finish so the table is settled, not stranded
+        if self._dealer_task is not None and not self._dealer_task.done():
+            await self._dealer_task
+        # Abandoned table: refund open hands; busted hands forfeit their hold
         if self.phase == "joining":
-            for p in self.players:
-                await wallet_service.deposit(p.user_id, p.bet)
+            await wallet_service.release_many([p.reservation_id for p in self.players])
         elif self.phase == "playing":
-            for p in self.players:
-                if p.result is None and not p.busted:
-                    await wallet_service.deposit(p.user_id, p.bet)
+            await wallet_service.settle_many([
+                (p.reservation_id, 0 if p.busted else None)
+                for p in self.players
+                if p.result is None
+            ])
+        elif self.phase == "dealer":
+            # The dealer turn failed before settling: refund standing hands
+            await wallet_service.settle_many([
+                (p.reservation_id, 0 if p.busted else None) for p in self.players
+            ])
         for item in self.children:
             item.disabled = True  # type: ignore[union-attr]
         if self.message:
@@ -543,17 +698,18 @@ class Blackjack(commands.Cog):
             )
             return
 
-        # Charge the host immediately
-        new_bal = await wallet_service.withdraw(interaction.user.id, bet)
-        if new_bal is None:
-            bal = await wallet_service.get_balance(interaction.user.id)
+        # Hold the host's stake immediately
+        reservation_id, bal = await wallet_service.try_reserve(interaction.user.id, bet)
+        if reservation_id is None:
             await interaction.response.send_message(
                 f"Not enough to start. Balance: **{fmt_money(bal)}** (need **{fmt_money(bet)}**)", ephemeral=True
             )
             return
 
         view = _BlackjackView(host=interaction.user, bet=bet)
-        view.players.append(_Player(user_id=interaction.user.id, name=interaction.user.display_name, bet=bet))
+        view.players.append(_Player(
+            user_id=interaction.user.id, name=interaction.user.display_name, bet=bet, reservation_id=reservation_id,
+        ))
         await interaction.response.send_message(content=view._build_content(), embed=view._build_embed(), view=view)
         original = await interaction.original_response()
         view.message = interaction.channel.get_partial_message(original.id)
@@ -1,5 +1,7 @@
+import asyncio
 import logging
 import random
+from typing import NamedTuple
 
 import discord
 from discord import app_commands
@@ -11,71 +13,159 @@ from bot.utils import fmt_money, valid_bet
 
 log = logging.getLogger(__name__)
 
-DICE_FACES = {1: "⚀", 2: "⚁", 3: "⚂", 4: "⚃", 5: "⚄", 6: "⚅"}
+DICE_FACES = ("", "⚀", "⚁", "⚂", "⚃", "⚄", "⚅")  # indexed by pip count
+EDIT_DEBOUNCE = 0.25  # seconds; a burst of fades/backs within this window shares one edit
 
-_NATURAL_FLAVOR = [
+_NATURAL_FLAVOR = (
     "Natural. Pay the man.",
     "Seven out of the gate. Shooter's hot.",
     "First roll, first blood.",
     "Yo-leven. Collect your bread.",
     "Natural. Easy money.",
-]
-_CRAPS_FLAVOR = [
+)
+_CRAPS_FLAVOR = (
     "Craps. Step back.",
     "Snake eyes. That's it.",
     "Boxcars. House wins.",
     "Ace-deuce. Shooter's done.",
     "Craps. Next shooter.",
-]
-_POINT_FLAVOR = [
+)
+_POINT_FLAVOR = (
     "Point's on {n}. Roll again.",
     "{n} is the mark. Don't seven out.",
     "Shooter's going for {n}.",
     "Mark it {n}.",
-]
-_POINT_HIT_FLAVOR = [
+)
+_POINT_HIT_FLAVOR = (
     "Hit that {n}. Pay up.",
     "Shooter made it. Collect.",
     "That's the number. Money moves.",
     "{n} again. Get paid.",
-]
-_SEVEN_OUT_FLAVOR = [
+)
+_SEVEN_OUT_FLAVOR = (
     "Seven. That's it.",
     "Sevened out. Pass the bones.",
     "Seven out. Next shooter.",
     "Seven. Step aside.",
-]
-_ONGOING_FLAVOR = [
+)
+_ONGOING_FLAVOR = (
     "Keep rolling.",
     "Not yet.",
     "Again.",
     "Still shooting.",
-]
+)
+
+
+# state → (embed color, title or None for "Point: n", footer flavor lines)
+_STATE: dict[str, tuple[discord.Color, str | None, tuple[str, ...] | None]] = {
+    "betting":   (discord.Color.yellow(),   "Looking for action...", None),
+    "point":     (discord.Color.blurple(),  None,                    _POINT_FLAVOR),
+    "ongoing":   (discord.Color.blurple(),  None,                    _ONGOING_FLAVOR),
+    "natural":   (discord.Color.green(),    "Natural!",              _NATURAL_FLAVOR),
+    "craps":     (discord.Color.red(),      "Craps!",                _CRAPS_FLAVOR),
+    "point_hit": (discord.Color.green(),    "Point Made!",           _POINT_HIT_FLAVOR),
+    "seven_out": (discord.Color.dark_red(), "Seven Out!",            _SEVEN_OUT_FLAVOR),
+}
+
+
+# Come-out outcome by dice total (index 0..12); doubles as the roll-log label
+_COMEOUT_STATE = (
+    None, None, "craps", "craps", "point", "point", "point",
+    "natural", "point", "point", "point", "natural", "craps",
+)
+
+# point → (state, roll-log label) by dice total, for every roll after the come-out
+_POINT_ROLL_STATE = {
+    point: tuple(
+        ("point_hit", "hit!") if total == point
+        else ("seven_out", "seven out") if total == 7
+        else ("ongoing", "")
+        for total in range(13)
+    )
+    for point in (4, 5, 6, 8, 9, 10)
+}
+
+
+# The game's own generator, bound once so rolls skip the module lookup
+_rng = random.Random()
+_getrandbits = _rng.getrandbits
+
+
+# All 36 (d1, d2) outcomes, repeated three times so a 7-bit draw below 108
+# indexes straight into a fair roll
+_ROLLS = tuple((d1, d2) for d1 in range(1, 7) for d2 in range(1, 7)) * 3
 
 
 def _roll() -> tuple[int, int]:
-    return random.randint(1, 6), random.randint(1, 6)
+    # One 7-bit draw covers both dice; the 20 values past the table are
+    # redrawn (~1.2 draws avg)
+    while True:
+        r = _getrandbits(7)
+        if r < 108:
+            return _ROLLS[r]
+
+
+# "⚂ ⚅  **9**" for every (d1, d2), indexed [d1 - 1][d2 - 1]
+_LOG_PREFIX = tuple(
+    tuple(f"{DICE_FACES[a]} {DICE_FACES[b]}  **{a + b}**" for b in range(1, 7))
+    for a in range(1, 7)
+)
+
 
+def _log_entry(d1: int, d2: int, label: str = "") -> str:
+    prefix = _LOG_PREFIX[d1 - 1][d2 - 1]
+    return f"{prefix}  — {label}" if label else prefix
 
-def _log_entry(d1: int, d2: int, total: int, label: str = "") -> str:
-    suffix = f"  — {label}" if label else ""
-    return f"{DICE_FACES[d1]} {DICE_FACES[d2]}  **{total}**{suffix}"
 
+def _pick(choices: tuple[str, ...], **kwargs: object) -> str:
+    # Smallest covering bit width, redrawing indices past the end, keeps
+    # every line equally likely
+    n = len(choices)
+    bits = (n - 1).bit_length()
+    while True:
+        i = _getrandbits(bits)
+        if i < n:
+            break
+    line = choices[i]
+    return line.format(**kwargs) if "{" in line else line
 
-def _pick(choices: list[str], **kwargs: object) -> str:
-    return random.choice(choices).format(**kwargs)
 
+class _Bet(NamedTuple):
+    uid: int
+    amount: float
+    name: str
+    rid: int  # wallet reservation holding the stake
 
-# Tracks consecutive come-out wins (naturals: 7 or 11) per shooter across games
+
+def _find(bets: list[_Bet], uid: int) -> _Bet | None:
+    """The bettor's current entry in ``bets``, if any."""
+    return next((b for b in bets if b.uid == uid), None)
+
+
+def _place(bets: list[_Bet], bet: _Bet) -> None:
+    """Replace the bettor's existing entry in ``bets``, or append a new one."""
+    for i, b in enumerate(bets):
+        if b.uid == bet.uid:
+            bets[i] = bet
+            return
+    bets.append(bet)
+
+
+# Tracks consecutive come-out wins (naturals: 7 or 11) per shooter across games.
+# Only live streaks are stored, and the oldest is dropped past the cap.
 _comeout_win_streak: dict[int, int] = {}
+_STREAK_CAP = 10_000
 
 
 def _update_comeout_streak(shooter_id: int, won_comeout: bool) -> int:
-    if won_comeout:
-        _comeout_win_streak[shooter_id] = _comeout_win_streak.get(shooter_id, 0) + 1
-    else:
-        _comeout_win_streak[shooter_id] = 0
-    return _comeout_win_streak[shooter_id]
+    if not won_comeout:
+        _comeout_win_streak.pop(shooter_id, None)
+        return 0
+    streak = _comeout_win_streak.pop(shooter_id, 0) + 1
+    _comeout_win_streak[shooter_id] = streak  # re-insert as most recent
+    if len(_comeout_win_streak) > _STREAK_CAP:
+        del _comeout_win_streak[next(iter(_comeout_win_streak))]
+    return streak
 
 
 # ── Modals ────────────────────────────────────────────────────────────
@@ -107,33 +197,38 @@ class _FadeModal(discord.ui.Modal, title="Fade the Shooter"):
         uid = interaction.user.id
         view = self._view
 
-        if uid in view.backs:
-            await interaction.response.send_message(
-                "You're already backing the shooter.", ephemeral=True
-            )
-            return
-
-        # Refund previous fade if updating
-        if uid in view.fades:
-            await wallet_service.deposit(uid, view.fades[uid])
+        # Held across check → charge → record so a double submit, or the
+        # shooter rolling mid-submit, can't charge for a bet that isn't on the table
+        async with view._bet_lock:
+            if view.phase != "betting":
+                await interaction.response.send_message("Betting is closed.", ephemeral=True)
+                return
+            if uid in view._back_uids:
+                await interaction.response.send_message(
+                    "You're already backing the shooter.", ephemeral=True
+                )
+                return
 
-        new_bal = await wallet_service.withdraw(uid, amount)
-        if new_bal is None:
-            bal = await wallet_service.get_balance(uid)
-            await interaction.response.send_message(
-                f"Not enough. Balance: **{fmt_money(bal)}**", ephemeral=True
+            prev = _find(view.fades, uid)
+            rid, bal = await wallet_service.replace_hold(
+                uid, prev and prev.rid, prev.amount if prev else 0, amount
             )
-            return
+            if rid is None:
+                await interaction.response.send_message(
+                    f"Not enough. Balance: **{fmt_money(bal)}**", ephemeral=True
+                )
+                return
 
-        first_fade = uid not in view.fades
-        view.fades[uid] = amount
-        view.fade_names[uid] = interaction.user.display_name
+            first_fade = uid not in view._fade_uids
+            _place(view.fades, _Bet(uid, amount, interaction.user.display_name, rid))
+            view._fade_uids.add(uid)
+            view._bets_version += 1
 
         await interaction.response.send_message(
             f"You're fading **{fmt_money(amount)}**.", ephemeral=True
         )
+        view._request_edit()
         if view.message:
-            await view.message.edit(embed=view._build_embed("betting"), view=view)
             if first_fade and len(view.fades) == 1:
                 try:
                     await view.message.add_reaction("🔴")
@@ -168,32 +263,38 @@ class _BackModal(discord.ui.Modal, title="Back the Shooter"):
         uid = interaction.user.id
         view = self._view
 
-        if uid in view.fades:
-            await interaction.response.send_message(
-                "You're already fading the shooter.", ephemeral=True
-            )
-            return
-
-        if uid in view.backs:
-            await wallet_service.deposit(uid, view.backs[uid])
+        # Held across check → charge → record so a double submit, or the
+        # shooter rolling mid-submit, can't charge for a bet that isn't on the table
+        async with view._bet_lock:
+            if view.phase != "betting":
+                await interaction.response.send_message("Betting is closed.", ephemeral=True)
+                return
+            if uid in view._fade_uids:
+                await interaction.response.send_message(
+                    "You're already fading the shooter.", ephemeral=True
+                )
+                return
 
-        new_bal = await wallet_service.withdraw(uid, amount)
-        if new_bal is None:
-            bal = await wallet_service.get_balance(uid)
-            await interaction.response.send_message(
-                f"Not enough. Balance: **{fmt_money(bal)}**", ephemeral=True
+            prev = _find(view.backs, uid)
+            rid, bal = await wallet_service.replace_hold(
+                uid, prev and prev.rid, prev.amount if prev else 0, amount
             )
-            return
+            if rid is None:
+                await interaction.response.send_message(
+                    f"Not enough. Balance: **{fmt_money(bal)}**", ephemeral=True
+                )
+                return
 
-        first_back = uid not in view.backs
-        view.backs[uid] = amount
-        view.back_names[uid] = interaction.user.display_name
+            first_back = uid not in view._back_uids
+            _place(view.backs, _Bet(uid, amount, interaction.user.display_name, rid))
+            view._back_uids.add(uid)
+            view._bets_version += 1
 
         await interaction.response.send_message(
             f"You're backing the shooter for **{fmt_money(amount)}**.", ephemeral=True
         )
+        view._request_edit()
         if view.message:
-            await view.message.edit(embed=view._build_embed("betting"), view=view)
             if first_back and len(view.backs) == 1:
                 try:
                     await view.message.add_reaction("🟢")
@@ -204,115 +305,132 @@ class _BackModal(discord.ui.Modal, title="Back the Shooter"):
 # ── View ─────────────────────────────────────────────────────────────
 
 class _StreetCrapsView(discord.ui.View):
-    def __init__(self, shooter: discord.User | discord.Member, wager: float) -> None:
+    def __init__(
+        self, shooter: discord.User | discord.Member, wager: float, reservation_id: int
+    ) -> None:
         super().__init__(timeout=300)
         self.shooter = shooter
         self.wager = wager
-        self.fades: dict[int, float] = {}
-        self.backs: dict[int, float] = {}
-        self.fade_names: dict[int, str] = {}
-        self.back_names: dict[int, str] = {}
+        # Stakes sit in wallet reservations until the roll settles them, so a
+        # restart mid-game refunds everyone at startup instead of losing them
+        self.shooter_rid = reservation_id
+        self.fades: list[_Bet] = []
+        self.backs: list[_Bet] = []
+        self._fade_uids: set[int] = set()  # membership checks for the lists above
+        self._back_uids: set[int] = set()
         self.roll_log: list[str] = []
+        self._rolls_text = ""  # "\n".join(roll_log), grown one roll at a time
         self.point: int | None = None
         self.phase = "betting"
         self.message: discord.Message | None = None
         self.final_balances: dict[int, int] = {}
+        # Last rendered embed dict and the key it depends on; bump
+        # _bets_version whenever fades/backs change
+        self._bets_version = 0
+        self._embed_cache: tuple[tuple, dict] | None = None
+        self._bet_lock = asyncio.Lock()  # guards fades/backs and closing the betting phase
+        self._edit_task: asyncio.Task | None = None
+
+    # ── message edits ─────────────────────────────────────────────────
+
+    def _request_edit(self) -> None:
+        """Schedule a betting-board redraw, folding in any others requested meanwhile."""
+        if self._edit_task is None or self._edit_task.done():
+            self._edit_task = asyncio.create_task(self._debounced_edit())
+
+    async def _debounced_edit(self) -> None:
+        await asyncio.sleep(EDIT_DEBOUNCE)
+        if self.phase != "betting" or not self.message:
+            return  # the roll's own edit already shows the final board
+        try:
+            await self.message.edit(embed=self._build_embed("betting"), view=self)
+        except discord.HTTPException:
+            pass
+        except Exception:
+            log.exception("Failed to redraw craps betting board")
 
     # ── embed builder ─────────────────────────────────────────────────
 
     def _build_embed(self, state: str) -> discord.Embed:
-        colors = {
-            "betting":   discord.Color.yellow(),
-            "point":     discord.Color.blurple(),
-            "ongoing":   discord.Color.blurple(),
-            "natural":   discord.Color.green(),
-            "craps":     discord.Color.red(),
-            "point_hit": discord.Color.green(),
-            "seven_out": discord.Color.dark_red(),
-        }
-        titles = {
-            "betting":   "Looking for action...",
-            "point":     f"Point: {self.point}",
-            "ongoing":   f"Point: {self.point}",
-            "natural":   "Natural!",
-            "craps":     "Craps!",
-            "point_hit": "Point Made!",
-            "seven_out": "Seven Out!",
+        key = (state, self._bets_version, len(self.roll_log), self.point)
+        if self._embed_cache is not None and self._embed_cache[0] == key:
+            data = self._embed_cache[1]
+        else:
+            # Built once per key, so re-edits keep the same footer flavor line
+            data = self._embed_data(state)
+            self._embed_cache = (key, data)
+        return discord.Embed.from_dict(data)
+
+    def _log_roll(self, entry: str) -> None:
+        self.roll_log.append(entry)
+        self._rolls_text = f"{self._rolls_text}\n{entry}" if self._rolls_text else entry
+
+    def _embed_data(self, state: str) -> dict:
+        color, title, flavor = _STATE[state]
+        data: dict = {
+            "title": f"🎲 Street Craps — {title or f'Point: {self.point}'}",
+            "color": color.value,
+            "author": {
+                "name": self.shooter.display_name,
+                "icon_url": str(self.shooter.display_avatar.url),
+            },
         }
-        embed = discord.Embed(
-            title=f"🎲 Street Craps — {titles[state]}",
-            color=colors[state],
-        )
-        embed.set_author(
-            name=self.shooter.display_name,
-            icon_url=self.shooter.display_avatar.url,
-        )
+        # (name, value, inline) — handed to the embed in one go below
+        fields: list[tuple[str, str, bool]] = []
 
         if state == "betting":
             fading_str = (
-                "\n".join(
-                    f"{self.fade_names[uid]}  {fmt_money(self.fades[uid])}"
-                    for uid in self.fades
-                ) or "open"
+                "\n".join(f"{b.name}  {fmt_money(b.amount)}" for b in self.fades) or "open"
             )
             backing_str = (
-                "\n".join(
-                    f"{self.back_names[uid]}  {fmt_money(self.backs[uid])}"
-                    for uid in self.backs
-                ) or "open"
+                "\n".join(f"{b.name}  {fmt_money(b.amount)}" for b in self.backs) or "open"
             )
-            embed.description = (
+            data["description"] = (
                 f"**{self.shooter.display_name}** is shooting for **{fmt_money(self.wager)}**"
             )
-            embed.add_field(name="Fading", value=fading_str, inline=True)
-            embed.add_field(name="Backing", value=backing_str, inline=True)
-            embed.set_footer(text="Fade to bet against the shooter. Back to bet with them.")
+            fields.append(("Fading", fading_str, True))
+            fields.append(("Backing", backing_str, True))
+            data["footer"] = {"text": "Fade to bet against the shooter. Back to bet with them."}
 
         else:
             # Show roll log
-            if self.roll_log:
-                embed.add_field(name="Rolls", value="\n".join(self.roll_log), inline=False)
+            if self._rolls_text:
+                fields.append(("Rolls", self._rolls_text, False))
 
             # Wager summary
-            total_fade = sum(self.fades.values())
-            total_back = sum(self.backs.values())
-            embed.add_field(name="Shooter", value=fmt_money(self.wager), inline=True)
+            total_fade = sum(b.amount for b in self.fades)
+            total_back = sum(b.amount for b in self.backs)
+            fields.append(("Shooter", fmt_money(self.wager), True))
             if total_fade:
-                embed.add_field(name="Fading", value=fmt_money(total_fade), inline=True)
+                fields.append(("Fading", fmt_money(total_fade), True))
             if total_back:
-                embed.add_field(name="Backing", value=fmt_money(total_back), inline=True)
+                fields.append(("Backing", fmt_money(total_back), True))
 
             # Payout summary on resolution
             if state in ("natural", "craps", "point_hit", "seven_out"):
                 shooter_won = state in ("natural", "point_hit")
                 lines = []
-                sign = "+" if shooter_won else "-"
-                bal_str = f"  →  {fmt_money(self.final_balances[self.shooter.id])}" if self.shooter.id in self.final_balances else ""
-                lines.append(f"{self.shooter.display_name}  {sign}{fmt_money(self.wager)}{bal_str}")
-                for uid in self.fades:
-                    sign = "+" if not shooter_won else "-"
-                    bal_str = f"  →  {fmt_money(self.final_balances[uid])}" if uid in self.final_balances else ""
-                    lines.append(f"{self.fade_names[uid]}  {sign}{fmt_money(self.fades[uid])}{bal_str}")
-                for uid in self.backs:
-                    sign = "+" if shooter_won else "-"
-                    bal_str = f"  →  {fmt_money(self.final_balances[uid])}" if uid in self.final_balances else ""
-                    lines.append(f"{self.back_names[uid]}  {sign}{fmt_money(self.backs[uid])}{bal_str}")
-                embed.add_field(name="Payouts", value="\n".join(lines), inline=False)
+                append = lines.append
+                balances = self.final_balances
+                win_sign, lose_sign = ("+", "-") if shooter_won else ("-", "+")
+                bal_str = f"  →  {fmt_money(balances[self.shooter.id])}" if self.shooter.id in balances else ""
+                append(f"{self.shooter.display_name}  {win_sign}{fmt_money(self.wager)}{bal_str}")
+                for b in self.fades:
+                    bal_str = f"  →  {fmt_money(balances[b.uid])}" if b.uid in balances else ""
+                    append(f"{b.name}  {lose_sign}{fmt_money(b.amount)}{bal_str}")
+                for b in self.backs:
+                    bal_str = f"  →  {fmt_money(balances[b.uid])}" if b.uid in balances else ""
+                    append(f"{b.name}  {win_sign}{fmt_money(b.amount)}{bal_str}")
+                fields.append(("Payouts", "\n".join(lines), False))
 
             # Footer flavor
-            n = self.point
-            footer = {
-                "point":     _pick(_POINT_FLAVOR, n=n),
-                "ongoing":   _pick(_ONGOING_FLAVOR),
-                "natural":   _pick(_NATURAL_FLAVOR),
-                "craps":     _pick(_CRAPS_FLAVOR),
-                "point_hit": _pick(_POINT_HIT_FLAVOR, n=n),
-                "seven_out": _pick(_SEVEN_OUT_FLAVOR),
-            }.get(state, "")
-            if footer:
-                embed.set_footer(text=footer)
-
-        return embed
+            if flavor:
+                data["footer"] = {"text": _pick(flavor, n=self.point)}
+
+        data["fields"] = [
+            {"name": name, "value": value, "inline": inline} for name, value, inline in fields
+        ]
+        return data
 
     # ── buttons ───────────────────────────────────────────────────────
 
@@ -348,7 +466,17 @@ class _StreetCrapsView(discord.ui.View):
             await interaction.response.send_message("Not your dice.", ephemeral=True)
             return
         if self.phase == "betting":
-            await self._do_comeout(interaction)
+            # Close betting under the lock so an in-flight fade/back lands
+            # first; a second queued click finds it already closed
+            async with self._bet_lock:
+                opening = self.phase == "betting"
+                self.phase = "rolling"
+            if self._edit_task is not None:
+                self._edit_task.cancel()
+            if opening:
+                await self._do_comeout(interaction)
+            else:
+                await interaction.response.defer()
         elif self.phase == "rolling":
             await self._do_point_roll(interaction)
 
@@ -360,23 +488,25 @@ class _StreetCrapsView(discord.ui.View):
             await interaction.response.send_message("Not your dice.", ephemeral=True)
             return
 
-        new_bal = await wallet_service.withdraw(self.shooter.id, self.wager)
-        if new_bal is None:
-            bal = await wallet_service.get_balance(self.shooter.id)
+        reservation_id, bal = await wallet_service.try_reserve(self.shooter.id, self.wager)
+        if reservation_id is None:
             await interaction.response.send_message(
                 f"Not enough to reshoot. Balance: **{fmt_money(bal)}** (need **{fmt_money(self.wager)}**)",
                 ephemeral=True,
             )
             return
 
-        self.fades = {}
-        self.backs = {}
-        self.fade_names = {}
-        self.back_names = {}
+        self.shooter_rid = reservation_id
+        self.fades = []
+        self.backs = []
+        self._fade_uids = set()
+        self._back_uids = set()
         self.roll_log = []
+        self._rolls_text = ""
         self.point = None
         self.phase = "betting"
         self.final_balances = {}
+        self._embed_cache = None
 
         self.fade_btn.disabled = False
         self.back_btn.disabled = False
@@ -389,46 +519,42 @@ class _StreetCrapsView(discord.ui.View):
     # ── game logic ────────────────────────────────────────────────────
 
     async def _do_comeout(self, interaction: discord.Interaction) -> None:
-        self.phase = "rolling"
         self.fade_btn.disabled = True
         self.back_btn.disabled = True
         self.roll_btn.label = "🎲 Roll Again"
 
         d1, d2 = _roll()
-        total = d1 + d2
-
-        if total in (7, 11):
-            self.roll_log.append(_log_entry(d1, d2, total, "natural"))
-            streak = _update_comeout_streak(self.shooter.id, True)
-            await self._resolve(interaction, shooter_won=True, state="natural", comeout_streak=streak)
-        elif total in (2, 3, 12):
-            self.roll_log.append(_log_entry(d1, d2, total, "craps"))
-            _update_comeout_streak(self.shooter.id, False)
-            await self._resolve(interaction, shooter_won=False, state="craps")
-        else:
-            self.point = total
-            self.roll_log.append(_log_entry(d1, d2, total, "point"))
+        state = _COMEOUT_STATE[d1 + d2]
+        self._log_roll(_log_entry(d1, d2, state))
+
+        if state == "point":
+            self.point = d1 + d2
             await interaction.response.edit_message(
                 embed=self._build_embed("point"), view=self
             )
+            return
+
+        shooter_won = state == "natural"
+        streak = _update_comeout_streak(self.shooter.id, shooter_won)
+        await self._resolve(
+            interaction, shooter_won=shooter_won, state=state, comeout_streak=streak
+        )
 
     async def _do_point_roll(self, interaction: discord.Interaction) -> None:
         d1, d2 = _roll()
-        total = d1 + d2
-
-        if total == self.point:
-            self.roll_log.append(_log_entry(d1, d2, total, "hit!"))
-            _update_comeout_streak(self.shooter.id, False)
-            await self._resolve(interaction, shooter_won=True, state="point_hit")
-        elif total == 7:
-            self.roll_log.append(_log_entry(d1, d2, total, "seven out"))
-            _update_comeout_streak(self.shooter.id, False)
-            await self._resolve(interaction, shooter_won=False, state="seven_out")
-        else:
-            self.roll_log.append(_log_entry(d1, d2, total))
+        state, label = _POINT_ROLL_STATE[self.point][d1 + d2]
+        self._log_roll(_log_entry(d1, d2, label))
+
+        if state == "ongoing":
             await interaction.response.edit_message(
                 embed=self._build_embed("ongoing"), view=self
             )
+            return
+
+        _update_comeout_streak(self.shooter.id, False)
+        await self._resolve(
+            interaction, shooter_won=state == "point_hit", state=state
+        )
 
     async def _resolve(
         self,
@@ -438,38 +564,43 @@ class _StreetCrapsView(discord.ui.View):
         state: str,
         comeout_streak: int = 0,
     ) -> None:
+        # Close the whole table's holds in one transaction; losers settle at 0
+        # so every participant's final balance comes back from the same write
+        payouts = [(self.shooter.id, self.shooter_rid, self.wager * 2 if shooter_won else 0.0)]
+        payouts += [(b.uid, b.rid, 0.0 if shooter_won else b.amount * 2) for b in self.fades]
+        payouts += [(b.uid, b.rid, b.amount * 2 if shooter_won else 0.0) for b in self.backs]
+        winners = [(uid, payout) for uid, _, payout in payouts if payout]
+        board_before = await leaderboard_notifier.snapshot() if winners else []
+        self.final_balances.update(
+            await wallet_service.settle_many([(rid, payout) for _, rid, payout in payouts])
+        )
+        # Only now is the game "done": if anything above fails, on_timeout
+        # still sees it in progress and releases the holds
         self.phase = "done"
         self.fade_btn.disabled = True
         self.back_btn.disabled = True
         self.roll_btn.disabled = True
         self.reshoot_btn.disabled = False
+        for uid, payout in winners:
+            await leaderboard_notifier.notify_if_passed(uid, payout, board_before, "craps")
 
-        if shooter_won:
-            await leaderboard_notifier.deposit_and_notify(self.shooter.id, self.wager * 2, "craps")
-        for uid, amt in self.fades.items():
-            if not shooter_won:
-                await leaderboard_notifier.deposit_and_notify(uid, amt * 2, "craps")
-        for uid, amt in self.backs.items():
-            if shooter_won:
-                await leaderboard_notifier.deposit_and_notify(uid, amt * 2, "craps")
-
-        all_uids = {self.shooter.id} | self.fades.keys() | self.backs.keys()
-        for uid in all_uids:
-            self.final_balances[uid] = await wallet_service.get_balance(uid)
-
-        try:
-            await wallet_service.record_game(
+        # Stats are best-effort; a failure here shouldn't block the result
+        fader_won = not shooter_won
+        await asyncio.gather(
+            wallet_service.record_game(
                 self.shooter.id, "craps", self.wager,
                 self.wager * 2 if shooter_won else 0.0, won=shooter_won,
-            )
-            for uid, amt in self.fades.items():
-                fader_won = not shooter_won
-                await wallet_service.record_game(uid, "craps", amt, amt * 2 if fader_won else 0.0, won=fader_won)
-            for uid, amt in self.backs.items():
-                backer_won = shooter_won
-                await wallet_service.record_game(uid, "craps", amt, amt * 2 if backer_won else 0.0, won=backer_won)
-        except Exception:
-            pass
+            ),
+            *(
+                wallet_service.record_game(b.uid, "craps", b.amount, b.amount * 2 if fader_won else 0.0, won=fader_won)
+                for b in self.fades
+            ),
+            *(
+                wallet_service.record_game(b.uid, "craps", b.amount, b.amount * 2 if shooter_won else 0.0, won=shooter_won)
+                for b in self.backs
+            ),
+            return_exceptions=True,
+        )
 
         await interaction.response.edit_message(
             embed=self._build_embed(state), view=self
@@ -505,12 +636,11 @@ class _StreetCrapsView(discord.ui.View):
             log.exception("Failed to check/update craps roll record")
 
     async def on_timeout(self) -> None:
-        if self.phase != "done":
-            await wallet_service.deposit(self.shooter.id, self.wager)
-            for uid, amt in self.fades.items():
-                await wallet_service.deposit(uid, amt)
-            for uid, amt in self.backs.items():
-                await wallet_service.deposit(uid, amt)
+        # Refund whatever is still held. Settled holds are already closed and
+        # skipped, so this also covers a _resolve that failed part-way.
+        await wallet_service.release_many([
+            self.shooter_rid, *(b.rid for b in self.fades), *(b.rid for b in self.backs),
+        ])
         for item in self.children:
             item.disabled = True  # type: ignore[union-attr]
         if self.message:
@@ -543,19 +673,20 @@ class Craps(commands.Cog):
         except discord.NotFound:
             return  # Interaction expired before we could respond
 
-        new_bal = await wallet_service.withdraw(interaction.user.id, amount)
-        if new_bal is None:
-            bal = await wallet_service.get_balance(interaction.user.id)
+        reservation_id, bal = await wallet_service.try_reserve(interaction.user.id, amount)
+        if reservation_id is None:
             await interaction.followup.send(
                 f"Not enough. Balance: **{fmt_money(bal)}**", ephemeral=True
             )
             return
 
-        view = _StreetCrapsView(shooter=interaction.user, wager=amount)
+        view = _StreetCrapsView(shooter=interaction.user, wager=amount, reservation_id=reservation_id)
         msg = await interaction.followup.send(embed=view._build_embed("betting"), view=view)
+        # Edits go through a channel message, not the followup webhook, whose
+        # token expires after 15 minutes; building it is local, no request.
         view.message = interaction.channel.get_partial_message(msg.id)
         try:
-            await view.message.add_reaction("🎲")
+            await msg.add_reaction("🎲")
         except discord.HTTPException:
             pass
 
@@ -1,7 +1,12 @@
 import asyncio
+import functools
 import logging
 import re
+from collections import defaultdict
+from collections.abc import Callable
 from datetime import datetime, time, timedelta, timezone
+from operator import itemgetter
+from time import monotonic
 
 import discord
 from discord import app_commands
@@ -10,14 +15,15 @@ from discord.ext import commands, tasks
 from bot.config import BET_RESULTS_CHANNEL_ID
 from bot.services import betting_service, leaderboard_notifier, wallet_service
 from bot.services.kalshi_api import (
-    kalshi_api, SPORTS, FUTURES,
-    _parse_event_ticker_date
+    kalshi_api, SPORTS, FUTURES, SERIES_LABELS,
+    _parse_event_ticker_date, market_yes_price,
 )
 from bot.services import kalshi_taxonomy as tax
 from bot.constants import PICK_EMOJI, PICK_LABELS
 from bot.utils import (
     format_matchup, format_game_time, format_game_time_with_label, format_pick_label,
-    format_american, format_american_with_prob, decimal_to_american
+    format_american, format_american_with_prob, decimal_to_american, parse_iso_utc,
+    parse_wager, truncate,
 )
 from bot.db.database import cleanup_cache, vacuum_db
 
@@ -61,136 +67,171 @@ async def _expire_menu(view: discord.ui.View) -> None:
         pass
 
 
+class _MenuView(discord.ui.View):
+    """Base for this cog's views: expires in place via _expire_menu on timeout."""
+
+    async def on_timeout(self) -> None:
+        await _expire_menu(self)
+
+
+# (emoji, ticker substrings) in precedence order: the first rule with any of
+# its substrings in the upper-cased ticker wins. Two checks aren't plain
+# substrings and are handled in _sport_emoji: an exact "KXSB" (Super Bowl)
+# ranks with football, and a "WC"-prefixed ticker with the World Cup rule.
+_SPORT_EMOJI_RULES: tuple[tuple[str, tuple[str, ...]], ...] = (
+    # ⚾ — must be before NCAAB (basketball) check
+    ("\u26be", ("MLB", "WBC", "NCAABB", "COLLEGEBASEBALL", "NPB", "KBO",
+                "TEAMSINWS", "WORLDSERIES")),
+    ("\U0001f30d", ("WCGROUP",)),  # 🌍 — World Cup
+    ("\U0001f32a\ufe0f", ("MARMAD",)),  # 🌪️ — March Madness
+    # 🎓 — College Basketball
+    ("\U0001f393", ("NCAAMB", "NCAAWB", "NCAAB", "BIGEAST", "ACCREG", "SECREG",
+                    "BIG10REG", "BIG12REG", "PAC12REG", "BIGTENREG", "BIGTWELVEREG",
+                    "AACMBKT", "SUNBELTREG", "MWCREG",
+                    "MWREG")),  # Mountain West Regular Season
+    # 🏀
+    ("\U0001f3c0", ("NBA", "WNBA", "NBL", "EUROLEAGUE", "EUROCUP", "ACB", "BSL", "KBL",
+                    "BBL", "FIBA", "ABA", "GBL", "VTB", "CBA", "UNRIVALED", "ARGLNB",
+                    "JBLEAGUE", "BBSERIEA", "LNBELITE", "BASKETBALL")),
+    # 🏈
+    ("\U0001f3c8", ("NFL", "NCAAF", "STARTINGQB", "QB", "HEISMAN", "UFL", "USFL", "XFL",
+                    "GREYCUP", "CFL", "RANKLISTFF", "FANTASYFOOTBALL", "SBMVP",
+                    "AFCSB", "NFCSB")),
+    # 🏒
+    ("\U0001f3d2", ("NHL", "AHL", "KHL", "IIHF", "SHL", "DEL", "LIIGA", "ELH",
+                    "NCAAHOCKEY", "SWISSLEAGUE", "SWISSNL", "HOCKEYALLSVENSKAN", "NLA",
+                    "NLB", "KXNL", "CONNSMYTHE", "TEAMSINSC", "STANLEYCUP")),
+    # 🥊
+    ("\U0001f94a", ("UFC", "BOXING", "MMA", "FIGHT", "MCGREGOR", "BOUT", "DWCS")),
+    ("\U0001f94d", ("LAX", "LACROSSE")),  # 🥍
+    ("\U0001f3cf", ("CRICKET", "IPL", "WPL", "COUNTY", "SSHIELD")),  # 🏏
+    # 🎾
+    ("\U0001f3be", ("TENNIS", "ATP", "WTA", "DAVISCUP", "UNITEDCUP", "SIXKINGS",
+                    "CHALLENGER", "GRANDSLAM", "ITF", "FOMEN", "FOWOMEN", "USOMEN",
+                    "USOWOMEN", "AOMEN", "AOWOMEN")),
+    ("\U0001f94c", ("CURL",)),  # 🥌
+    ("\u265f\ufe0f", ("CHESS",)),  # ♟️
+    ("\U0001f3d3", ("PICKLE",)),  # 🏓
+    # 🏉
+    ("\U0001f3c9", ("RUGBY", "SIXNATIONS", "NRL", "AFL", "SLR", "PREMRUGBY", "FRA14",
+                    "PREMCHAMP")),
+    ("\U0001f3af", ("DARTS",)),  # 🎯
+    ("\U0001f6b4", ("CYCLING", "TOURDEFRANCE", "GIRO", "VUELTA")),  # 🚴 — Cycling
+    ("\U0001f3f8", ("SQUASH",)),  # 🏸 — Squash (racquet)
+    ("\U0001f5f3\ufe0f", ("HOUSERACE", "SENATERACE", "PRESRACE")),  # 🗳️ — Politics
+    ("\U0001f3ce\ufe0f", ("F1", "FORMULA")),  # 🏎️ — Formula 1
+    ("\U0001f3c1", ("NASCAR",)),  # 🏁 — NASCAR
+    # 🚗 — Racing (other)
+    ("\U0001f697", ("INDYCAR", "RACE", "MOTOGP", "MOTO2", "MOTO3", "SUPERBIKE")),
+    ("\u26f3", ("GOLF", "TGL", "PGA", "RYDER", "LIV", "DPWORLDTOUR")),  # ⛳
+    ("\U0001f3cf", ("T20", "ODI")),  # 🏏 — after golf, as LIV beats ODI
+    ("\U0001f52b", ("CS2", "CSGO")),  # 🔫 — CS2
+    ("\U0001f9d9", ("LOL",)),  # 🧙 — League of Legends
+    # 🎮 — Esports
+    ("\U0001f3ae", ("VALORANT", "DOTA", "OW", "OVERWATCH", "R6", "COD", "ESPORT",
+                    "BRAWLSTARS", "APEXLEGENDS", "ROCKETLEAGUE")),
+    ("\U0001f3ac", ("BEAST", "FANATICS", "EUROVISION")),  # 🎬
+    # 🌍 — must come before soccer (CUP match); also any "WC"-prefixed ticker
+    ("\U0001f30d", ("WORLDCUP",)),
+    # ⚽ — explicit leagues + generic "LEAGUE"/"CUP" after all non-soccer sports caught
+    ("\u26bd", (
+        "EPL", "PREMIER", "LALIGA", "BUNDESLIGA", "SERIEA", "SERIEB", "LIGUE",
+        "MLS", "NWSL", "UCL", "UEL", "UECL", "UEFA", "CONCACAF",
+        "EREDIVISIE", "EREDIV", "CHAMPIONSHIP", "ALEAGUE", "JLEAGUE", "KLEAGUE",
+        "AFC",    # AFC Champions League (AFC ≠ NFL conference at this point)
+        "ACL",    # Asian Champions League (alternate ticker)
+        "COUPE",  # Coupe de France, Coupe de la Ligue, etc.
+        "COPPA",  # Coppa Italia
+        "PRIMERA", "DIVISION",  # Argentina Primera, various divisions
+        "SOCCER",
+        "LEAGUE",  # catches most leagues not listed above
+        "CUP",     # FA Cup, KNVB Cup, etc. — all specific cup sports caught above
+        "COPA", "COPALIB", "SUPERLIGA", "SUPERLEAGUE", "SUPERLIG",
+        "DIMAYOR",  # Liga DIMAYOR (Colombian soccer)
+        "LIGA",     # LALIGA already above, also catches DIMAYOR, BBVA, etc.
+        "HNL",      # Croatia HNL
+        "SCOTTISH", "SCOTPREM",  # Scottish Premiership / Cup
+        "GREECE", "GREEK", "GRC",  # Super League Greece
+        "ARGENT", "ARGPREMDIV",  # Argentina Primera Division
+        "BRASILEIRO",  # Brasileirao (Brazilian soccer)
+        "CHNSL", "CHNSUPER",  # Chinese Super League
+        "THAIL",  # Thai League (THAIL1, THAIL2, etc.)
+        "BELGIAN",  # Belgian Pro League
+        "EGYPL", "EGYSUPERL",  # Egyptian Premier League
+        "URYPD",  # Uruguayan Primera División
+        "PFAPOY",  # PFA Player of the Year (soccer award)
+        "VENFUT",  # Venezuelan football (VENFUTVE, etc.)
+        "APFDDH",  # Paraguayan APF league
+        "USL",  # USL Championship (US soccer)
+        "BALLONDOR",  # Ballon d'Or (soccer award)
+        "JOINCLUB",  # soccer transfers
+        "NEXTMANAGER", "ACQUIREREALMADRID", "LOSEREALMADRID",
+        "ALLSVENSKAN",  # Swedish soccer
+        "KNVB",  # Dutch cup
+        "BOLPDIV",  # Bolivian Primera División
+        "EKSTRAKLASA",  # Polish league
+        "CHLLDP", "ECULP",  # Chilean / Ecuadorian leagues
+        "CONMEBOL",  # Copa Libertadores / Sudamericana
+        "ISLGAME",  # Indian Super League
+        "CANPL",  # Canadian Premier League
+        "CZEFL",  # Czech league
+        "JOINRONALDO", "JOINMESSI", "JOINMBAPPE",  # transfers
+    )),
+)
+_FOOTBALL_RULE = next(i for i, (_, t) in enumerate(_SPORT_EMOJI_RULES) if "NFL" in t)
+_WORLD_CUP_RULE = next(i for i, (_, t) in enumerate(_SPORT_EMOJI_RULES) if "WORLDCUP" in t)
+_OTHER_SPORT_EMOJI = "\U0001f3c6"  # 🏆 — Other / truly unrecognized
+
+
+def _build_token_trie(rules: tuple[tuple[str, tuple[str, ...]], ...]) -> dict:
+    """Build a character trie over every rule substring.
+
+    A node's ``""`` key holds the index of the first rule listing the
+    substring that ends there.
+    """
+    root: dict = {}
+    for rank, (_, tokens) in enumerate(rules):
+        for token in tokens:
+            node = root
+            for ch in token:
+                node = node.setdefault(ch, {})
+            node.setdefault("", rank)
+    return root
+
+
+_SPORT_TOKEN_TRIE = _build_token_trie(_SPORT_EMOJI_RULES)
+
+
+@functools.lru_cache(maxsize=2048)
 def _sport_emoji(sport_key: str) -> str:
-    """Return an appropriate emoji for a sport based on its ticker."""
+    """Return an appropriate emoji for a sport based on its ticker.
+
+    Case-insensitive, so callers can pass a ticker as they have it.
+    """
     sk = sport_key.upper()
-    if ("MLB" in sk or "WBC" in sk or "NCAABB" in sk or "COLLEGEBASEBALL" in sk
-            or "NPB" in sk or "KBO" in sk or "TEAMSINWS" in sk or "WORLDSERIES" in sk):
-        return "\u26be"  # ⚾ — must be before NCAAB (basketball) check
-    if "WCGROUP" in sk:
-        return "\U0001f30d"  # 🌍 — World Cup
-    if "MARMAD" in sk:
-        return "\U0001f32a\ufe0f"  # 🌪️ — March Madness
-    if (
-        "NCAAMB" in sk or "NCAAWB" in sk or "NCAAB" in sk
-        or "BIGEAST" in sk or "ACCREG" in sk or "SECREG" in sk
-        or "BIG10REG" in sk or "BIG12REG" in sk or "PAC12REG" in sk
-        or "BIGTENREG" in sk or "BIGTWELVEREG" in sk
-        or "AACMBKT" in sk or "SUNBELTREG" in sk or "MWCREG" in sk
-        or "MWREG" in sk  # Mountain West Regular Season
-    ):
-        return "\U0001f393"  # 🎓 — College Basketball
-    if "NBA" in sk or "WNBA" in sk or "NBL" in sk or "EUROLEAGUE" in sk or "EUROCUP" in sk or "ACB" in sk or "BSL" in sk or "KBL" in sk or "BBL" in sk or "FIBA" in sk or "ABA" in sk or "GBL" in sk or "VTB" in sk or "CBA" in sk or "UNRIVALED" in sk or "ARGLNB" in sk or "JBLEAGUE" in sk or "BBSERIEA" in sk or "LNBELITE" in sk or "BASKETBALL" in sk:
-        return "\U0001f3c0"  # 🏀
-    if ("NFL" in sk or "NCAAF" in sk or "STARTINGQB" in sk or "QB" in sk
-            or "HEISMAN" in sk or "UFL" in sk or "USFL" in sk or "XFL" in sk
-            or "GREYCUP" in sk or "CFL" in sk or "RANKLISTFF" in sk
-            or "FANTASYFOOTBALL" in sk or sk == "KXSB" or "SBMVP" in sk
-            or "AFCSB" in sk or "NFCSB" in sk):
-        return "\U0001f3c8"  # 🏈
-    if "NHL" in sk or "AHL" in sk or "KHL" in sk or "IIHF" in sk or "SHL" in sk or "DEL" in sk or "LIIGA" in sk or "ELH" in sk or "NCAAHOCKEY" in sk or "SWISSLEAGUE" in sk or "SWISSNL" in sk or "HOCKEYALLSVENSKAN" in sk or "NLA" in sk or "NLB" in sk or "KXNL" in sk or "CONNSMYTHE" in sk or "TEAMSINSC" in sk or "STANLEYCUP" in sk:
-        return "\U0001f3d2"  # 🏒
-    if "UFC" in sk or "BOXING" in sk or "MMA" in sk or "FIGHT" in sk or "MCGREGOR" in sk or "BOUT" in sk or "DWCS" in sk:
-        return "\U0001f94a"  # 🥊
-    if "LAX" in sk or "LACROSSE" in sk:
-        return "\U0001f94d"  # 🥍
-    if "CRICKET" in sk or "IPL" in sk or "WPL" in sk or "COUNTY" in sk or "SSHIELD" in sk:
-        return "\U0001f3cf"  # 🏏
-    if "TENNIS" in sk or "ATP" in sk or "WTA" in sk or "DAVISCUP" in sk or "UNITEDCUP" in sk or "SIXKINGS" in sk or "CHALLENGER" in sk or "GRANDSLAM" in sk or "ITF" in sk or "FOMEN" in sk or "FOWOMEN" in sk or "USOMEN" in sk or "USOWOMEN" in sk or "AOMEN" in sk or "AOWOMEN" in sk:
-        return "\U0001f3be"  # 🎾
-    if "CURL" in sk:
-        return "\U0001f94c"  # 🥌
-    if "CHESS" in sk:
-        return "\u265f\ufe0f"  # ♟️
-    if "PICKLE" in sk:
-        return "\U0001f3d3"  # 🏓
-    if "RUGBY" in sk or "SIXNATIONS" in sk or "NRL" in sk or "AFL" in sk or "SLR" in sk or "PREMRUGBY" in sk or "FRA14" in sk or "PREMCHAMP" in sk:
-        return "\U0001f3c9"  # 🏉
-    if "DARTS" in sk:
-        return "\U0001f3af"  # 🎯
-    if "CYCLING" in sk or "TOURDEFRANCE" in sk or "GIRO" in sk or "VUELTA" in sk:
-        return "\U0001f6b4"  # 🚴 — Cycling
-    if "SQUASH" in sk:
-        return "\U0001f3f8"  # 🏸 — Squash (racquet)
-    if "HOUSERACE" in sk or "SENATERACE" in sk or "PRESRACE" in sk:
-        return "\U0001f5f3\ufe0f"  # 🗳️ — Politics
-    if "F1" in sk or "FORMULA" in sk:
-        return "\U0001f3ce\ufe0f"  # 🏎️ — Formula 1
-    if "NASCAR" in sk:
-        return "\U0001f3c1"  # 🏁 — NASCAR
-    if "INDYCAR" in sk or "RACE" in sk or "MOTOGP" in sk or "MOTO2" in sk or "MOTO3" in sk or "SUPERBIKE" in sk:
-        return "\U0001f697"  # 🚗 — Racing (other)
-    if "GOLF" in sk or "TGL" in sk or "PGA" in sk or "RYDER" in sk or "LIV" in sk or "DPWORLDTOUR" in sk:
-        return "\u26f3"  # ⛳
-    if "CRICKET" in sk or "IPL" in sk or "WPL" in sk or "T20" in sk or "ODI" in sk or "SSHIELD" in sk:
-        return "\U0001f3cf"  # 🏏
-    if "CS2" in sk or "CSGO" in sk:
-        return "\U0001f52b"  # 🔫 — CS2
-    if "LOL" in sk:
-        return "\U0001f9d9"  # 🧙 — League of Legends
-    if "VALORANT" in sk or "DOTA" in sk or "OW" in sk or "OVERWATCH" in sk or "R6" in sk or "COD" in sk or "ESPORT" in sk or "BRAWLSTARS" in sk or "APEXLEGENDS" in sk or "ROCKETLEAGUE" in sk:
-        return "\U0001f3ae"  # 🎮 — Esports
-    if "BEAST" in sk or "FANATICS" in sk or "EUROVISION" in sk:
-        return "\U0001f3ac"  # 🎬
-    # World Cup — strip KX prefix then check; must come before soccer block (CUP match)
-    sk_base = sk[2:] if sk.startswith("KX") else sk
-    if sk_base.startswith("WC") or "WORLDCUP" in sk:
-        return "\U0001f30d"  # 🌍
-    # Soccer — explicit leagues + generic "LEAGUE"/"CUP" after all non-soccer sports caught
-    if (
-        "EPL" in sk or "PREMIER" in sk
-        or "LALIGA" in sk or "BUNDESLIGA" in sk
-        or "SERIEA" in sk or "SERIEB" in sk
-        or "LIGUE" in sk
-        or "MLS" in sk or "NWSL" in sk
-        or "UCL" in sk or "UEL" in sk or "UECL" in sk
-        or "UEFA" in sk or "CONCACAF" in sk
-        or "EUROCUP" in sk
-        or "EREDIVISIE" in sk or "EREDIV" in sk
-        or "CHAMPIONSHIP" in sk
-        or "ALEAGUE" in sk or "JLEAGUE" in sk or "KLEAGUE" in sk
-        or "AFC" in sk   # AFC Champions League (AFC ≠ NFL conference at this point)
-        or "ACL" in sk   # Asian Champions League (alternate ticker)
-        or "COUPE" in sk # Coupe de France, Coupe de la Ligue, etc.
-        or "COPPA" in sk # Coppa Italia
-        or "PRIMERA" in sk or "DIVISION" in sk  # Argentina Primera, various divisions
-        or "SOCCER" in sk
-        or "LEAGUE" in sk  # catches most leagues not listed above
-        or "CUP" in sk     # FA Cup, KNVB Cup, etc. — all specific cup sports caught above
-        or "COPA" in sk or "COPALIB" in sk
-        or "SUPERLIGA" in sk or "SUPERLEAGUE" in sk or "SUPERLIG" in sk
-        or "DIMAYOR" in sk  # Liga DIMAYOR (Colombian soccer)
-        or "LIGA" in sk  # LALIGA already above, also catches DIMAYOR, BBVA, etc.
-        or "HNL" in sk      # Croatia HNL
-        or "SCOTTISH" in sk or "SCOTPREM" in sk  # Scottish Premiership / Cup
-        or "GREECE" in sk or "GREEK" in sk or "GRC" in sk  # Super League Greece
-        or "ARGENT" in sk or "ARGPREMDIV" in sk  # Argentina Primera Division
-        or "BRASILEIRO" in sk  # Brasileirao (Brazilian soccer)
-        or "CHNSL" in sk or "CHNSUPER" in sk  # Chinese Super League
-        or "THAIL" in sk  # Thai League (THAIL1, THAIL2, etc.)
-        or "BELGIAN" in sk  # Belgian Pro League
-        or "EGYPL" in sk or "EGYSUPERL" in sk  # Egyptian Premier League
-        or "URYPD" in sk  # Uruguayan Primera División
-        or "PFAPOY" in sk  # PFA Player of the Year (soccer award)
-        or "VENFUT" in sk  # Venezuelan football (VENFUTVE, etc.)
-        or "APFDDH" in sk  # Paraguayan APF league
-        or "USL" in sk  # USL Championship (US soccer)
-        or "BALLONDOR" in sk  # Ballon d'Or (soccer award)
-        or "JOINCLUB" in sk  # soccer transfers
-        or "NEXTMANAGER" in sk or "ACQUIREREALMADRID" in sk or "LOSEREALMADRID" in sk
-        or "ALLSVENSKAN" in sk  # Swedish soccer
-        or "KNVB" in sk  # Dutch cup
-        or "BOLPDIV" in sk  # Bolivian Primera División
-        or "EKSTRAKLASA" in sk  # Polish league
-        or "CHLLDP" in sk or "ECULP" in sk  # Chilean / Ecuadorian leagues
-        or "CONMEBOL" in sk  # Copa Libertadores / Sudamericana
-        or "ISLGAME" in sk  # Indian Super League
-        or "CANPL" in sk  # Canadian Premier League
-        or "CZEFL" in sk  # Czech league
-        or "JOINRONALDO" in sk or "JOINMESSI" in sk or "JOINMBAPPE" in sk  # transfers
-    ):
-        return "\u26bd"  # ⚽
-    return "\U0001f3c6"  # 🏆 — Other / truly unrecognized
+    # One walk of the trie from each start position finds every rule
+    # substring in the ticker; keep the highest-precedence (lowest) rule
+    best = len(_SPORT_EMOJI_RULES)
+    root_get = _SPORT_TOKEN_TRIE.get
+    for i, ch in enumerate(sk):
+        node = root_get(ch)
+        if node is None:
+            continue
+        rank = node.get("")
+        if rank is not None and rank < best:
+            best = rank
+        for ch in sk[i + 1:]:
+            node = node.get(ch)
+            if node is None:
+                break
+            rank = node.get("")
+            if rank is not None and rank < best:
+                best = rank
+    if best > _FOOTBALL_RULE and sk == "KXSB":
+        best = _FOOTBALL_RULE
+    elif best > _WORLD_CUP_RULE and (sk[2:] if sk.startswith("KX") else sk).startswith("WC"):
+        best = _WORLD_CUP_RULE
+    return _SPORT_EMOJI_RULES[best][0] if best < len(_SPORT_EMOJI_RULES) else _OTHER_SPORT_EMOJI
 
 
 # Maps sport aliases (text or emoji) → the canonical emoji returned by _sport_emoji.
@@ -316,7 +357,7 @@ def _is_ended(expiration_time: str) -> bool:
     if not expiration_time:
         return False
     try:
-        et = datetime.fromisoformat(expiration_time.replace("Z", "+00:00"))
+        et = parse_iso_utc(expiration_time)
         return datetime.now(timezone.utc) > et
     except (ValueError, TypeError):
         return False
@@ -327,7 +368,7 @@ def _parse_iso_dt(s: str | None) -> "datetime | None":
     if not s:
         return None
     try:
-        dt = datetime.fromisoformat(s.replace("Z", "+00:00"))
+        dt = parse_iso_utc(s)
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=timezone.utc)
         return dt
@@ -355,11 +396,6 @@ def _fmt_eta(dt: "datetime | None", now: datetime, verb: str = "closes") -> str:
         return f"{verb} in {d}d {h}h" if h else f"{verb} in {d}d"
 
 
-def _format_game_time(commence_time: str, sport_key: str = "") -> str:
-    """Format game time for display with a contextual label."""
-    return format_game_time_with_label(commence_time, sport_key)
-
-
 def _earliest_market_time(m: dict) -> str:
     """Return the earlier of close_time / expected_expiration_time as an ISO string.
 
@@ -375,8 +411,8 @@ def _earliest_market_time(m: dict) -> str:
     if not et:
         return ct
     try:
-        ct_dt = datetime.fromisoformat(ct.replace("Z", "+00:00"))
-        et_dt = datetime.fromisoformat(et.replace("Z", "+00:00"))
+        ct_dt = parse_iso_utc(ct)
+        et_dt = parse_iso_utc(et)
         return ct if ct_dt <= et_dt else et
     except (ValueError, TypeError):
         return ct or et
@@ -757,7 +793,7 @@ def _group_markets_by_sport(markets: list[dict]) -> list[dict]:
     """
     sport_map: dict[str, list[dict]] = {}
     for m in markets:
-        emoji = _sport_emoji(_market_series_ticker(m).upper())
+        emoji = _sport_emoji(_market_series_ticker(m))
         sport_map.setdefault(emoji, []).append(m)
     def _count_games(ms: list[dict]) -> int:
         # Count distinct events across ALL bet types (games + futures + props),
@@ -831,6 +867,26 @@ def _group_markets_by_sport(markets: list[dict]) -> list[dict]:
     return result
 
 
+# /bet, /parlay and the Back-to-sports button all open on the same cached
+# all-markets list, so its per-sport grouping is reused until kalshi_api swaps
+# in a fresh list or the TTL lapses.
+_SPORT_GROUPS_TTL = 30  # seconds
+_sport_groups_cache: tuple[float, list[dict], list[dict]] | None = None
+
+
+def _cached_sport_groups(all_markets: list[dict]) -> list[dict]:
+    """Memoized _group_markets_by_sport for the most recent markets list."""
+    global _sport_groups_cache
+    now = monotonic()
+    if _sport_groups_cache is not None:
+        ts, source, groups = _sport_groups_cache
+        if source is all_markets and now - ts < _SPORT_GROUPS_TTL:
+            return groups
+    groups = _group_markets_by_sport(all_markets)
+    _sport_groups_cache = (now, all_markets, groups)
+    return groups
+
+
 def _group_markets_by_game(markets: list[dict]) -> list[dict]:
     """Group markets by game (same matchup across different series), sorted by start time.
 
@@ -892,7 +948,7 @@ def _group_markets_by_game(markets: list[dict]) -> list[dict]:
         for g in game_groups:
             if g["time"]:
                 try:
-                    dt = datetime.fromisoformat(g["time"].replace("Z", "+00:00"))
+                    dt = parse_iso_utc(g["time"])
                     timed_games.append((dt, g))
                 except (ValueError, TypeError):
                     pass
@@ -956,7 +1012,7 @@ def _group_markets_by_game(markets: list[dict]) -> list[dict]:
             #      slightly from the game's listed start time.
             if not merged and prop["time"] and timed_games:
                 try:
-                    prop_dt = datetime.fromisoformat(prop["time"].replace("Z", "+00:00"))
+                    prop_dt = parse_iso_utc(prop["time"])
                     tight = [
                         (dt, g) for dt, g in timed_games
                         if abs((dt - prop_dt).total_seconds()) <= 300
@@ -1017,7 +1073,7 @@ def _group_markets_by_game(markets: list[dict]) -> list[dict]:
             "league": league,
             "series_ticker": raw_ticker,
             "time": exp,
-            "time_str": _format_game_time(exp) if exp else "",
+            "time_str": format_game_time_with_label(exp) if exp else "",
             "markets": sorted_markets,
             "market_count": len(sorted_markets),
         })
@@ -1212,8 +1268,16 @@ def _futures_event_label(markets: list[dict]) -> str:
     title = (first.get("title") or "").strip()
     if not title:
         return first.get("event_ticker") or "Futures"
-    yes_sub = (first.get("yes_sub_title") or "").strip()
+    return _futures_title_label(title, (first.get("yes_sub_title") or "").strip())
 
+
+@functools.lru_cache(maxsize=1024)
+def _futures_title_label(title: str, yes_sub: str) -> str:
+    """Label text for a futures event from its first market's title.
+
+    Cached: every futures list (and each Back to one) relabels the same
+    events, and this is a dozen regex passes per title.
+    """
     t = title
     subject = ""
 
@@ -1293,7 +1357,7 @@ def _group_futures_by_event(markets: list[dict]) -> list[dict]:
             "markets": ms,
             "market_count": len(ms),
         })
-    result.sort(key=lambda e: -e["market_count"])
+    result.sort(key=itemgetter("market_count"), reverse=True)
     return result
 
 
@@ -1370,47 +1434,55 @@ def _is_close_market(m: dict, max_pct: float) -> bool:
     return (1.0 - max_pct) <= p <= max_pct
 
 
+# pick_key → the moneyline side whose market backs the pick. Spread and total
+# picks use their own line's market when the odds entry carries one.
+_PICK_SIDE: dict[str, str] = {
+    "home": "home",
+    "away": "away",
+    "spread_home": "home",
+    "spread_away": "away",
+    "over": "home",
+    "under": "home",
+}
+
+# Picks priced off their own spread/total line rather than the moneyline
+_LINE_PICKS = frozenset({"spread_home", "spread_away", "over", "under"})
+
+# pick_key → (display with a point, display without one)
+_PICK_DISPLAY: dict[str, tuple[str, str]] = {
+    "home": ("{home} ML", "{home} ML"),
+    "away": ("{away} ML", "{away} ML"),
+    "spread_home": ("{home} {point:+g}", "{home} Spread"),
+    "spread_away": ("{away} {point:+g}", "{away} Spread"),
+    "over": ("Over {point:g}", "Over"),
+    "under": ("Under {point:g}", "Under"),
+}
+
+
 def _resolve_kalshi_bet(
     pick_key: str, kalshi_markets: dict, odds_entry: dict
 ) -> tuple[str | None, str]:
     """Map a sports-style pick to a Kalshi market_ticker and yes/no pick."""
-    if pick_key == "home":
-        m = kalshi_markets.get("home")
-        return (m["ticker"], "yes") if m else (None, "yes")
-    elif pick_key == "away":
-        m = kalshi_markets.get("away")
-        return (m["ticker"], "yes") if m else (None, "yes")
-    elif pick_key in ("spread_home", "spread_away", "over", "under"):
+    side = _PICK_SIDE.get(pick_key)
+    if side is None:
+        return (None, "yes")
+    if pick_key in _LINE_PICKS:
         ticker = odds_entry.get("_market_ticker")
         if ticker:
-            kalshi_pick = odds_entry.get("_kalshi_pick", "yes")
-            return (ticker, kalshi_pick)
-        if pick_key == "spread_home":
-            m = kalshi_markets.get("home")
-        elif pick_key == "spread_away":
-            m = kalshi_markets.get("away")
-        else:
-            m = kalshi_markets.get("home")
-        return (m["ticker"], "yes") if m else (None, "yes")
-    return (None, "yes")
+            return (ticker, odds_entry.get("_kalshi_pick", "yes"))
+    m = kalshi_markets.get(side)
+    return (m["ticker"], "yes") if m else (None, "yes")
 
 
 def _build_pick_display(pick_key: str, home: str, away: str, odds_entry: dict) -> str:
     """Build a human-readable pick display string."""
+    fmts = _PICK_DISPLAY.get(pick_key)
+    if fmts is None:
+        return pick_key.capitalize()
     point = odds_entry.get("point")
-    if pick_key == "home":
-        return f"{home} ML"
-    elif pick_key == "away":
-        return f"{away} ML"
-    elif pick_key == "spread_home":
-        return f"{home} {point:+g}" if point is not None else f"{home} Spread"
-    elif pick_key == "spread_away":
-        return f"{away} {point:+g}" if point is not None else f"{away} Spread"
-    elif pick_key == "over":
-        return f"Over {point:g}" if point is not None else "Over"
-    elif pick_key == "under":
-        return f"Under {point:g}" if point is not None else "Under"
-    return pick_key.capitalize()
+    if point is None:
+        return fmts[1].format(home=home, away=away)
+    return fmts[0].format(home=home, away=away, point=point)
 
 
 # ── Games List View (for /live) ───────────────────────────────────────
@@ -1419,7 +1491,7 @@ def _build_pick_display(pick_key: str, home: str, away: str, odds_entry: dict) -
 GAMES_PER_PAGE = 10
 
 
-class GamesListView(discord.ui.View):
+class GamesListView(_MenuView):
     """Paginated live game scores display."""
 
     def __init__(
@@ -1493,7 +1565,7 @@ class GamesListView(discord.ui.View):
                     detail += f"\n{' · '.join(time_parts)}"
                 lines.append(f"{score_str}\n{detail}")
             else:
-                time_str = _format_game_time(g.get("commence_time", ""), g.get("sport_key", ""))
+                time_str = format_game_time_with_label(g.get("commence_time", ""), g.get("sport_key", ""))
                 lines.append(f"**{away}** @ **{home}**\n{sport} · {time_str}")
 
         embed.description = "\n\n".join(lines)
@@ -1504,9 +1576,6 @@ class GamesListView(discord.ui.View):
         embed.set_footer(text=" · ".join(parts))
         return embed
 
-    async def on_timeout(self) -> None:
-        await _expire_menu(self)
-
 
 class GamesPageButton(discord.ui.Button["GamesListView"]):
     def __init__(self, direction: str, target_page: int, row: int) -> None:
@@ -1548,10 +1617,19 @@ def _market_odds_str(m: dict) -> tuple[str, str]:
     ask-only, which inflates cost by the full spread.  Falls back to ask,
     then last_price when bid/ask are unavailable.
     """
+    return _odds_from_prices(
+        m.get("yes_bid_dollars"), m.get("yes_ask_dollars"), m.get("last_price_dollars")
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _odds_from_prices(bid, ask, last) -> tuple[str, str]:
+    """_market_odds_str on the raw price fields.
+
+    Cached on those fields, so a market is re-priced only when its quote
+    moves; views hit this for the embed, the dropdown and every page flip.
+    """
     try:
-        bid = m.get("yes_bid_dollars")
-        ask = m.get("yes_ask_dollars")
-        last = m.get("last_price_dollars")
         if bid is not None and ask is not None:
             yes_price = (float(bid) + float(ask)) / 2
         elif ask is not None:
@@ -1563,12 +1641,11 @@ def _market_odds_str(m: dict) -> tuple[str, str]:
     except (TypeError, ValueError):
         return "?", "?"
     if 0 < yes_price < 1:
-        yes_am = format_american(decimal_to_american(round(1.0 / yes_price, 3)))
-        no_am  = format_american(decimal_to_american(round(1.0 / (1.0 - yes_price), 3)))
-        return yes_am, no_am
+        return _price_to_american(yes_price), _price_to_american(1.0 - yes_price)
     return "?", "?"
 
 
+@functools.lru_cache(maxsize=1024)
 def _price_to_american(price: float) -> str:
     """Convert a Kalshi yes price (0–1) to a formatted American odds string."""
     if 0 < price < 1:
@@ -1576,6 +1653,35 @@ def _price_to_american(price: float) -> str:
     return "?"
 
 
+def _group_odds_parts(markets: list[dict]) -> list[str]:
+    """Return "<outcome> <american>" for a group's first three outcomes.
+
+    Uses mid-price like _market_odds_str; an outcome without a usable price
+    is listed by name alone.
+    """
+    parts = []
+    for mkt in markets[:3]:
+        sub = mkt.get("yes_sub_title") or ""
+        bid = mkt.get("yes_bid_dollars")
+        ask = mkt.get("yes_ask_dollars")
+        last = mkt.get("last_price_dollars")
+        try:
+            if bid is not None and ask is not None:
+                price = (float(bid) + float(ask)) / 2
+            elif ask is not None:
+                price = ask
+            else:
+                price = last
+            am = _price_to_american(float(price)) if price is not None else None
+        except (TypeError, ValueError):
+            am = None
+        if sub and am is not None:
+            parts.append(f"{sub} {am}")
+        elif sub:
+            parts.append(sub)
+    return parts
+
+
 # (keyword, category_label, sort_priority) — checked in order, first match wins
 _CATEGORY_RULES: list[tuple[str, str, int]] = [
     ("GAME",       "Game Lines",       1),
@@ -1601,6 +1707,7 @@ _CATEGORY_RULES: list[tuple[str, str, int]] = [
 ]
 
 
+@functools.lru_cache(maxsize=2048)
 def _market_category(series_ticker: str) -> tuple[str, int]:
     """Return (category_label, sort_priority) for a series ticker."""
     sk = series_ticker.upper()
@@ -1610,15 +1717,18 @@ def _market_category(series_ticker: str) -> tuple[str, int]:
     return "Other", 99
 
 
+def _item_series_ticker(item: dict) -> str:
+    """Series ticker of a _group_markets_by_prop item (its first market's for a group)."""
+    m = item["market"] if item["type"] == "single" else item["markets"][0]
+    return m.get("series_ticker") or ""
+
+
 def _series_label(series_ticker: str) -> str:
     """Return a human-readable sport label for a series ticker, or ''."""
-    for info in SPORTS.values():
-        if series_ticker in info["series"].values():
-            return info["label"]
-    return ""
+    return SERIES_LABELS.get(series_ticker, "")
 
 
-class MarketListView(discord.ui.View):
+class MarketListView(_MenuView):
     """Paginated list of raw Kalshi markets sorted by soonest expiry."""
 
     def __init__(self, markets: list[dict], page: int = 0, timeout: float = 180.0, parlay_legs: list[dict] | None = None, game_back: dict | None = None) -> None:
@@ -1631,11 +1741,13 @@ class MarketListView(discord.ui.View):
         self._grouped = _group_markets_by_prop(markets)
         if game_back is not None:
             def _item_sort_key(item: dict) -> tuple:
-                st = (item["market"].get("series_ticker") or "") if item["type"] == "single" else (item["markets"][0].get("series_ticker") or "")
-                _, priority = _market_category(st)
+                _, priority = _market_category(_item_series_ticker(item))
                 vol = (item["market"].get("volume") or 0) if item["type"] == "single" else sum(m.get("volume") or 0 for m in item["markets"])
                 return (priority, -vol)
             self._grouped.sort(key=_item_sort_key)
+        # Rendered line per item index; the markets are fixed for the view's
+        # lifetime, so paging back only re-joins cached lines
+        self._lines: dict[int, str] = {}
         self._rebuild()
 
     def _rebuild(self) -> None:
@@ -1643,9 +1755,16 @@ class MarketListView(discord.ui.View):
         total_pages = max(1, (len(self._grouped) + MARKETS_PER_PAGE - 1) // MARKETS_PER_PAGE)
         start = self.page * MARKETS_PER_PAGE
         page_items = self._grouped[start:start + MARKETS_PER_PAGE]
+        # Odds text per item on this page, shared by the embed and the dropdown:
+        # (yes, no) American strings for a single, outcome parts for a group
+        self._page_odds = [
+            _market_odds_str(item["market"]) if item["type"] == "single"
+            else _group_odds_parts(item["markets"])
+            for item in page_items
+        ]
 
         if page_items:
-            self.add_item(MarketGroupedDropdown(page_items, start, self, row=0))
+            self.add_item(MarketGroupedDropdown(page_items, start, self, self._page_odds, row=0))
         if self.page > 0:
             self.add_item(MarketPageButton("prev", self.page - 1, row=1))
         if self.page < total_pages - 1:
@@ -1660,6 +1779,46 @@ class MarketListView(discord.ui.View):
             if len(self.parlay_legs) >= 2:
                 self.add_item(ParlayPlaceFromListButton(self.parlay_legs, row=parlay_row))
 
+    def _item_line(self, item: dict, odds: tuple[str, str] | list[str], series_ticker: str) -> str:
+        """One market item as shown in the embed; ``odds`` comes from _page_odds."""
+        in_game = self._game_back is not None  # suppress redundant sport labels inside a game
+        if item["type"] == "single":
+            m = item["market"]
+            title = _clean_market_title(m.get("title") or "?")
+            exp = _earliest_market_time(m)
+            time_str = format_game_time_with_label(exp)
+            league = "" if in_game else _short_league(series_ticker)
+            et = m.get("event_ticker") or ""
+            teams = _teams_from_event_ticker_flexible(et)
+            # Show Kalshi subtitle (game context) only for player props where
+            # teams can't be derived from event_ticker (they'd be in label already)
+            game_ctx = (m.get("subtitle") or "") if (not in_game and not teams) else ""
+            header = f"**{title}**" if in_game else f"{_sport_emoji(series_ticker)} **{title}**"
+            if league:
+                header += f" — {league}"
+            yes_am, no_am = odds
+            odds_str = f"YES {yes_am} / NO {no_am}"
+            body = f"{game_ctx} · {time_str}" if game_ctx else time_str
+            return f"{header}\n{body} · {odds_str}"
+        label = item["label"]
+        count = item["count"]
+        first_m = item["markets"][0]
+        exp = _earliest_market_time(first_m)
+        time_str = format_game_time_with_label(exp)
+        league = "" if in_game else _short_league(series_ticker)
+        et = first_m.get("event_ticker") or ""
+        teams = _teams_from_event_ticker_flexible(et)
+        # Show Kalshi subtitle (game context) only for player props where
+        # teams can't be derived from event_ticker (they'd be in label already)
+        game_ctx = (first_m.get("subtitle") or "") if (not in_game and not teams) else ""
+        header = f"**{label}**" if in_game else f"{_sport_emoji(series_ticker)} **{label}**"
+        if league:
+            header += f" — {league}"
+        # Per-outcome American odds (e.g. "Lakers -120 · Warriors +100")
+        odds_str = " · ".join(odds) if odds else f"{count} options"
+        body = f"{game_ctx} · {time_str}" if game_ctx else time_str
+        return f"{header}\n{body} · {odds_str}"
+
     def build_embed(self) -> discord.Embed:
         total = len(self._grouped)
         total_pages = max(1, (total + MARKETS_PER_PAGE - 1) // MARKETS_PER_PAGE)
@@ -1671,78 +1830,21 @@ class MarketListView(discord.ui.View):
             embed.description = "No open markets right now."
             return embed
 
-        in_game = self._game_back is not None  # suppress redundant sport labels inside a game
+        in_game = self._game_back is not None
         lines = []
         current_category: str | None = None
-        for item in page_items:
+        for i, (item, odds) in enumerate(zip(page_items, self._page_odds), start):
+            # One series ticker per item feeds the category, emoji and league
+            series_ticker = _item_series_ticker(item)
             if in_game:
-                st = (item["market"].get("series_ticker") or "") if item["type"] == "single" else (item["markets"][0].get("series_ticker") or "")
-                cat_label, _ = _market_category(st)
+                cat_label, _ = _market_category(series_ticker)
                 if cat_label != current_category:
                     current_category = cat_label
                     lines.append(f"**{cat_label}**")
-            if item["type"] == "single":
-                m = item["market"]
-                title = _clean_market_title(m.get("title") or "?")
-                exp = _earliest_market_time(m)
-                time_str = _format_game_time(exp) if exp else "TBD"
-                series_ticker = m.get("series_ticker") or ""
-                sport_emoji = _sport_emoji(series_ticker)
-                league = "" if in_game else _short_league(series_ticker)
-                et = m.get("event_ticker") or ""
-                teams = _teams_from_event_ticker_flexible(et)
-                # Show Kalshi subtitle (game context) only for player props where
-                # teams can't be derived from event_ticker (they'd be in label already)
-                game_ctx = (m.get("subtitle") or "") if (not in_game and not teams) else ""
-                header = f"**{title}**" if in_game else f"{sport_emoji} **{title}**"
-                if league:
-                    header += f" — {league}"
-                yes_am, no_am = _market_odds_str(m)
-                odds_str = f"YES {yes_am} / NO {no_am}"
-                body = f"{game_ctx} · {time_str}" if game_ctx else time_str
-                lines.append(f"{header}\n{body} · {odds_str}")
-            else:
-                label = item["label"]
-                count = item["count"]
-                first_m = item["markets"][0]
-                exp = _earliest_market_time(first_m)
-                time_str = _format_game_time(exp) if exp else "TBD"
-                series_ticker = item["markets"][0].get("series_ticker") or ""
-                sport_emoji = _sport_emoji(series_ticker)
-                league = "" if in_game else _short_league(series_ticker)
-                et = first_m.get("event_ticker") or ""
-                teams = _teams_from_event_ticker_flexible(et)
-                # Show Kalshi subtitle (game context) only for player props where
-                # teams can't be derived from event_ticker (they'd be in label already)
-                game_ctx = (first_m.get("subtitle") or "") if (not in_game and not teams) else ""
-                header = f"**{label}**" if in_game else f"{sport_emoji} **{label}**"
-                if league:
-                    header += f" — {league}"
-                # Build per-outcome American odds string (e.g. "Lakers -120 · Warriors +100")
-                # Use mid-price for consistency with _market_odds_str
-                parts = []
-                for mkt in item["markets"][:3]:
-                    sub = mkt.get("yes_sub_title") or ""
-                    bid = mkt.get("yes_bid_dollars")
-                    ask = mkt.get("yes_ask_dollars")
-                    last = mkt.get("last_price_dollars")
-                    if bid is not None and ask is not None:
-                        price = (float(bid) + float(ask)) / 2
-                    elif ask is not None:
-                        price = ask
-                    else:
-                        price = last
-                    try:
-                        am = _price_to_american(float(price)) if price is not None else None
-                    except (TypeError, ValueError):
-                        am = None
-                    if sub and am is not None:
-                        parts.append(f"{sub} {am}")
-                    elif sub:
-                        parts.append(sub)
-                odds_str = " · ".join(parts) if parts else f"{count} options"
-                body = f"{game_ctx} · {time_str}" if game_ctx else time_str
-                lines.append(f"{header}\n{body} · {odds_str}")
+            line = self._lines.get(i)
+            if line is None:
+                line = self._lines[i] = self._item_line(item, odds, series_ticker)
+            lines.append(line)
 
         embed.description = "\n\n".join(lines)
         if self.parlay_legs is not None:
@@ -1752,26 +1854,30 @@ class MarketListView(discord.ui.View):
             embed.set_footer(text=f"Page {self.page + 1}/{total_pages} · Select a market below to bet")
         return embed
 
-    async def on_timeout(self) -> None:
-        await _expire_menu(self)
-
 
 class MarketGroupedDropdown(discord.ui.Select["MarketListView"]):
     """Dropdown for MarketListView supporting both singles and grouped prop markets."""
 
-    def __init__(self, page_items: list[dict], start: int, list_view: "MarketListView", row: int = 0) -> None:
+    def __init__(
+        self,
+        page_items: list[dict],
+        start: int,
+        list_view: "MarketListView",
+        page_odds: list[tuple[str, str] | list[str]],
+        row: int = 0,
+    ) -> None:
         self._list_view = list_view
         # Both maps keyed by the short position-based value string (safe <= 6 chars)
         self._market_map: dict[str, dict] = {}
         self._group_map: dict[str, list[dict]] = {}
         options: list[discord.SelectOption] = []
-        for i, item in enumerate(page_items[:25]):
+        for i, (item, odds) in enumerate(zip(page_items[:25], page_odds)):
             if item["type"] == "single":
                 m = item["market"]
                 ticker = m.get("ticker") or ""
                 title = m.get("yes_sub_title") or _clean_market_title(m.get("title") or ticker)
                 label = title[:100]
-                yes_am, no_am = _market_odds_str(m)
+                yes_am, no_am = odds
                 desc = f"YES {yes_am} / NO {no_am}"
                 key = f"m:{start + i}"  # position-based; avoids long ticker exceeding 100-char limit
                 self._market_map[key] = m
@@ -1779,21 +1885,9 @@ class MarketGroupedDropdown(discord.ui.Select["MarketListView"]):
             else:
                 key = f"g:{start + i}"
                 label = item["label"][:100]
-                parts = []
-                for mkt in item["markets"][:3]:
-                    sub = mkt.get("yes_sub_title") or ""
-                    price = mkt.get("yes_ask_dollars") or mkt.get("last_price_dollars")
-                    try:
-                        am = _price_to_american(float(price)) if price is not None else None
-                    except (TypeError, ValueError):
-                        am = None
-                    if sub and am is not None:
-                        parts.append(f"{sub} {am}")
-                    elif sub:
-                        parts.append(sub)
-                desc = (" · ".join(parts) if parts else item.get("subtitle", f"{item['count']} options"))[:100]
+                desc = (" · ".join(odds) if odds else item.get("subtitle", f"{item['count']} options"))[:100]
                 self._group_map[key] = item["markets"]
-                sport_emoji = _sport_emoji(item["markets"][0].get("series_ticker") or "")
+                sport_emoji = _sport_emoji(_item_series_ticker(item))
                 options.append(discord.SelectOption(label=label, value=key, description=desc, emoji=sport_emoji))
         super().__init__(placeholder="Select a market to bet on...", options=options, row=row)
 
@@ -1823,7 +1917,7 @@ class MarketGroupedDropdown(discord.ui.Select["MarketListView"]):
             await interaction.edit_original_response(embed=embed, view=threshold_view)
 
 
-class LiveThresholdView(discord.ui.View):
+class LiveThresholdView(_MenuView):
     """Shows individual threshold options for a grouped market in the /live flow."""
 
     def __init__(
@@ -1894,9 +1988,6 @@ class LiveThresholdView(discord.ui.View):
         embed.set_footer(text=f"{footer}Select an outcome to bet")
         return embed
 
-    async def on_timeout(self) -> None:
-        await _expire_menu(self)
-
 
 class LiveThresholdSelect(discord.ui.Select["LiveThresholdView"]):
     def __init__(
@@ -1983,7 +2074,7 @@ class RawMarketBetView(discord.ui.View):
         yes_am, no_am = _market_odds_str(market)
         self.add_item(RawMarketPickButton("yes", f"YES  {yes_am}", market, row=0))
         self.add_item(RawMarketPickButton("no",  f"NO   {no_am}",  market, row=0))
-        self.add_item(RawMarketBackButton(list_view.markets, list_view.page, row=1, game_back=getattr(list_view, '_game_back', None)))
+        self.add_item(RawMarketBackButton(list_view.markets, list_view.page, row=1, game_back=getattr(list_view, '_game_back', None), list_view=list_view))
 
     def build_embed(self) -> discord.Embed:
         m       = self.market
@@ -1991,7 +2082,7 @@ class RawMarketBetView(discord.ui.View):
         yes_sub = m.get("yes_sub_title") or ""
         exp     = m.get("expected_expiration_time") or m.get("close_time") or ""
         sport   = _series_label(m.get("series_ticker") or "")
-        time_str = _format_game_time(exp) if exp else "TBD"
+        time_str = format_game_time_with_label(exp)
         yes_am, no_am = _market_odds_str(m)
 
         embed = discord.Embed(title=title, color=discord.Color.blue())
@@ -2018,19 +2109,26 @@ class RawMarketPickButton(discord.ui.Button["RawMarketBetView"]):
 
 
 class RawMarketBackButton(discord.ui.Button["RawMarketBetView"]):
-    def __init__(self, markets: list[dict], page: int, row: int, parlay_legs: list[dict] | None = None, game_back: dict | None = None) -> None:
+    def __init__(self, markets: list[dict], page: int, row: int, parlay_legs: list[dict] | None = None, game_back: dict | None = None, list_view: MarketListView | None = None) -> None:
         super().__init__(label="Back", style=discord.ButtonStyle.secondary,
                          emoji="\u25c0\ufe0f", row=row)
         self._markets = markets
         self._page = page
         self._parlay_legs = parlay_legs
         self._game_back = game_back
+        self._list_view = list_view
 
     async def callback(self, interaction: discord.Interaction) -> None:
-        list_view = MarketListView(self._markets, self._page, parlay_legs=self._parlay_legs, game_back=self._game_back)
+        if not await _safe_defer(interaction, edit=True):
+            return
+        # Show the list we came from again if it is still live; it is on the
+        # same page and keeps its grouping and rendered lines
+        list_view = self._list_view
+        if list_view is None or list_view.is_finished():
+            list_view = MarketListView(self._markets, self._page, parlay_legs=self._parlay_legs, game_back=self._game_back)
         embed = list_view.build_embed()
         try:
-            await interaction.response.edit_message(embed=embed, view=list_view)
+            await interaction.edit_original_response(embed=embed, view=list_view)
         except discord.NotFound:
             pass
 
@@ -2045,33 +2143,39 @@ class BackToGamesButton(discord.ui.Button["MarketListView"]):
         self._game_back = game_back
 
     async def callback(self, interaction: discord.Interaction) -> None:
+        if not await _safe_defer(interaction, edit=True):
+            return
         gb = self._game_back
-        if gb.get("source") == "futures":
-            view = FuturesListView(
-                gb["markets"], gb["emoji"], gb["label"],
-                game_back=gb.get("parent_game_back"),
-                page=gb.get("page", 0),
-                parlay_legs=gb.get("parlay_legs"),
-                category_back=gb.get("category_back"),
-                title_label=gb.get("title_label"),
-                title_emoji=gb.get("title_emoji") or "\U0001f3c6",
-            )
-        else:
-            view = GameListView(
-                gb["markets"], gb["emoji"], gb["label"],
-                all_markets=gb.get("all_markets"),
-                page=gb.get("page", 0),
-                parlay_legs=gb.get("parlay_legs"),
-                category_back=gb.get("category_back"),
-            )
+        # As with BackToCategoryButton: the list we came from is still on the
+        # page it was left on, so show it again rather than regrouping
+        view = gb.get("view")
+        if view is None or view.is_finished():
+            if gb.get("source") == "futures":
+                view = FuturesListView(
+                    gb["markets"], gb["emoji"], gb["label"],
+                    game_back=gb.get("parent_game_back"),
+                    page=gb.get("page", 0),
+                    parlay_legs=gb.get("parlay_legs"),
+                    category_back=gb.get("category_back"),
+                    title_label=gb.get("title_label"),
+                    title_emoji=gb.get("title_emoji") or "\U0001f3c6",
+                )
+            else:
+                view = GameListView(
+                    gb["markets"], gb["emoji"], gb["label"],
+                    all_markets=gb.get("all_markets"),
+                    page=gb.get("page", 0),
+                    parlay_legs=gb.get("parlay_legs"),
+                    category_back=gb.get("category_back"),
+                )
         embed = view.build_embed()
         try:
-            await interaction.response.edit_message(embed=embed, view=view)
+            await interaction.edit_original_response(embed=embed, view=view)
         except discord.NotFound:
             pass
 
 
-class GameListView(discord.ui.View):
+class GameListView(_MenuView):
     """Shows games within a sport; selecting one opens MarketListView for that game."""
 
     def __init__(
@@ -2104,6 +2208,10 @@ class GameListView(discord.ui.View):
             game_markets = [m for m in sport_markets if not _is_futures_market(m)]
             self._futures_markets = [m for m in sport_markets if _is_futures_market(m)]
         self._games = _group_markets_by_game(game_markets)
+        # Event count for the Futures button label, which is re-added on every page
+        self._futures_count = (
+            len(_group_futures_by_event(self._futures_markets)) if self._futures_markets else 0
+        )
         self._rebuild()
 
     @property
@@ -2162,8 +2270,15 @@ class GameListView(discord.ui.View):
             embed.set_footer(text=f"{page_prefix}Select a game to see betting options")
         return embed
 
-    async def on_timeout(self) -> None:
-        await _expire_menu(self)
+
+@functools.lru_cache(maxsize=2048)
+def _game_option(label: str, value: str, n: int, league: str, time_str: str) -> discord.SelectOption:
+    """Shared, never-mutated SelectOption for one game row of a game list."""
+    desc = f"{league} · " if league else ""
+    desc += f"{n} market{'s' if n != 1 else ''}"
+    if time_str:
+        desc = f"{time_str} · {desc}"
+    return discord.SelectOption(label=label[:100], value=value, description=desc[:100])
 
 
 class GameSelectDropdown(discord.ui.Select["GameListView"]):
@@ -2174,16 +2289,8 @@ class GameSelectDropdown(discord.ui.Select["GameListView"]):
         for i, g in enumerate(page_games[:25]):
             key = f"g:{i}"
             self._games_by_key[key] = g
-            n = g["market_count"]
-            league = g.get("league", "")
-            desc = f"{league} · " if league else ""
-            desc += f"{n} market{'s' if n != 1 else ''}"
-            if g["time_str"]:
-                desc = f"{g['time_str']} · {desc}"
-            options.append(discord.SelectOption(
-                label=g["label"][:100],
-                value=key,
-                description=desc[:100],
+            options.append(_game_option(
+                g["label"], key, g["market_count"], g.get("league", ""), g["time_str"],
             ))
         super().__init__(placeholder="Select a game...", options=options, row=row)
 
@@ -2227,6 +2334,7 @@ class GameSelectDropdown(discord.ui.Select["GameListView"]):
             "all_markets": glv.all_markets,
             "parlay_legs": glv.parlay_legs,
             "category_back": glv.category_back,
+            "view": glv,
         }
         market_view = MarketListView(
             game_markets,
@@ -2262,12 +2370,13 @@ class FuturesButton(discord.ui.Button["GameListView"]):
     """Opens the FuturesListView for the current sport."""
 
     def __init__(self, game_list_view: "GameListView", row: int) -> None:
-        n = len(_group_futures_by_event(game_list_view._futures_markets))
-        label = f"Futures ({n})"
+        label = f"Futures ({game_list_view._futures_count})"
         super().__init__(label=label, emoji="\U0001f3c6", style=discord.ButtonStyle.primary, row=row)
         self._game_list_view = game_list_view
 
     async def callback(self, interaction: discord.Interaction) -> None:
+        if not await _safe_defer(interaction, edit=True):
+            return
         glv = self._game_list_view
         game_back = {
             "markets": glv.sport_markets,
@@ -2276,6 +2385,7 @@ class FuturesButton(discord.ui.Button["GameListView"]):
             "label": glv.sport_label,
             "all_markets": glv.all_markets,
             "parlay_legs": glv.parlay_legs,
+            "view": glv,
         }
         futures_view = FuturesListView(
             glv._futures_markets, glv.sport_emoji, glv.sport_label,
@@ -2284,12 +2394,12 @@ class FuturesButton(discord.ui.Button["GameListView"]):
         )
         embed = futures_view.build_embed()
         try:
-            await interaction.response.edit_message(embed=embed, view=futures_view)
+            await interaction.edit_original_response(embed=embed, view=futures_view)
         except discord.NotFound:
             pass
 
 
-class FuturesListView(discord.ui.View):
+class FuturesListView(_MenuView):
     """Generic event-list view: shows event groups (futures / props / specials)
     for a sport; selecting one opens MarketListView.
 
@@ -2373,9 +2483,6 @@ class FuturesListView(discord.ui.View):
             embed.set_footer(text=f"{page_prefix}Select a market to see options")
         return embed
 
-    async def on_timeout(self) -> None:
-        await _expire_menu(self)
-
 
 class FuturesSelectDropdown(discord.ui.Select["FuturesListView"]):
     def __init__(self, page_events: list[dict], list_view: "FuturesListView", row: int = 0) -> None:
@@ -2413,6 +2520,7 @@ class FuturesSelectDropdown(discord.ui.Select["FuturesListView"]):
             "category_back": lv.category_back,
             "title_label": lv.title_label,
             "title_emoji": lv.title_emoji,
+            "view": lv,
         }
         market_view = MarketListView(
             ev["markets"],
@@ -2452,16 +2560,20 @@ class BackToGamesFromFuturesButton(discord.ui.Button["FuturesListView"]):
         self._game_back = game_back
 
     async def callback(self, interaction: discord.Interaction) -> None:
+        if not await _safe_defer(interaction, edit=True):
+            return
         gb = self._game_back
-        game_view = GameListView(
-            gb["markets"], gb["emoji"], gb["label"],
-            all_markets=gb.get("all_markets"),
-            page=gb.get("page", 0),
-            parlay_legs=gb.get("parlay_legs"),
-        )
+        game_view = gb.get("view")
+        if game_view is None or game_view.is_finished():
+            game_view = GameListView(
+                gb["markets"], gb["emoji"], gb["label"],
+                all_markets=gb.get("all_markets"),
+                page=gb.get("page", 0),
+                parlay_legs=gb.get("parlay_legs"),
+            )
         embed = game_view.build_embed()
         try:
-            await interaction.response.edit_message(embed=embed, view=game_view)
+            await interaction.edit_original_response(embed=embed, view=game_view)
         except discord.NotFound:
             pass
 
@@ -2483,7 +2595,7 @@ class BackToSportsButton(discord.ui.Button["GameListView"]):
             pass
 
 
-class CategoryView(discord.ui.View):
+class CategoryView(_MenuView):
     """Level-2 menu: pick a bet category (Games / Player Props / Futures /
     Specials) within a sport. Sits between the sport picker and the event lists
     so the old flat per-sport futures dump is broken into navigable buckets."""
@@ -2505,6 +2617,12 @@ class CategoryView(discord.ui.View):
         self.parlay_legs = parlay_legs
         self.message: discord.Message | None = None
         self._partition = _partition_by_bet_type(sport_markets)
+        # Distinct events per bucket, shared by the buttons and the embed
+        self._event_counts = {
+            bt: len(_count_events_cached(ms)) for bt, ms in self._partition.items()
+        }
+        # Nothing in the embed changes after construction; Back re-shows this view
+        self._embed: discord.Embed | None = None
         self._rebuild()
 
     def category_back(self) -> dict:
@@ -2515,14 +2633,14 @@ class CategoryView(discord.ui.View):
             "label": self.sport_label,
             "all_markets": self.all_markets,
             "parlay_legs": self.parlay_legs,
+            "view": self,
         }
 
     def _rebuild(self) -> None:
         self.clear_items()
         for bt in tax.BET_TYPE_ORDER:
-            markets = self._partition.get(bt)
-            if markets:
-                self.add_item(CategoryButton(bt, len(_count_events_cached(markets)), row=0))
+            if bt in self._event_counts:
+                self.add_item(CategoryButton(bt, self._event_counts[bt], row=0))
         if self.all_markets is not None:
             self.add_item(BackToSportsButton(self.all_markets, row=1))
         if self.parlay_legs is not None:
@@ -2532,6 +2650,8 @@ class CategoryView(discord.ui.View):
                 self.add_item(ParlayPlaceFromListButton(self.parlay_legs, row=2))
 
     def build_embed(self) -> discord.Embed:
+        if self._embed is not None:
+            return self._embed
         is_parlay = self.parlay_legs is not None
         embed = discord.Embed(
             title=f"{self.sport_emoji} {self.sport_label}",
@@ -2539,21 +2659,18 @@ class CategoryView(discord.ui.View):
         )
         lines = []
         for bt in tax.BET_TYPE_ORDER:
-            markets = self._partition.get(bt)
-            if not markets:
+            n = self._event_counts.get(bt)
+            if n is None:
                 continue
-            n = len(_count_events_cached(markets))
             label = tax.BET_TYPE_LABEL[bt]
             emoji = tax.BET_TYPE_EMOJI[bt]
             noun = "game" if bt == tax.GAME else "market"
             lines.append(f"{emoji} **{label}** · {n} {noun}{'s' if n != 1 else ''}")
         embed.description = "\n".join(lines) or "No markets available."
         embed.set_footer(text="Pick a category")
+        self._embed = embed
         return embed
 
-    async def on_timeout(self) -> None:
-        await _expire_menu(self)
-
 
 def _count_events_cached(markets: list[dict]) -> list[str]:
     """Return the list of distinct event keys in a market list (for counting)."""
@@ -2585,6 +2702,8 @@ class CategoryButton(discord.ui.Button["CategoryView"]):
         view = self.view
         if view is None:
             return
+        if not await _safe_defer(interaction, edit=True):
+            return
         markets = view._partition.get(self.bet_type, [])
         cb = view.category_back()
         bt = self.bet_type
@@ -2618,7 +2737,7 @@ class CategoryButton(discord.ui.Button["CategoryView"]):
             )
         embed = new_view.build_embed()
         try:
-            await interaction.response.edit_message(embed=embed, view=new_view)
+            await interaction.edit_original_response(embed=embed, view=new_view)
         except discord.NotFound:
             pass
 
@@ -2632,17 +2751,21 @@ class BackToCategoryButton(discord.ui.Button):
 
     async def callback(self, interaction: discord.Interaction) -> None:
         cb = self._cb
-        if cb.get("kind") == "subtype":
-            view = FuturesSubtypeView(
-                cb["futures_markets"], cb["emoji"], cb["label"], cb["category_back"],
-                parlay_legs=cb.get("parlay_legs"),
-            )
-        else:
-            view = CategoryView(
-                cb["sport_markets"], cb["emoji"], cb["label"],
-                all_markets=cb.get("all_markets"),
-                parlay_legs=cb.get("parlay_legs"),
-            )
+        # The parent view is built from exactly these fields, so hand it back
+        # as-is while it's still live instead of re-partitioning the markets.
+        view = cb.get("view")
+        if view is None or view.is_finished():
+            if cb.get("kind") == "subtype":
+                view = FuturesSubtypeView(
+                    cb["futures_markets"], cb["emoji"], cb["label"], cb["category_back"],
+                    parlay_legs=cb.get("parlay_legs"),
+                )
+            else:
+                view = CategoryView(
+                    cb["sport_markets"], cb["emoji"], cb["label"],
+                    all_markets=cb.get("all_markets"),
+                    parlay_legs=cb.get("parlay_legs"),
+                )
         embed = view.build_embed()
         try:
             await interaction.response.edit_message(embed=embed, view=view)
@@ -2650,7 +2773,7 @@ class BackToCategoryButton(discord.ui.Button):
             pass
 
 
-class FuturesSubtypeView(discord.ui.View):
+class FuturesSubtypeView(_MenuView):
     """Sub-menu under Futures: pick a futures sub-bucket (Championship, Awards,
     Win Totals, …) before drilling into the event list."""
 
@@ -2671,6 +2794,10 @@ class FuturesSubtypeView(discord.ui.View):
         self.parlay_legs = parlay_legs
         self.message: discord.Message | None = None
         self._subtypes = _group_futures_by_subtype(futures_markets)
+        self._event_counts = {
+            sub: len(_count_events_cached(ms)) for sub, ms in self._subtypes.items()
+        }
+        self._embed: discord.Embed | None = None
         self._rebuild()
 
     def subtype_back(self) -> dict:
@@ -2681,33 +2808,33 @@ class FuturesSubtypeView(discord.ui.View):
             "label": self.sport_label,
             "category_back": self._category_back,
             "parlay_legs": self.parlay_legs,
+            "view": self,
         }
 
     def _rebuild(self) -> None:
         self.clear_items()
         # Up to 5 subtype buttons per row; Discord allows 5 rows of 5.
-        for i, sub in enumerate(self._subtypes):
-            self.add_item(FuturesSubtypeButton(sub, len(_count_events_cached(self._subtypes[sub])), row=i // 5))
+        for i, (sub, n) in enumerate(self._event_counts.items()):
+            self.add_item(FuturesSubtypeButton(sub, n, row=i // 5))
         self.add_item(BackToCategoryButton(self._category_back, row=4))
         if self.parlay_legs:
             self.add_item(ParlayViewSlipButton(self.parlay_legs, row=4))
 
     def build_embed(self) -> discord.Embed:
+        if self._embed is not None:
+            return self._embed
         embed = discord.Embed(
             title=f"{tax.BET_TYPE_EMOJI[tax.FUTURES]} {self.sport_label} · Futures",
             color=discord.Color.gold(),
         )
         lines = []
-        for sub, markets in self._subtypes.items():
-            n = len(_count_events_cached(markets))
+        for sub, n in self._event_counts.items():
             lines.append(f"**{sub}** · {n} market{'s' if n != 1 else ''}")
         embed.description = "\n".join(lines) or "No futures available."
         embed.set_footer(text="Pick a futures type")
+        self._embed = embed
         return embed
 
-    async def on_timeout(self) -> None:
-        await _expire_menu(self)
-
 
 class FuturesSubtypeButton(discord.ui.Button["FuturesSubtypeView"]):
     def __init__(self, subtype: str, count: int, row: int) -> None:
@@ -2733,7 +2860,7 @@ class FuturesSubtypeButton(discord.ui.Button["FuturesSubtypeView"]):
             pass
 
 
-class SportSelectorView(discord.ui.View):
+class SportSelectorView(_MenuView):
     """Top-level sport picker for /bet and /parlay; selecting a sport opens GameListView."""
 
     def __init__(self, all_markets: list[dict], page: int = 0, timeout: float = 180.0, parlay_legs: list[dict] | None = None) -> None:
@@ -2742,7 +2869,7 @@ class SportSelectorView(discord.ui.View):
         self.page = page
         self.parlay_legs = parlay_legs
         self.message: discord.Message | None = None
-        self._sports = _group_markets_by_sport(all_markets)
+        self._sports = _cached_sport_groups(all_markets)
         self._rebuild()
 
     @property
@@ -2789,8 +2916,16 @@ class SportSelectorView(discord.ui.View):
         embed.set_footer(text=footer)
         return embed
 
-    async def on_timeout(self) -> None:
-        await _expire_menu(self)
+
+@functools.lru_cache(maxsize=1024)
+def _sport_option(label: str, value: str, n: int, emoji: str) -> discord.SelectOption:
+    """Shared, never-mutated SelectOption for one sport row of the picker."""
+    return discord.SelectOption(
+        label=label,
+        value=value,
+        description=f"{n} market{'s' if n != 1 else ''}",
+        emoji=emoji,
+    )
 
 
 class SportSelectDropdown(discord.ui.Select["SportSelectorView"]):
@@ -2801,13 +2936,7 @@ class SportSelectDropdown(discord.ui.Select["SportSelectorView"]):
         for i, s in enumerate(sports[:25]):
             key = str(i)
             self._sports_by_idx[key] = s
-            n = s["game_count"]
-            options.append(discord.SelectOption(
-                label=s["label"],
-                value=key,
-                description=f"{n} market{'s' if n != 1 else ''}",
-                emoji=s["emoji"],
-            ))
+            options.append(_sport_option(s["label"], key, s["game_count"], s["emoji"]))
         super().__init__(placeholder="Select a sport...", options=options, row=row)
 
     async def callback(self, interaction: discord.Interaction) -> None:
@@ -2871,7 +3000,7 @@ async def _fresh_yes_ask(ticker: str) -> float | None:
     if not isinstance(fresh, dict):
         return None
     try:
-        v = float(fresh.get("yes_ask_dollars") or fresh.get("last_price_dollars") or 0)
+        v = market_yes_price(fresh)
     except (ValueError, TypeError):
         return None
     return v if v > 0 else None
@@ -2899,7 +3028,7 @@ async def _execute_kalshi_bet(
 
     if close_time:
         try:
-            ct = datetime.fromisoformat(close_time.replace("Z", "+00:00"))
+            ct = parse_iso_utc(close_time)
             if ct <= datetime.now(timezone.utc):
                 await interaction.followup.send("This market has already closed.", ephemeral=True)
                 return
@@ -2911,7 +3040,7 @@ async def _execute_kalshi_bet(
     pick_display = (f"YES — {yes_sub}" if pick == "yes" and yes_sub
                     else ("YES" if pick == "yes" else "NO"))
 
-    bet_id = await betting_service.place_kalshi_bet(
+    bet_id, new_bal = await betting_service.place_kalshi_bet(
         user_id=interaction.user.id,
         market_ticker=m["ticker"],
         event_ticker=m.get("event_ticker", ""),
@@ -2924,14 +3053,12 @@ async def _execute_kalshi_bet(
     )
 
     if bet_id is None:
-        bal = await wallet_service.get_balance(interaction.user.id)
         await interaction.followup.send(
-            f"Insufficient funds — you only have **${bal:.2f}** available.", ephemeral=True
+            f"Insufficient funds — you only have **${new_bal:.2f}** available.", ephemeral=True
         )
         return
 
     payout = round(amount * decimal_odds, 2)
-    new_bal = await wallet_service.get_balance(interaction.user.id)
     embed = discord.Embed(title="Bet Placed!", color=discord.Color.green())
     embed.add_field(name="Bet ID",           value=f"#K{bet_id}",                          inline=True)
     embed.add_field(name="Pick",             value=pick_display,                            inline=True)
@@ -2948,7 +3075,7 @@ async def _execute_kalshi_bet(
 _PRICE_MOVE_THRESHOLD = 0.03
 
 
-class BetConfirmView(discord.ui.View):
+class BetConfirmView(_MenuView):
     """Price-moved re-confirm step for a single bet. Only shown when the live
     price shifted more than _PRICE_MOVE_THRESHOLD from what the user saw on the
     pick screen; otherwise bets place directly from the amount modal. Shows
@@ -3019,9 +3146,6 @@ class BetConfirmView(discord.ui.View):
         except discord.NotFound:
             pass
 
-    async def on_timeout(self) -> None:
-        await _expire_menu(self)
-
 
 class RawMarketBetModal(discord.ui.Modal, title="Place Bet"):
     amount_input = discord.ui.TextInput(
@@ -3037,10 +3161,8 @@ class RawMarketBetModal(discord.ui.Modal, title="Place Bet"):
         self.pick   = pick
 
     async def on_submit(self, interaction: discord.Interaction) -> None:
-        raw = self.amount_input.value.strip().lstrip("$")
-        try:
-            amount = int(raw)
-        except ValueError:
+        amount = parse_wager(self.amount_input.value)
+        if amount is None:
             await interaction.response.send_message("Invalid amount — enter a whole number.", ephemeral=True)
             return
         if amount <= 0:
@@ -3052,7 +3174,7 @@ class RawMarketBetModal(discord.ui.Modal, title="Place Bet"):
 
         m    = self.market
         pick = self.pick
-        shown_yes = float(m.get("yes_ask_dollars") or m.get("last_price_dollars") or 0)
+        shown_yes = market_yes_price(m)
 
         # Pull the live price so the review (and the eventual fill) uses a current
         # number, not the possibly-stale one from the list cache.
@@ -3104,7 +3226,7 @@ class ParlayMarketDetailView(discord.ui.View):
         yes_sub = m.get("yes_sub_title") or ""
         exp     = m.get("expected_expiration_time") or m.get("close_time") or ""
         sport   = _series_label(m.get("series_ticker") or "")
-        time_str = _format_game_time(exp) if exp else "TBD"
+        time_str = format_game_time_with_label(exp)
         yes_am, no_am = _market_odds_str(m)
         embed = discord.Embed(title=title, color=discord.Color.purple())
         if sport:
@@ -3146,7 +3268,7 @@ class ParlayPickButton(discord.ui.Button):
             await interaction.response.send_message(f"Maximum {MAX_PARLAY_LEGS} legs allowed.", ephemeral=True)
             return
 
-        yes_ask = float(m.get("yes_ask_dollars") or m.get("last_price_dollars") or 0)
+        yes_ask = market_yes_price(m)
         if self.pick == "yes":
             decimal_odds = round(1.0 / yes_ask, 3) if yes_ask > 0 else 2.0
         else:
@@ -3275,10 +3397,8 @@ class ParlayRemoveLegSelect(discord.ui.Select):
         self._legs = legs
         options = []
         for i, leg in enumerate(legs):
-            label = leg["pick_display"]
-            if len(label) > 94:
-                label = label[:91] + "..."
-            options.append(discord.SelectOption(label=f"Remove: {label}", value=str(i)))
+            label = truncate(f"Remove: {leg['pick_display']}")
+            options.append(discord.SelectOption(label=label, value=str(i)))
         super().__init__(placeholder="Remove a leg...", options=options, row=row)
 
     async def callback(self, interaction: discord.Interaction) -> None:
@@ -3321,10 +3441,8 @@ class ParlayAmountModal(discord.ui.Modal, title="Place Parlay"):
         self.legs = legs
 
     async def on_submit(self, interaction: discord.Interaction) -> None:
-        raw = self.amount_input.value.strip().lstrip("$")
-        try:
-            amount = int(raw)
-        except ValueError:
+        amount = parse_wager(self.amount_input.value)
+        if amount is None:
             await interaction.response.send_message("Invalid amount — enter a whole number.", ephemeral=True)
             return
         if amount <= 0:
@@ -3376,7 +3494,7 @@ class ParlayAmountModal(discord.ui.Modal, title="Place Parlay"):
 # ── Legacy Parlay Views (game-centric flow, kept for reference) ────────
 
 
-class KalshiParlayView(discord.ui.View):
+class KalshiParlayView(_MenuView):
     """Multi-step parlay builder using Kalshi markets."""
 
     def __init__(
@@ -3442,9 +3560,6 @@ class KalshiParlayView(discord.ui.View):
         embed.set_footer(text=" · ".join(footer_parts))
         return embed
 
-    async def on_timeout(self) -> None:
-        await _expire_menu(self)
-
 
 class KalshiParlayGameSelect(discord.ui.Select["KalshiParlayView"]):
     """Dropdown to pick a game for a parlay leg."""
@@ -3456,10 +3571,8 @@ class KalshiParlayGameSelect(discord.ui.Select["KalshiParlayView"]):
             game_id = g["id"]
             home = g.get("home_team", "?")
             away = g.get("away_team", "?")
-            label = format_matchup(home, away)
-            if len(label) > 100:
-                label = label[:97] + "..."
-            desc = _format_game_time(g.get("commence_time", ""), g.get("sport_key", ""))
+            label = truncate(format_matchup(home, away))
+            desc = format_game_time_with_label(g.get("commence_time", ""), g.get("sport_key", ""))
             if len(desc) > 100:
                 desc = desc[:100]
             self.games_map[game_id] = g
@@ -3488,7 +3601,7 @@ class KalshiParlayGameSelect(discord.ui.Select["KalshiParlayView"]):
 
         # Build bet type selection for this game
         bet_view = KalshiParlayBetTypeView(game, parsed, view)
-        time_str = _format_game_time(game.get("commence_time", ""), game.get("sport_key", ""))
+        time_str = format_game_time_with_label(game.get("commence_time", ""), game.get("sport_key", ""))
         embed = discord.Embed(
             title="Add Parlay Leg",
             description=f"**{format_matchup(home, away)}**\n{time_str}\n\nPick a bet type:",
@@ -3632,10 +3745,8 @@ class KalshiParlayRemoveLegSelect(discord.ui.Select["KalshiParlayView"]):
     def __init__(self, legs: list[dict], row: int) -> None:
         options = []
         for i, leg in enumerate(legs):
-            label = leg["pick_display"]
-            if len(label) > 100:
-                label = label[:97] + "..."
-            options.append(discord.SelectOption(label=f"Remove: {label}", value=str(i)))
+            label = truncate(f"Remove: {leg['pick_display']}")
+            options.append(discord.SelectOption(label=label, value=str(i)))
         super().__init__(placeholder="Remove a leg...", options=options, row=row)
 
     async def callback(self, interaction: discord.Interaction) -> None:
@@ -3700,10 +3811,8 @@ class KalshiParlayAmountModal(discord.ui.Modal, title="Place Parlay"):
         self.parlay_view = parlay_view
 
     async def on_submit(self, interaction: discord.Interaction) -> None:
-        raw = self.amount_input.value.strip().lstrip("$")
-        try:
-            amount = int(raw)
-        except ValueError:
+        amount = parse_wager(self.amount_input.value)
+        if amount is None:
             await interaction.response.send_message("Invalid amount — enter a whole number.", ephemeral=True)
             return
         if amount <= 0:
@@ -3776,6 +3885,7 @@ class _StupidPoorChannelView(discord.ui.View):
             return
         await _m.get_or_create_user(self.user_id)
         new_bal = await _m.set_user_balance(self.user_id, 100)
+        wallet_service.invalidate_balance(self.user_id)
         button.disabled = True
         self.stop()
         await interaction.response.edit_message(
@@ -3807,6 +3917,7 @@ class _CashOutConfirmView(discord.ui.View):
                 view=None,
             )
             return
+        wallet_service.invalidate_balance(user_id)
 
         delta = self.cashout - self.wagered
         sign = "+" if delta >= 0 else ""
@@ -3838,11 +3949,8 @@ class _KalshiCashOutSelect(discord.ui.Select["_KalshiCashOutView"]):
             pick_label = bet.get("pick_display") or bet["pick"].upper()
             delta = cashout - bet["amount"]
             sign = "+" if delta >= 0 else ""
-            label = f"#{bet['id']} · {pick_label} · ${cashout:.2f} ({sign}${delta:.2f})"
-            if len(label) > 100:
-                label = label[:97] + "..."
-            title = bet.get("title") or bet["market_ticker"]
-            desc = title[:100] if len(title) <= 100 else title[:97] + "..."
+            label = truncate(f"#{bet['id']} · {pick_label} · ${cashout:.2f} ({sign}${delta:.2f})")
+            desc = truncate(bet.get("title") or bet["market_ticker"])
             options.append(
                 discord.SelectOption(label=label, value=str(bet["id"]), description=desc)
             )
@@ -3875,7 +3983,7 @@ class _KalshiCashOutSelect(discord.ui.Select["_KalshiCashOutView"]):
         await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
 
 
-class _KalshiCashOutView(discord.ui.View):
+class _KalshiCashOutView(_MenuView):
     """Attached to the /mybets response; lets users cash out individual Kalshi bets."""
 
     def __init__(self, user_id: int, bets_with_cashout: list[tuple[dict, int]]) -> None:
@@ -3883,14 +3991,40 @@ class _KalshiCashOutView(discord.ui.View):
         self.message: discord.Message | None = None
         self.add_item(_KalshiCashOutSelect(user_id, bets_with_cashout))
 
-    async def on_timeout(self) -> None:
-        await _expire_menu(self)
-
 
 # ── Cog ───────────────────────────────────────────────────────────────
 
 
-class HistoryView(discord.ui.View):
+# Resolution announcement: result → icon / result text.
+ICONS = {"won": "\U0001f7e2", "push": "\U0001f535", "lost": "\U0001f534"}
+RESULT_FMT: dict[str, Callable[[dict], str]] = {
+    "won": lambda b: f"Won **${b['payout']:.2f}**",
+    "push": lambda b: f"Push (${b['payout']:.2f} refunded)",
+    "lost": lambda b: "Lost",
+}
+
+# Leg status icons in the results-channel parlay summary (pending → hourglass).
+_LEG_RESULT_ICONS = {"won": "\u2705", "lost": "\u274c"}
+_LEG_PENDING_ICON = "\u23f3"
+
+
+def _potential_payout(b: dict) -> float:
+    """A pending bet's stored potential payout, or amount × odds if it has none."""
+    payout = b.get("potential_payout")
+    return payout if payout is not None else round(b["amount"] * b["odds"], 2)
+
+
+# Legacy bet status → (icon, status text formatter), shared by /mybets and
+# /myhistory so each row is a single dict lookup instead of an if/elif chain.
+STATUS_RENDER: dict[str, tuple[str, Callable[[dict], str]]] = {
+    "won": ("\U0001f7e2", lambda b: f"Won — **${b.get('payout', 0):.2f}**"),
+    "lost": ("\U0001f534", lambda b: "Lost"),
+    "push": ("\U0001f535", lambda b: f"Push — **${b.get('payout', 0):.2f}** refunded"),
+    "pending": ("\U0001f7e1", lambda b: f"Pending — potential **${_potential_payout(b):.2f}**"),
+}
+
+
+class HistoryView(_MenuView):
     """Paginated view for /myhistory showing resolved bets with stats."""
 
     PAGE_SIZE = 10
@@ -3951,16 +4085,8 @@ class HistoryView(discord.ui.View):
         return embed
 
     def _add_bet_field(self, embed: discord.Embed, b: dict) -> None:
-        status = b["status"]
-        if status == "won":
-            icon = "\U0001f7e2"
-            status_text = f"Won — **${b.get('payout', 0):.2f}**"
-        elif status == "push":
-            icon = "\U0001f535"
-            status_text = f"Push — **${b.get('payout', 0):.2f}** refunded"
-        else:
-            icon = "\U0001f534"
-            status_text = "Lost"
+        icon, fmt = STATUS_RENDER.get(b["status"], STATUS_RENDER["lost"])
+        status_text = fmt(b)
 
         is_outright = (b.get("market") or "") == "outrights"
         home = b.get("home_team")
@@ -4107,13 +4233,35 @@ class HistoryView(discord.ui.View):
         except discord.NotFound:
             pass
 
-    async def on_timeout(self) -> None:
-        await _expire_menu(self)
+
+# In-memory market status cache shared by /mybets and the resolution loop.
+# Settled markets never change again, so they're kept much longer.
+STATUS_TTL_PENDING = 30  # seconds
+STATUS_TTL_COMPLETED = 900  # seconds
+_SETTLED_STATUSES = ("settled", "finalized")
+SPORTS_CACHE_TTL = 300  # seconds — SPORTS is rediscovered periodically
+# Settled markets with no usable result are rechecked on this slower cadence.
+UNRESOLVABLE_RECHECK = 1800  # seconds
+STATUS_FETCH_CONCURRENCY = 8
+STATUS_FETCH_TIMEOUT = 10  # seconds per market
+
+
+def _status_ttl(market: dict | None) -> int:
+    if market and market.get("status") in _SETTLED_STATUSES:
+        return STATUS_TTL_COMPLETED
+    return STATUS_TTL_PENDING
 
 
 class KalshiCog(commands.Cog):
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
+        self._status_cache: dict[str, tuple[float, dict | None]] = {}
+        self._status_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        # (fetched_at, rows) for sport_autocomplete; rows are
+        # (key, choice_name, label_lower, key_lower, is_futures).
+        self._sports_cache: tuple[float, list[tuple[str, str, str, str, bool]]] | None = None
+        # ticker -> monotonic time we last saw it settled without a usable result
+        self._unresolvable: dict[str, float] = {}
 
     async def cog_load(self) -> None:
         log.info("KalshiCog loading — refreshing sports...")
@@ -4129,10 +4277,61 @@ class KalshiCog(commands.Cog):
         self.refresh_discovery.cancel()
         self.refresh_sports_loop.cancel()
         self.db_maintenance.cancel()
-        await kalshi_api.close()
+        # kalshi_api's session is shared with the web dashboard and outlives
+        # cog reloads; BookieBot.close() shuts it down.
+
+    # ── Market status cache ───────────────────────────────────────────
+
+    async def _cached_status(self, ticker: str) -> dict | None:
+        """Return ``kalshi_api.get_market(ticker)``, memoized in memory.
+
+        Concurrent misses for the same ticker share a single upstream fetch.
+        """
+        hit = self._status_cache.get(ticker)
+        if hit is not None and monotonic() - hit[0] < _status_ttl(hit[1]):
+            return hit[1]
+        async with self._status_locks[ticker]:
+            # Another caller may have filled the entry while we waited.
+            hit = self._status_cache.get(ticker)
+            if hit is not None and monotonic() - hit[0] < _status_ttl(hit[1]):
+                return hit[1]
+            market = await kalshi_api.get_market(ticker)
+            now = monotonic()
+            self._purge_status_cache(now)
+            self._status_cache[ticker] = (now, market)
+        return market
+
+    def _purge_status_cache(self, now: float) -> None:
+        """Drop entries older than the longest TTL so the cache stays bounded."""
+        stale = [
+            t for t, (ts, _) in self._status_cache.items()
+            if now - ts >= STATUS_TTL_COMPLETED
+        ]
+        for t in stale:
+            del self._status_cache[t]
+            lock = self._status_locks.get(t)
+            if lock is not None and not lock.locked():
+                del self._status_locks[t]
 
     # ── Sport autocomplete ────────────────────────────────────────────
 
+    def _sport_choice_rows(self) -> list[tuple[str, str, str, str, bool]]:
+        """Lowercased sport/futures labels, rebuilt at most every SPORTS_CACHE_TTL."""
+        now = monotonic()
+        if self._sports_cache and now - self._sports_cache[0] < SPORTS_CACHE_TTL:
+            return self._sports_cache[1]
+        rows = [
+            (key, sport["label"], sport["label"].lower(), key.lower(), False)
+            for key, sport in SPORTS.items()
+        ]
+        # Futures-only sports (e.g. Boxing)
+        rows.extend(
+            (key, f"{fut['label']} (Futures)", fut["label"].lower(), key.lower(), True)
+            for key, fut in FUTURES.items()
+        )
+        self._sports_cache = (now, rows)
+        return rows
+
     async def sport_autocomplete(
         self, interaction: discord.Interaction, current: str
     ) -> list[app_commands.Choice[str]]:
@@ -4140,23 +4339,12 @@ class KalshiCog(commands.Cog):
         seen = set()
         current_lower = current.lower()
 
-        # Include game sports
-        for key, sport in SPORTS.items():
-            label = sport["label"]
-            if current_lower in label.lower() or current_lower in key.lower():
-                choices.append(app_commands.Choice(name=label, value=key))
+        for key, name, label_lower, key_lower, is_futures in self._sport_choice_rows():
+            if is_futures and key in seen:
+                continue
+            if current_lower in label_lower or current_lower in key_lower:
+                choices.append(app_commands.Choice(name=name, value=key))
                 seen.add(key)
-            if len(choices) >= 25:
-                break
-
-        # Include futures-only sports (e.g. Boxing)
-        if len(choices) < 25:
-            for key, fut in FUTURES.items():
-                if key in seen:
-                    continue
-                label = fut["label"]
-                if current_lower in label.lower() or current_lower in key.lower():
-                    choices.append(app_commands.Choice(name=f"{label} (Futures)", value=key))
                 if len(choices) >= 25:
                     break
 
@@ -4239,11 +4427,7 @@ class KalshiCog(commands.Cog):
 
         # Search provided — filter markets then show game list for that sport/keyword
         search_lower = search.lower().strip()
-        series_label_map: dict[str, str] = {}
-        for sk, info in SPORTS.items():
-            label_lower = info.get("label", "").lower()
-            for ticker in info["series"].values():
-                series_label_map[ticker] = label_lower
+        series_label_map = {t: label.lower() for t, label in SERIES_LABELS.items()}
 
         def _st(m: dict) -> str:
             st = m.get("series_ticker") or ""
@@ -4260,7 +4444,7 @@ class KalshiCog(commands.Cog):
             or search_lower in (m.get("yes_sub_title") or "").lower()
             or search_lower in series_label_map.get(_st(m).upper(), "")
             or search_lower in _st(m)
-            or (target_emoji is not None and _sport_emoji(_st(m).upper()) == target_emoji)
+            or (target_emoji is not None and _sport_emoji(_st(m)) == target_emoji)
         ]
         log.info("/bet search=%r: %d filtered results", search, len(markets))
         if not markets:
@@ -4295,11 +4479,7 @@ class KalshiCog(commands.Cog):
 
         if sport:
             sport_lower = sport.lower().strip()
-            series_label_map: dict[str, str] = {}
-            for sk, info in SPORTS.items():
-                label_lower = info.get("label", "").lower()
-                for ticker in info["series"].values():
-                    series_label_map[ticker] = label_lower
+            series_label_map = {t: label.lower() for t, label in SERIES_LABELS.items()}
             target_emoji = _SPORT_ALIASES.get(sport_lower)
             all_markets = [
                 m for m in all_markets
@@ -4308,7 +4488,7 @@ class KalshiCog(commands.Cog):
                 or sport_lower in series_label_map.get(_market_series_ticker(m).upper(), "")
                 or sport_lower in _market_series_ticker(m)
                 or (target_emoji is not None
-                    and _sport_emoji(_market_series_ticker(m).upper()) == target_emoji)
+                    and _sport_emoji(_market_series_ticker(m)) == target_emoji)
             ]
 
         markets = [m for m in all_markets if _is_close_market(m, max_pct)]
@@ -4351,11 +4531,7 @@ class KalshiCog(commands.Cog):
 
         # Sport filter provided — jump straight to that sport's game list
         sport_lower = sport.lower().strip()
-        series_label_map: dict[str, str] = {}
-        for sk, info in SPORTS.items():
-            label_lower = info.get("label", "").lower()
-            for ticker in info["series"].values():
-                series_label_map[ticker] = label_lower
+        series_label_map = {t: label.lower() for t, label in SERIES_LABELS.items()}
         target_emoji = _SPORT_ALIASES.get(sport_lower)
         markets = [
             m for m in all_markets
@@ -4364,7 +4540,7 @@ class KalshiCog(commands.Cog):
             or sport_lower in series_label_map.get(_market_series_ticker(m).upper(), "")
             or sport_lower in _market_series_ticker(m)
             or (target_emoji is not None
-                and _sport_emoji(_market_series_ticker(m).upper()) == target_emoji)
+                and _sport_emoji(_market_series_ticker(m)) == target_emoji)
         ]
         if not markets:
             await interaction.followup.send(f"No markets found for **{sport}**.")
@@ -4445,15 +4621,7 @@ class KalshiCog(commands.Cog):
 
             leg_lines = []
             for leg in p.get("legs", []):
-                ls = leg["status"]
-                if ls == "won":
-                    leg_icon = "\U0001f7e2"
-                elif ls == "lost":
-                    leg_icon = "\U0001f534"
-                elif ls == "push":
-                    leg_icon = "\U0001f535"
-                else:
-                    leg_icon = "\U0001f7e1"
+                leg_icon = STATUS_RENDER.get(leg["status"], STATUS_RENDER["pending"])[0]
                 home = leg.get("home_team") or "?"
                 away = leg.get("away_team") or "?"
                 pick_label = PICK_LABELS.get(leg["pick"], leg["pick"])
@@ -4624,9 +4792,8 @@ class KalshiCog(commands.Cog):
         fields: list[tuple[datetime | None, str, str]] = []
 
         for b in bets:
-            potential = round(b["amount"] * b["odds"], 2)
-            icon = "\U0001f7e1"  # yellow circle
-            status_text = f"Pending — potential **${potential:.2f}**"
+            icon, fmt = STATUS_RENDER[b["status"]]
+            status_text = fmt(b)
 
             home = b.get("home_team")
             away = b.get("away_team")
@@ -4638,8 +4805,7 @@ class KalshiCog(commands.Cog):
             elif home and away:
                 matchup = format_matchup(home, away)
             else:
-                raw_id = b["game_id"].split("|")[0] if "|" in b["game_id"] else b["game_id"]
-                matchup = f"Game `{raw_id}`"
+                matchup = f"Game `{b['_event_id']}`"
 
             sport_line = f"{sport} · " if sport and not is_outright else ""
             pick_label = b["pick"] if is_outright else format_pick_label(b)
@@ -4667,15 +4833,7 @@ class KalshiCog(commands.Cog):
             leg_lines = []
             leg_dts: list[datetime] = []
             for leg in p.get("legs", []):
-                ls = leg["status"]
-                if ls == "won":
-                    leg_icon = "\U0001f7e2"
-                elif ls == "lost":
-                    leg_icon = "\U0001f534"
-                elif ls == "push":
-                    leg_icon = "\U0001f535"
-                else:
-                    leg_icon = "\U0001f7e1"
+                leg_icon = STATUS_RENDER.get(leg["status"], STATUS_RENDER["pending"])[0]
 
                 home = leg.get("home_team") or "?"
                 away = leg.get("away_team") or "?"
@@ -4710,7 +4868,7 @@ class KalshiCog(commands.Cog):
         cashout_pairs: list[tuple[dict, int]] = []
         if kalshi_bets:
             tickers = list({kb["market_ticker"] for kb in kalshi_bets})
-            fetched = await asyncio.gather(*[kalshi_api.get_market(t) for t in tickers], return_exceptions=True)
+            fetched = await asyncio.gather(*[self._cached_status(t) for t in tickers], return_exceptions=True)
             market_map: dict[str, dict] = {}
             for ticker, result in zip(tickers, fetched):
                 if isinstance(result, dict) and result:
@@ -4731,8 +4889,9 @@ class KalshiCog(commands.Cog):
             if close_dt is None and market:
                 close_dt = _parse_iso_dt(_earliest_market_time(market))
             event_ticker = kb.get("event_ticker", "")
-            ticker_date = _parse_event_ticker_date(event_ticker) if event_ticker else None
-            sort_dt = close_dt or ticker_date
+            sort_dt = close_dt
+            if sort_dt is None and event_ticker:
+                sort_dt = _parse_event_ticker_date(event_ticker)
 
             # Icon and ETA line
             if sort_dt and sort_dt <= now:
@@ -4838,17 +4997,11 @@ class KalshiCog(commands.Cog):
         try:
             numeric_id = int(bet_id)
             # Look up the bet to check game status
-            bets = await betting_service.get_user_bets(interaction.user.id)
-            target = next((b for b in bets if b["id"] == numeric_id), None)
+            target = await betting_service.get_bet(numeric_id, interaction.user.id)
 
             if target:
-                # Parse composite game_id
-                parts = target["game_id"].split("|")
-                event_id = parts[0]
-                sport_key = parts[1] if len(parts) > 1 else None
-
-                status = await self.sports_api.get_fixture_status(event_id, sport_key)
-                if status and status["started"]:
+                start_dt = _parse_iso_dt(target.get("commence_time"))
+                if start_dt and start_dt <= datetime.now(timezone.utc):
                     await interaction.followup.send(
                         "Cannot cancel — this game has already started.", ephemeral=True
                     )
@@ -4881,6 +5034,8 @@ class KalshiCog(commands.Cog):
         game_ids = await betting_service.get_pending_game_ids()
 
         embed = discord.Embed(title="Pending Bets", color=discord.Color.orange())
+        # One clock read for every LIVE check below
+        now = datetime.now(timezone.utc)
 
         for composite_id in game_ids[:15]:
             bets = await betting_service.get_bets_by_game(composite_id)
@@ -4914,15 +5069,15 @@ class KalshiCog(commands.Cog):
             ct = first.get("commence_time")
             if ct:
                 try:
-                    ct_dt = datetime.fromisoformat(ct.replace("Z", "+00:00"))
-                    if ct_dt <= datetime.now(timezone.utc):
+                    ct_dt = parse_iso_utc(ct)
+                    if ct_dt <= now:
                         time_str = " \U0001f534 LIVE"
                     else:
                         time_str = f"\n{format_game_time(ct)}"
                 except (ValueError, TypeError):
                     pass
 
-            raw_id = composite_id.split("|")[0] if "|" in composite_id else composite_id
+            raw_id = first["_event_id"]
             header = f"{matchup} ({len(bets)} bet{'s' if len(bets) != 1 else ''} · ${total_wagered:.2f}){time_str}"
             value = "\n".join(lines) + f"\nID: `{raw_id}`"
 
@@ -4966,15 +5121,12 @@ class KalshiCog(commands.Cog):
             total_kalshi_wagered = 0
             for kb in kalshi_bets[:20]:
                 pick_display = kb.get("pick_display") or kb["pick"]
-                title = kb.get("title") or kb["market_ticker"]
-                if len(title) > 40:
-                    title = title[:37] + "..."
+                title = truncate(kb.get("title") or kb["market_ticker"], 40)
                 # Parse game time from event ticker
                 time_info = ""
                 et = kb.get("event_ticker", "")
                 ticker_date = _parse_event_ticker_date(et) if et else None
                 if ticker_date:
-                    now = datetime.now(timezone.utc)
                     if ticker_date.date() < now.date():
                         time_info = " \U0001f534 LIVE"
                     else:
@@ -5054,9 +5206,8 @@ class KalshiCog(commands.Cog):
     ) -> None:
         await interaction.response.defer(ephemeral=True)
 
-        # Find any pending bets matching this game_id (full or partial match)
-        pending_ids = await betting_service.get_pending_game_ids()
-        matching = [gid for gid in pending_ids if game_id in gid]
+        # Find pending bets for this event (bare event ID or full composite ID)
+        matching = await betting_service.get_pending_composites_for(game_id)
 
         if not matching:
             await interaction.followup.send(
@@ -5064,14 +5215,11 @@ class KalshiCog(commands.Cog):
             )
             return
 
-        all_resolved: list[dict] = []
-        for composite_id in matching:
-            resolved = await betting_service.resolve_game(
-                composite_id, winner.value,
-                home_score=home_score, away_score=away_score,
-                winner_name=winner_name,
-            )
-            all_resolved.extend(resolved)
+        all_resolved = await betting_service.resolve_games(
+            matching, winner.value,
+            home_score=home_score, away_score=away_score,
+            winner_name=winner_name,
+        )
         total_resolved = len(all_resolved)
 
         if all_resolved:
@@ -5183,27 +5331,22 @@ class KalshiCog(commands.Cog):
             color=discord.Color.blue(),
         )
 
-        lines = []
-        single_bets = [b for b in resolved_bets if b.get("type") != "parlay"]
-        for bet in single_bets:
-            result = bet["result"]
-            if result == "won":
-                icon = "\U0001f7e2"
-                result_text = f"Won **${bet['payout']:.2f}**"
-            elif result == "push":
-                icon = "\U0001f535"
-                result_text = f"Push (${bet['payout']:.2f} refunded)"
-            else:
-                icon = "\U0001f534"
-                result_text = "Lost"
+        # Bets on one game mostly share a handful of users, so look each
+        # balance up once rather than once per bet.
+        user_ids = list({b["user_id"] for b in resolved_bets})
+        balances = dict(zip(user_ids, await asyncio.gather(
+            *(wallet_service.get_balance(uid) for uid in user_ids)
+        )))
 
+        def _bet_line(bet: dict) -> str:
+            result = bet["result"]
             pick_label = format_pick_label(bet) if not is_outright else bet["pick"]
-            new_bal = await wallet_service.get_balance(bet["user_id"])
-            lines.append(
-                f"{icon} <@{bet['user_id']}> — {pick_label} · "
-                f"${bet['amount']:.2f} @ {bet['odds']}x → {result_text} · bal: **${new_bal:.2f}**"
+            return (
+                f"{ICONS[result]} <@{bet['user_id']}> — {pick_label} · "
+                f"${bet['amount']:.2f} @ {bet['odds']}x → {RESULT_FMT[result](bet)} · bal: **${balances[bet['user_id']]:.2f}**"
             )
 
+        lines = [_bet_line(b) for b in resolved_bets if b.get("type") != "parlay"]
         if lines:
             embed.add_field(name="Bets", value="\n".join(lines), inline=False)
 
@@ -5213,22 +5356,16 @@ class KalshiCog(commands.Cog):
             parlay_lines = []
             for p in parlay_entries:
                 result = p["result"]
-                if result == "won":
-                    icon = "\U0001f7e2"
-                    result_text = f"Won **${p['payout']:.2f}**"
-                else:
-                    icon = "\U0001f534"
-                    result_text = "Lost"
+                icon = ICONS[result]
+                result_text = RESULT_FMT[result](p)
                 # Build leg summary with team names
-                leg_parts = []
-                for leg in p.get("legs", []):
-                    h = leg.get("home_team") or "?"
-                    a = leg.get("away_team") or "?"
-                    pick_label = format_pick_label(leg)
-                    leg_icon = "\u2705" if leg.get("status") == "won" else "\u274c" if leg.get("status") == "lost" else "\u23f3"
-                    leg_parts.append(f"  {leg_icon} {format_matchup(h, a)} — {pick_label}")
-                legs_text = "\n".join(leg_parts)
-                new_bal = await wallet_service.get_balance(p["user_id"])
+                legs_text = "\n".join(
+                    f"  {_LEG_RESULT_ICONS.get(leg.get('status'), _LEG_PENDING_ICON)} "
+                    f"{format_matchup(leg.get('home_team') or '?', leg.get('away_team') or '?')}"
+                    f" — {format_pick_label(leg)}"
+                    for leg in p.get("legs", [])
+                )
+                new_bal = balances[p["user_id"]]
                 parlay_lines.append(
                     f"{icon} <@{p['user_id']}> — Parlay #{p['id']} · "
                     f"${p['amount']:.2f} @ {p.get('total_odds', 0):.2f}x → {result_text} · bal: **${new_bal:.2f}**\n{legs_text}"
@@ -5271,14 +5408,14 @@ class KalshiCog(commands.Cog):
                 no_close.append(m)
                 continue
             try:
-                close_dt = datetime.fromisoformat(close_str.replace("Z", "+00:00"))
+                close_dt = parse_iso_utc(close_str)
             except (ValueError, TypeError):
                 no_close.append(m)
                 continue
             if close_dt > now:
                 upcoming.append((close_dt, m))
 
-        upcoming.sort(key=lambda t: t[0])
+        upcoming.sort(key=itemgetter(0))
         closing_soon = [m for _, m in upcoming] + no_close
 
         if not closing_soon:
@@ -5374,14 +5511,22 @@ class KalshiCog(commands.Cog):
         self._kalshi_check_count = getattr(self, "_kalshi_check_count", 0) + 1
         full_sweep = self._kalshi_check_count % 5 == 0
 
+        # Forget tickers that are no longer pending
+        mono_now = monotonic()
+        for t in [t for t in self._unresolvable if t not in all_pending_map]:
+            del self._unresolvable[t]
+
         # Determine which tickers to check this iteration
         tickers: list[str] = []
         for ticker, ct in all_pending_map.items():
+            seen_at = self._unresolvable.get(ticker)
+            if seen_at is not None and mono_now - seen_at < UNRESOLVABLE_RECHECK:
+                continue
             if full_sweep or not ct:
                 tickers.append(ticker)
                 continue
             try:
-                close_dt = datetime.fromisoformat(ct.replace("Z", "+00:00"))
+                close_dt = parse_iso_utc(ct)
             except (ValueError, TypeError):
                 tickers.append(ticker)
                 continue
@@ -5398,14 +5543,29 @@ class KalshiCog(commands.Cog):
         if BET_RESULTS_CHANNEL_ID:
             channel = self.bot.get_channel(BET_RESULTS_CHANNEL_ID)
 
-        for ticker in tickers:
+        # Fetch statuses concurrently so one slow market can't stall the tick.
+        # Settlement below stays sequential: parlays can span several tickers.
+        sem = asyncio.Semaphore(STATUS_FETCH_CONCURRENCY)
+
+        async def _fetch(ticker: str) -> dict | None:
+            async with sem:
+                try:
+                    return await asyncio.wait_for(self._cached_status(ticker), STATUS_FETCH_TIMEOUT)
+                except asyncio.TimeoutError:
+                    log.warning("Timed out fetching Kalshi market %s", ticker)
+                except Exception:
+                    log.exception("Error fetching Kalshi market %s", ticker)
+                return None
+
+        markets = await asyncio.gather(*(_fetch(t) for t in tickers))
+
+        for ticker, market in zip(tickers, markets):
             try:
-                market = await kalshi_api.get_market(ticker)
                 if not market:
                     continue
 
                 status = market.get("status", "")
-                if status not in ("settled", "finalized"):
+                if status not in _SETTLED_STATUSES:
                     continue
 
                 settlement = market.get("settlement_value_dollars")
@@ -5416,13 +5576,16 @@ class KalshiCog(commands.Cog):
                     elif result_val == "no":
                         winning_side = "no"
                     else:
+                        self._unresolvable[ticker] = mono_now
                         continue
                 else:
                     try:
                         sv = float(settlement)
                     except (ValueError, TypeError):
+                        self._unresolvable[ticker] = mono_now
                         continue
                     winning_side = "yes" if sv >= 0.99 else "no"
+                self._unresolvable.pop(ticker, None)
 
                 bets = await models.get_pending_kalshi_bets_by_market(ticker)
                 board_before = await leaderboard_notifier.snapshot()
@@ -5431,6 +5594,7 @@ class KalshiCog(commands.Cog):
                     won = bet["pick"] == winning_side
                     payout = round(bet["amount"] * bet["odds"], 2) if won else 0
                     await models.resolve_kalshi_bet(bet["id"], won, payout)
+                    wallet_service.invalidate_balance(bet["user_id"])
                     if won:
                         await leaderboard_notifier.notify_if_passed(bet["user_id"], round(payout), board_before, "sports betting")
                     else:
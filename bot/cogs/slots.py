@@ -227,16 +227,15 @@ class _SlotsView(discord.ui.View):
             await interaction.response.send_message("This machine is taken.", ephemeral=True)
             return
 
-        new_bal = await wallet_service.withdraw(self.user.id, self.cost)
-        if new_bal is None:
-            bal = await wallet_service.get_balance(self.user.id)
+        ok, bal = await wallet_service.try_withdraw(self.user.id, self.cost)
+        if not ok:
             await interaction.response.send_message(
                 f"Not enough to spin. Balance: **${bal:,}** (need **${self.cost:,}**)",
                 ephemeral=True,
             )
             return
 
-        self.balance = new_bal
+        self.balance = bal
         self.spin_cost = self.cost
         self.phase = "spinning"
         self.wins = []
@@ -24,8 +24,10 @@ class _StupidPoorView(discord.ui.View):
         if interaction.user.id != self.user_id:
             await interaction.response.send_message("This isn't for you.", ephemeral=True)
             return
+        await interaction.response.defer()
         await models.get_or_create_user(self.user_id)
         new_bal, count = await models.record_bankruptcy(self.user_id)
+        wallet_service.invalidate_balance(self.user_id)
         button.disabled = True
         self.stop()
         if count == 1:
@@ -40,7 +42,7 @@ class _StupidPoorView(discord.ui.View):
             msg = f"#{count}. **${new_bal:.0f}**. This is getting sad."
         else:
             msg = f"#{count}. **${new_bal:.0f}**. You are beyond help."
-        await interaction.response.edit_message(content=msg, view=self)
+        await interaction.edit_original_response(content=msg, view=self)
 
 
 class Wallet(commands.Cog):
@@ -70,9 +72,12 @@ class Wallet(commands.Cog):
 
     @app_commands.command(name="leaderboard", description="Top 10 richest users")
     async def leaderboard(self, interaction: discord.Interaction) -> None:
+        # Both queries sum every user's pending bets and retry on a locked DB,
+        # which can outlast the 3s response window
+        await interaction.response.defer()
         top = await models.get_leaderboard(10)
         if not top:
-            await interaction.response.send_message("No users yet.")
+            await interaction.followup.send("No users yet.")
             return
 
         lines = []
@@ -88,7 +93,7 @@ class Wallet(commands.Cog):
         content = "\n".join(lines)
         if user_rank is not None:
             content += f"\n\nYour rank: **#{user_rank}**"
-        await interaction.response.send_message(
+        await interaction.followup.send(
             content, allowed_mentions=discord.AllowedMentions.none()
         )
 
@@ -117,6 +122,7 @@ class Wallet(commands.Cog):
 
         await models.get_or_create_user(user.id)
         new_bal = await models.set_user_balance(user.id, amount)
+        wallet_service.invalidate_balance(user.id)
         log.info("Mayor %s set %s's balance to $%d", interaction.user, user, new_bal)
         await interaction.response.send_message(
             f"Set {user.mention}'s balance to **${new_bal:,}**.", ephemeral=True
@@ -156,6 +162,7 @@ class Wallet(commands.Cog):
         await interaction.response.defer(ephemeral=True)
 
         count = await models.reset_all_balances(reset_amount)
+        wallet_service.invalidate_balance()
         log.info(
             "Mayor %s reset all balances to $%d (%d users affected)",
             interaction.user, reset_amount, count,
@@ -205,6 +212,7 @@ class Wallet(commands.Cog):
         await interaction.response.defer()
 
         count, total_removed = await models.devalue_all_balances(percent)
+        wallet_service.invalidate_balance()
         log.info(
             "Mayor %s devalued currency by %d%% (%d users, $%d removed)",
             interaction.user, percent, count, total_removed,
@@ -237,6 +245,7 @@ class Wallet(commands.Cog):
     async def fixbalances(self, interaction: discord.Interaction) -> None:
         await interaction.response.defer(ephemeral=True)
         count = await models.fix_fractional_balances()
+        wallet_service.invalidate_balance()
         log.info("Mayor %s fixed fractional balances (%d rows)", interaction.user, count)
         await interaction.followup.send(
             f"Fixed fractional balances for **{count}** user(s).", ephemeral=True
@@ -159,6 +159,13 @@ CREATE TABLE IF NOT EXISTS game_stats (
     total_returned REAL NOT NULL DEFAULT 0,
     PRIMARY KEY (discord_id, game)
 );
+
+CREATE TABLE IF NOT EXISTS wallet_reservations (
+    id         INTEGER PRIMARY KEY AUTOINCREMENT,
+    discord_id INTEGER NOT NULL REFERENCES users(discord_id),
+    amount     REAL    NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
 """
 
 
@@ -182,9 +189,16 @@ MIGRATIONS = [
     "ALTER TABLE kalshi_bets ADD COLUMN pick_display TEXT",
     "ALTER TABLE kalshi_series ADD COLUMN subcategory TEXT",
     "ALTER TABLE users ADD COLUMN bankruptcy_count INTEGER NOT NULL DEFAULT 0",
+    "ALTER TABLE bets ADD COLUMN potential_payout REAL",
     # kalshi_parlays and kalshi_parlay_legs created in schema above
 ]
 
+# One-off data fills, run only on the boot whose migration adds the column
+BACKFILLS = {
+    "ALTER TABLE bets ADD COLUMN potential_payout REAL":
+        "UPDATE bets SET potential_payout = ROUND(amount * odds, 2) WHERE potential_payout IS NULL",
+}
+
 
 async def init_db() -> None:
     is_new = not os.path.exists(DB_PATH)
@@ -195,7 +209,10 @@ async def init_db() -> None:
             try:
                 await db.execute(migration)
             except Exception:
-                pass  # column already exists
+                continue  # column already exists
+            backfill = BACKFILLS.get(migration)
+            if backfill:
+                await db.execute(backfill)
         await db.commit()
         
         # Automatic injection for fresh databases
@@ -45,6 +45,130 @@ async def update_balance(discord_id: int, delta: int) -> int:
         await db.close()
 
 
+async def _fetch_balance(db, discord_id: int) -> float:
+    cursor = await db.execute(
+        "SELECT balance FROM users WHERE discord_id = ?", (discord_id,)
+    )
+    row = await cursor.fetchone()
+    return row["balance"]
+
+
+@db_retry()
+async def reserve_funds(
+    discord_id: int, amount: float, reservation_id: int | None = None
+) -> tuple[int | None, float]:
+    """Move ``amount`` from a user's balance into a held reservation.
+
+    Adds to ``reservation_id`` if given, otherwise opens a new reservation;
+    a negative ``amount`` hands part of an existing hold back. Returns
+    ``(reservation_id, balance)``; the id is None if the balance (or the
+    hold) is too low, and the balance is current either way.
+    """
+    amount = round(amount, 2)
+    db = await get_connection()
+    try:
+        await db.execute(
+            "INSERT OR IGNORE INTO users (discord_id, balance) VALUES (?, ?)",
+            (discord_id, STARTING_BALANCE),
+        )
+        cursor = await db.execute(
+            "UPDATE users SET balance = balance - ? WHERE discord_id = ? AND balance >= ?",
+            (amount, discord_id, amount),
+        )
+        if cursor.rowcount == 0:
+            # Read before rolling back: the user row may have just been created
+            balance = await _fetch_balance(db, discord_id)
+            await db.rollback()
+            return None, balance
+        if reservation_id is None:
+            cursor = await db.execute(
+                "INSERT INTO wallet_reservations (discord_id, amount) VALUES (?, ?)",
+                (discord_id, amount),
+            )
+            reservation_id = cursor.lastrowid
+        else:
+            cursor = await db.execute(
+                "UPDATE wallet_reservations SET amount = amount + ? "
+                "WHERE id = ? AND discord_id = ? AND amount + ? >= 0",
+                (amount, reservation_id, discord_id, amount),
+            )
+            if cursor.rowcount == 0:
+                balance = await _fetch_balance(db, discord_id)
+                await db.rollback()
+                return None, balance + amount
+        balance = await _fetch_balance(db, discord_id)
+        await db.commit()
+        return reservation_id, balance
+    finally:
+        await db.close()
+
+
+@db_retry()
+async def settle_reservations(
+    settlements: list[tuple[int, float | None]],
+) -> dict[int, int]:
+    """Close ``(reservation_id, payout)`` holds in one transaction.
+
+    The payout is credited to the holder (0 for a loss); a payout of None
+    refunds the held amount. Unknown or already-closed reservations are
+    skipped. Returns ``{discord_id: new_balance}`` for the holders touched.
+    """
+    if not settlements:
+        return {}
+    db = await get_connection()
+    try:
+        users: set[int] = set()
+        for reservation_id, payout in settlements:
+            cursor = await db.execute(
+                "SELECT discord_id, amount FROM wallet_reservations WHERE id = ?",
+                (reservation_id,),
+            )
+            row = await cursor.fetchone()
+            if row is None:
+                continue
+            await db.execute(
+                "DELETE FROM wallet_reservations WHERE id = ?", (reservation_id,)
+            )
+            credit = row["amount"] if payout is None else payout
+            if credit:
+                await db.execute(
+                    "UPDATE users SET balance = balance + ? WHERE discord_id = ?",
+                    (round(credit, 2), row["discord_id"]),
+                )
+            users.add(row["discord_id"])
+        await db.commit()
+        if not users:
+            return {}
+        placeholders = ", ".join("?" * len(users))
+        cursor = await db.execute(
+            f"SELECT discord_id, balance FROM users WHERE discord_id IN ({placeholders})",
+            tuple(users),
+        )
+        rows = await cursor.fetchall()
+        return {row["discord_id"]: row["balance"] for row in rows}
+    finally:
+        await db.close()
+
+
+@db_retry()
+async def release_all_reservations() -> int:
+    """Refund every open reservation (e.g. tables left behind by a restart). Returns the count."""
+    db = await get_connection()
+    try:
+        await db.execute(
+            """UPDATE users SET balance = balance + (
+                   SELECT SUM(amount) FROM wallet_reservations r
+                   WHERE r.discord_id = users.discord_id
+               )
+               WHERE discord_id IN (SELECT discord_id FROM wallet_reservations)"""
+        )
+        cursor = await db.execute("DELETE FROM wallet_reservations")
+        await db.commit()
+        return cursor.rowcount
+    finally:
+        await db.close()
+
+
 @db_retry()
 @db_retry()
 async def record_bankruptcy(discord_id: int) -> tuple[int, int]:
@@ -97,9 +221,10 @@ async def create_bet(
     db = await get_connection()
     try:
         cursor = await db.execute(
-            "INSERT INTO bets (user_id, game_id, pick, amount, odds, home_team, away_team, sport_title, market, point, commence_time)"
-            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-            (user_id, game_id, pick, amount, odds, home_team, away_team, sport_title, market, point, commence_time),
+            "INSERT INTO bets (user_id, game_id, pick, amount, odds, home_team, away_team, sport_title, market, point, commence_time, potential_payout)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (user_id, game_id, pick, amount, odds, home_team, away_team, sport_title, market, point, commence_time,
+             round(amount * odds, 2)),
         )
         await db.commit()
         return cursor.lastrowid
@@ -142,6 +267,55 @@ async def get_pending_bets_by_game(game_id: str) -> list[dict]:
         await db.close()
 
 
+@db_retry()
+async def get_pending_bets_by_games(game_ids: list[str]) -> list[dict]:
+    if not game_ids:
+        return []
+    placeholders = ", ".join("?" * len(game_ids))
+    db = await get_connection()
+    try:
+        cursor = await db.execute(
+            f"SELECT * FROM bets WHERE game_id IN ({placeholders}) AND status = 'pending'",
+            tuple(game_ids),
+        )
+        rows = await cursor.fetchall()
+        return [dict(r) for r in rows]
+    finally:
+        await db.close()
+
+
+@db_retry()
+async def settle_bets(settlements: list[tuple[int, int, str, int]]) -> set[int]:
+    """Settle many pending bets in one transaction.
+
+    Each settlement is ``(bet_id, user_id, status, payout)``; the payout is
+    credited to the user. Bets no longer pending are skipped. Returns the IDs
+    that were actually settled.
+    """
+    settled: set[int] = set()
+    if not settlements:
+        return settled
+    db = await get_connection()
+    try:
+        for bet_id, user_id, status, payout in settlements:
+            cursor = await db.execute(
+                "UPDATE bets SET status = ?, payout = ? WHERE id = ? AND status = 'pending'",
+                (status, payout, bet_id),
+            )
+            if cursor.rowcount == 0:
+                continue
+            settled.add(bet_id)
+            if payout:
+                await db.execute(
+                    "UPDATE users SET balance = balance + ? WHERE discord_id = ?",
+                    (payout, user_id),
+                )
+        await db.commit()
+        return settled
+    finally:
+        await db.close()
+
+
 @db_retry()
 async def get_pending_game_ids() -> list[str]:
     db = await get_connection()
@@ -155,6 +329,30 @@ async def get_pending_game_ids() -> list[str]:
         await db.close()
 
 
+@db_retry()
+async def get_pending_game_ids_for_event(event_id: str) -> list[str]:
+    """Return pending composite game IDs (bets and parlay legs) for one event.
+
+    Matches the bare event ID or any ``"<event_id>|<sport_key>"`` composite.
+    """
+    escaped = event_id.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    prefix = f"{escaped}|%"
+    db = await get_connection()
+    try:
+        cursor = await db.execute(
+            "SELECT game_id FROM bets WHERE status = 'pending'"
+            " AND (game_id = ? OR game_id LIKE ? ESCAPE '\\')"
+            " UNION"
+            " SELECT game_id FROM parlay_legs WHERE status = 'pending'"
+            " AND (game_id = ? OR game_id LIKE ? ESCAPE '\\')",
+            (event_id, prefix, event_id, prefix),
+        )
+        rows = await cursor.fetchall()
+        return [row["game_id"] for row in rows]
+    finally:
+        await db.close()
+
+
 @db_retry()
 async def get_pending_games_with_commence() -> list[dict]:
     """Return pending game IDs with their commence times from single bets."""
@@ -209,6 +407,19 @@ async def get_bet_by_id(bet_id: int) -> dict | None:
         await db.close()
 
 
+@db_retry()
+async def get_user_bet(bet_id: int, user_id: int) -> dict | None:
+    db = await get_connection()
+    try:
+        cursor = await db.execute(
+            "SELECT * FROM bets WHERE id = ? AND user_id = ?", (bet_id, user_id)
+        )
+        row = await cursor.fetchone()
+        return dict(row) if row else None
+    finally:
+        await db.close()
+
+
 @db_retry()
 async def create_parlay(
     user_id: int, amount: int, total_odds: float, legs: list[dict]
@@ -645,7 +856,7 @@ async def devalue_all_balances(percent: float) -> tuple[int, int]:
 
 
 @db_retry()
-async def create_kalshi_bet(
+async def place_kalshi_bet(
     user_id: int,
     market_ticker: str,
     event_ticker: str,
@@ -655,16 +866,36 @@ async def create_kalshi_bet(
     title: str | None = None,
     close_time: str | None = None,
     pick_display: str | None = None,
-) -> int:
+) -> tuple[int | None, float]:
+    """Debit the stake and record a Kalshi bet in one transaction.
+
+    Returns ``(bet_id, balance)``; the id is None (with nothing written) if
+    the user's balance can't cover ``amount``, and the balance is current
+    either way.
+    """
     db = await get_connection()
     try:
+        await db.execute(
+            "INSERT OR IGNORE INTO users (discord_id, balance) VALUES (?, ?)",
+            (user_id, STARTING_BALANCE),
+        )
+        cursor = await db.execute(
+            "UPDATE users SET balance = balance - ? WHERE discord_id = ? AND balance >= ?",
+            (amount, user_id, amount),
+        )
+        if cursor.rowcount == 0:
+            # Read before rolling back: the user row may have just been created
+            balance = await _fetch_balance(db, user_id)
+            await db.rollback()
+            return None, balance
         cursor = await db.execute(
             "INSERT INTO kalshi_bets (user_id, market_ticker, event_ticker, pick, amount, odds, title, close_time, pick_display)"
             " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
             (user_id, market_ticker, event_ticker, pick, amount, odds, title, close_time, pick_display),
         )
+        balance = await _fetch_balance(db, user_id)
         await db.commit()
-        return cursor.lastrowid
+        return cursor.lastrowid, balance
     finally:
         await db.close()
 
@@ -6,7 +6,7 @@ from discord.ext import commands
 
 from bot.config import DISCORD_TOKEN, GUILD_ID
 from bot.db.database import init_db
-from bot.services import leaderboard_notifier
+from bot.services import leaderboard_notifier, wallet_service
 
 logging.basicConfig(level=logging.INFO)
 log = logging.getLogger(__name__)
@@ -35,6 +35,9 @@ class BookieBot(commands.Bot):
 
     async def setup_hook(self) -> None:
         await init_db()
+        released = await wallet_service.release_all()
+        if released:
+            log.info("Refunded %d wallet reservation(s) left open by the last run.", released)
         for cog in COGS:
             await self.load_extension(cog)
             log.info("Loaded cog: %s", cog)
@@ -96,6 +99,11 @@ class BookieBot(commands.Bot):
                           interaction.command.name if interaction.command else "unknown",
                           exc_info=error)
 
+    async def close(self) -> None:
+        await super().close()
+        from bot.services.kalshi_api import kalshi_api
+        await kalshi_api.close()
+
     async def on_ready(self) -> None:
         log.info("Logged in as %s (ID: %s)", self.user, self.user.id)
 
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import functools
+
 from bot.db import models
-from bot.services.wallet_service import deposit, withdraw
+from bot.services.wallet_service import deposit, invalidate_balance, withdraw
 from bot.services import leaderboard_notifier
+from bot.utils import parse_iso_utc
 
 
 async def place_bet(
@@ -30,8 +33,28 @@ async def place_bet(
     return bet_id
 
 
+@functools.lru_cache(maxsize=1024)
+def _split_cid(cid: str) -> tuple[str, str | None]:
+    """Split a composite ``"<event_id>|<sport_key>"`` game ID."""
+    event_id, _, sport_key = cid.partition("|")
+    return event_id, sport_key or None
+
+
+def _annotate_game_ids(bets: list[dict]) -> list[dict]:
+    """Attach the parsed ``_event_id`` / ``_sport_key`` to each bet dict."""
+    for b in bets:
+        b["_event_id"], b["_sport_key"] = _split_cid(b["game_id"])
+    return bets
+
+
 async def get_user_bets(user_id: int, status: str | None = None) -> list[dict]:
-    return await models.get_user_bets(user_id, status)
+    return _annotate_game_ids(await models.get_user_bets(user_id, status))
+
+
+async def get_bet(bet_id: int, user_id: int) -> dict | None:
+    """Fetch a single bet owned by user_id, or None if it doesn't exist."""
+    bet = await models.get_user_bet(bet_id, user_id)
+    return _annotate_game_ids([bet])[0] if bet else None
 
 
 async def cancel_bet(bet_id: int, user_id: int) -> dict | None:
@@ -103,6 +126,11 @@ async def get_pending_game_ids() -> list[str]:
     return combined
 
 
+async def get_pending_composites_for(event_id: str) -> list[str]:
+    """Pending composite game IDs whose event ID is exactly ``event_id``."""
+    return await models.get_pending_game_ids_for_event(event_id)
+
+
 async def get_user_history(user_id: int, page: int = 0, page_size: int = 10) -> list[dict]:
     """Get resolved bets and parlays for a user, sorted by date, paginated."""
     offset = page * page_size
@@ -156,16 +184,19 @@ async def place_kalshi_bet(
     title: str | None = None,
     close_time: str | None = None,
     pick_display: str | None = None,
-) -> int | None:
-    """Place a Kalshi bet. Returns bet ID on success, None if insufficient balance."""
-    new_balance = await withdraw(user_id, amount)
-    if new_balance is None:
-        return None
-    bet_id = await models.create_kalshi_bet(
+) -> tuple[int | None, float]:
+    """Place a Kalshi bet. Returns ``(bet_id, balance)``.
+
+    ``bet_id`` is None if the balance is insufficient; the balance is the
+    user's current one either way, so callers need no second lookup.
+    """
+    bet_id, balance = await models.place_kalshi_bet(
         user_id, market_ticker, event_ticker, pick, amount, odds,
         title=title, close_time=close_time, pick_display=pick_display,
     )
-    return bet_id
+    if bet_id is not None:
+        invalidate_balance(user_id)
+    return bet_id, balance
 
 
 async def cancel_kalshi_bet(bet_id: int, user_id: int) -> dict | None:
@@ -209,7 +240,7 @@ async def get_started_pending_games() -> dict[str, str | None]:
             started[gid] = ct
             continue
         try:
-            game_start = datetime.fromisoformat(ct.replace("Z", "+00:00"))
+            game_start = parse_iso_utc(ct)
             if game_start <= now:
                 started[gid] = ct
         except (ValueError, TypeError):
@@ -219,7 +250,7 @@ async def get_started_pending_games() -> dict[str, str | None]:
 
 
 async def get_bets_by_game(game_id: str) -> list[dict]:
-    return await models.get_pending_bets_by_game(game_id)
+    return _annotate_game_ids(await models.get_pending_bets_by_game(game_id))
 
 
 async def resolve_game(
@@ -238,94 +269,67 @@ async def resolve_game(
     For spread/total bets, requires home_score and away_score.
     For outrights, uses winner_name to match the pick.
     """
-    bets = await models.get_pending_bets_by_game(game_id)
-    resolved: list[dict] = []
-    have_scores = home_score is not None and away_score is not None
+    return await resolve_games(
+        [game_id], winner,
+        home_score=home_score, away_score=away_score, winner_name=winner_name,
+    )
+
+
+async def resolve_games(
+    game_ids: list[str],
+    winner: str,
+    home_score: int | None = None,
+    away_score: int | None = None,
+    winner_name: str | None = None,
+) -> list[dict]:
+    """Resolve pending bets for several composite IDs of the same event.
+
+    Straight bets are fetched with one query and settled in one transaction;
+    parlay legs are then resolved per game ID. See ``resolve_game``.
+    """
+    bets = await models.get_pending_bets_by_games(game_ids)
+    settlements: list[tuple[int, int, str, int]] = []
+    results: dict[int, str] = {}
 
     for bet in bets:
-        market = bet.get("market") or "h2h"
-        result: str | None = None
-
-        if market == "outrights":
-            if winner_name is not None:
-                won = bet["pick"].lower() == winner_name.lower()
-                await resolve_bet(bet["id"], won)
-                result = "won" if won else "lost"
-            else:
-                continue
-
-        elif market == "h2h":
-            won = bet["pick"] == winner
-            await resolve_bet(bet["id"], won)
-            result = "won" if won else "lost"
-
-        elif market == "spreads" and have_scores:
-            point = bet.get("point") or 0.0
-            pick = bet["pick"]
-            if pick == "spread_home":
-                adjusted = home_score + point
-                if adjusted > away_score:
-                    await resolve_bet(bet["id"], True)
-                    result = "won"
-                elif adjusted < away_score:
-                    await resolve_bet(bet["id"], False)
-                    result = "lost"
-                else:
-                    await refund_bet(bet["id"])
-                    result = "push"
-            elif pick == "spread_away":
-                adjusted = away_score + point
-                if adjusted > home_score:
-                    await resolve_bet(bet["id"], True)
-                    result = "won"
-                elif adjusted < home_score:
-                    await resolve_bet(bet["id"], False)
-                    result = "lost"
-                else:
-                    await refund_bet(bet["id"])
-                    result = "push"
-
-        elif market == "totals" and have_scores:
-            point = bet.get("point") or 0.0
-            total = home_score + away_score
-            pick = bet["pick"]
-            if pick == "over":
-                if total > point:
-                    await resolve_bet(bet["id"], True)
-                    result = "won"
-                elif total < point:
-                    await resolve_bet(bet["id"], False)
-                    result = "lost"
-                else:
-                    await refund_bet(bet["id"])
-                    result = "push"
-            elif pick == "under":
-                if total < point:
-                    await resolve_bet(bet["id"], True)
-                    result = "won"
-                elif total > point:
-                    await resolve_bet(bet["id"], False)
-                    result = "lost"
-                else:
-                    await refund_bet(bet["id"])
-                    result = "push"
-
-        if result is not None:
-            entry = dict(bet)
-            entry["result"] = result
-            if result == "won":
-                entry["payout"] = round(bet["amount"] * bet["odds"], 2)
-            elif result == "push":
-                entry["payout"] = bet["amount"]
-            else:
-                entry["payout"] = 0
-            resolved.append(entry)
+        result = _determine_leg_result(bet, winner, home_score, away_score, winner_name)
+        if result is None:
+            continue
+        if result == "won":
+            payout = round(bet["amount"] * bet["odds"])
+        elif result == "push":
+            payout = bet["amount"]
+        else:
+            payout = 0
+        settlements.append((bet["id"], bet["user_id"], result, payout))
+        results[bet["id"]] = result
 
-    # ── Resolve parlay legs for this game ──
-    parlay_results = await _resolve_parlay_legs(
-        game_id, winner, home_score, away_score, winner_name
-    )
-    resolved.extend(parlay_results)
+    settled = await models.settle_bets(settlements)
+    for _, user_id, _, payout in settlements:
+        if payout:
+            invalidate_balance(user_id)
+
+    resolved: list[dict] = []
+    for bet in bets:
+        if bet["id"] not in settled:
+            continue
+        result = results[bet["id"]]
+        entry = dict(bet)
+        entry["result"] = result
+        if result == "won":
+            entry["payout"] = round(bet["amount"] * bet["odds"], 2)
+        elif result == "push":
+            entry["payout"] = bet["amount"]
+        else:
+            entry["payout"] = 0
+        resolved.append(entry)
+
+    # ── Resolve parlay legs for these games ──
+    for game_id in game_ids:
+        parlay_results = await _resolve_parlay_legs(
+            game_id, winner, home_score, away_score, winner_name
+        )
+        resolved.extend(parlay_results)
 
     return resolved
 
@@ -357,6 +361,8 @@ async def resolve_bet(bet_id: int, won: bool) -> None:
                 (bet_id,),
             )
         await db.commit()
+        if won:
+            invalidate_balance(bet["user_id"])
     finally:
         await db.close()
 
@@ -498,6 +504,7 @@ async def refund_bet(bet_id: int) -> None:
             (bet["amount"], bet["user_id"]),
         )
         await db.commit()
+        invalidate_balance(bet["user_id"])
     finally:
         await db.close()
 
@@ -2,11 +2,15 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import functools
 import json
 import logging
+import re
 import sqlite3
 import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from operator import attrgetter
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -15,7 +19,7 @@ import aiosqlite
 
 from bot.config import KALSHI_API_KEY_ID, KALSHI_PRIVATE_KEY_PATH
 from bot.db.database import DB_PATH, get_connection
-from bot.utils import decimal_to_american
+from bot.utils import decimal_to_american, format_american, parse_iso_utc
 
 # File that accumulates unknown series tickers for later categorization.
 _UNKNOWN_SERIES_FILE = Path(DB_PATH).parent / "unknown_series.txt"
@@ -65,6 +69,29 @@ _EXCLUDED_TICKERS = {
 # We include everything in the Sports category EXCEPT these + _EXCLUDED_TICKERS.
 _DERIVATIVE_SUFFIXES = ("SPREAD", "TOTAL", "SACK", "TD", "TO", "FG")
 
+# Known primary-game suffixes, stripped to get a series' prefix. Also used to
+# include non-Sports series (e.g. motor racing) that Kalshi files elsewhere.
+_GAME_SUFFIX_RE = re.compile(r"(?:GAMES?|FIGHT|MATCH|BOUT|RACE|ROUND|SET)$")
+
+
+@dataclass(frozen=True, slots=True)
+class FuturesOption:
+    """One priced outcome of a futures series, with its display strings.
+
+    ``odds_str`` and ``prob_str`` are formatted once here so menus that page
+    through a long outcome list don't redo the float formatting per render.
+    """
+    ticker: str
+    title: str
+    yes_price: float
+    decimal_odds: float
+    american_odds: int
+    odds_str: str
+    prob_str: str
+    close_time: str | None
+    event_ticker: str
+
+
 SERIES_CACHE_TTL = 86400  # 24 hours — series list rarely changes
 
 # Label overrides — Kalshi titles are often generic ("Professional Basketball")
@@ -237,6 +264,10 @@ FUTURES_TO_SPORTS: dict[str, str] = {}
 # Reverse: SPORTS key → FUTURES key (e.g. "KXNBAGAME" → "NBA")
 SPORTS_TO_FUTURES: dict[str, str] = {}
 
+# Any SPORTS series ticker (Game / Spread / Total) → that sport's label.
+# Populated by refresh_sports() after SPORTS is built.
+SERIES_LABELS: dict[str, str] = {}
+
 # Map sport keys to their parent sport for grouping futures with games
 FUTURES_SPORT_MAP = {}
 for _fk in FUTURES:
@@ -274,6 +305,7 @@ def _extract_event_suffix(event_ticker: str) -> str:
     return parts[1] if len(parts) > 1 else event_ticker
 
 
+@functools.lru_cache(maxsize=4096)
 def _parse_event_ticker_date(event_ticker: str) -> datetime | None:
     """Parse game date (and optional time) from event ticker.
 
@@ -423,6 +455,12 @@ def _extract_spread_team(yes_sub_title: str) -> str | None:
     return None
 
 
+def market_yes_price(m: dict, default: float = 0.0) -> float:
+    """A market's YES ask in dollars, else its last trade, else ``default``."""
+    raw = m.get("yes_ask_dollars") or m.get("last_price_dollars")
+    return float(raw) if raw else default
+
+
 def _pick_best_spread(markets: list[dict]) -> dict | None:
     """From a list of spread markets for one game, pick the main line.
 
@@ -437,18 +475,20 @@ def _pick_best_spread(markets: list[dict]) -> dict | None:
     best = None
     best_diff = 999.0
 
+    best_price = 0.5
     for m in markets:
-        yes_price = float(m.get("yes_ask_dollars") or m.get("last_price_dollars") or "0.5")
+        yes_price = market_yes_price(m, 0.5)
         diff = abs(yes_price - 0.5)
         if diff < best_diff:
             best_diff = diff
             best = m
+            best_price = yes_price
 
     if not best:
         return None
 
     strike = float(best.get("floor_strike") or 0)
-    yes_price = float(best.get("yes_ask_dollars") or best.get("last_price_dollars") or "0.5")
+    yes_price = best_price
     ticker = best.get("ticker")
 
     # YES side: the named team covers at -strike
@@ -503,18 +543,20 @@ def _pick_best_total(markets: list[dict]) -> dict | None:
     best = None
     best_diff = 999.0
 
+    best_price = 0.5
     for m in markets:
-        yes_price = float(m.get("yes_ask_dollars") or m.get("last_price_dollars") or "0.5")
+        yes_price = market_yes_price(m, 0.5)
         diff = abs(yes_price - 0.5)
         if diff < best_diff:
             best_diff = diff
             best = m
+            best_price = yes_price
 
     if not best:
         return None
 
     strike = float(best.get("floor_strike") or 0)
-    yes_price = float(best.get("yes_ask_dollars") or best.get("last_price_dollars") or "0.5")
+    yes_price = best_price
     over_decimal = round(1.0 / yes_price, 3) if yes_price > 0 else 2.0
     over_american = decimal_to_american(over_decimal)
 
@@ -551,7 +593,7 @@ def _is_market_active(m: dict) -> bool:
     if not exp:
         return True
     try:
-        exp_dt = datetime.fromisoformat(exp.replace("Z", "+00:00"))
+        exp_dt = parse_iso_utc(exp)
         return exp_dt > datetime.now(timezone.utc)
     except (ValueError, TypeError):
         return True
@@ -564,7 +606,7 @@ def _is_market_bettable(m: dict) -> bool:
     to 0 or 1 (no longer trading).
     """
     try:
-        price = float(m.get("yes_ask_dollars") or m.get("last_price_dollars") or 0)
+        price = market_yes_price(m)
     except (ValueError, TypeError):
         return False
     return 0.01 <= price <= 0.99
@@ -579,8 +621,8 @@ def _earliest_market_time(m: dict) -> str:
     if not et:
         return ct
     try:
-        ct_dt = datetime.fromisoformat(ct.replace("Z", "+00:00"))
-        et_dt = datetime.fromisoformat(et.replace("Z", "+00:00"))
+        ct_dt = parse_iso_utc(ct)
+        et_dt = parse_iso_utc(et)
         return ct if ct_dt <= et_dt else et
     except (ValueError, TypeError):
         return ct or et
@@ -639,6 +681,7 @@ class KalshiAPI:
         self._mem_all_markets: tuple[list[dict], float] | None = None
         self._mem_browse_data: tuple[dict[str, list[dict]], float] | None = None
         self._mem_all_games: tuple[list[dict], float] | None = None
+        self._mem_discovery: tuple[dict, float] | None = None
         # Log auth config at init
         if KALSHI_API_KEY_ID:
             log.info("Kalshi API key configured: %s...", KALSHI_API_KEY_ID[:8])
@@ -840,10 +883,6 @@ class KalshiAPI:
         spread_tickers: dict[str, str] = {}  # prefix → ticker
         total_tickers: dict[str, str] = {}   # prefix → ticker
 
-        # Known primary-game suffixes (used below to include non-Sports series
-        # like motor racing that Kalshi may place in a different category).
-        _GAME_SUFFIXES = ("GAME", "GAMES", "FIGHT", "MATCH", "BOUT", "RACE", "ROUND", "SET")
-
         for item in all_series:
             ticker = item.get("ticker", "")
             title = item.get("title", "")
@@ -852,12 +891,13 @@ class KalshiAPI:
                 continue
 
             t = ticker.upper()
+            game_suffix = _GAME_SUFFIX_RE.search(t)
 
             # Skip non-Sports series UNLESS the ticker ends with a known game
             # suffix — handles motor racing, combat sports, etc. that Kalshi
             # may categorise under "Racing" or another non-"Sports" bucket.
             if cat != "Sports":
-                if not any(t.endswith(s) for s in _GAME_SUFFIXES):
+                if game_suffix is None:
                     continue
                 log.info(
                     "Including non-Sports series with known suffix: %s (category=%r)",
@@ -881,27 +921,12 @@ class KalshiAPI:
 
             if not is_derivative:
                 # Determine prefix by stripping known game suffixes
-                known_suffix = True
-                if t.endswith("GAMES"):
-                    prefix = ticker[:-5]
-                elif t.endswith("GAME"):
-                    prefix = ticker[:-4]
-                elif t.endswith("FIGHT"):
-                    prefix = ticker[:-5]
-                elif t.endswith("MATCH"):
-                    prefix = ticker[:-5]
-                elif t.endswith("BOUT"):
-                    prefix = ticker[:-4]
-                elif t.endswith("RACE"):
-                    prefix = ticker[:-4]
-                elif t.endswith("ROUND"):
-                    prefix = ticker[:-5]
-                elif t.endswith("SET"):
-                    prefix = ticker[:-3]
+                known_suffix = game_suffix is not None
+                if known_suffix:
+                    prefix = ticker[:game_suffix.start()]
                 else:
                     # Unknown suffix — still include it, use ticker as its own prefix
                     prefix = ticker
-                    known_suffix = False
                     if ticker not in _seen_unknown_series:
                         _seen_unknown_series.add(ticker)
                         with _UNKNOWN_SERIES_FILE.open("a") as f:
@@ -955,6 +980,10 @@ class KalshiAPI:
             ticker for info in SPORTS.values()
             for ticker in info["series"].values()
         }
+        SERIES_LABELS.clear()
+        for info in SPORTS.values():
+            for ticker in info["series"].values():
+                SERIES_LABELS.setdefault(ticker, info["label"])
 
         # Build FUTURES ↔ SPORTS cross-references
         # Match by checking if the FUTURES key appears in the SPORTS ticker
@@ -1424,7 +1453,7 @@ class KalshiAPI:
             exp = game.get("expiration_time", "")
             if exp:
                 try:
-                    exp_dt = datetime.fromisoformat(exp.replace("Z", "+00:00"))
+                    exp_dt = parse_iso_utc(exp)
                     if now > exp_dt:
                         continue
                 except (ValueError, TypeError):
@@ -1457,7 +1486,7 @@ class KalshiAPI:
             m = kalshi_markets.get(side)
             if not m:
                 continue
-            yes_price = float(m.get("yes_ask_dollars") or m.get("last_price_dollars") or "0.5")
+            yes_price = market_yes_price(m, 0.5)
             decimal_odds = round(1.0 / yes_price, 3) if yes_price > 0 else 2.0
             american = decimal_to_american(decimal_odds)
             parsed[side] = {"decimal": decimal_odds, "american": american, "point": None}
@@ -1572,7 +1601,7 @@ class KalshiAPI:
             exp = game.get("expiration_time", "")
             if exp:
                 try:
-                    exp_dt = datetime.fromisoformat(exp.replace("Z", "+00:00"))
+                    exp_dt = parse_iso_utc(exp)
                     if now > exp_dt:
                         continue
                 except (ValueError, TypeError):
@@ -1598,7 +1627,7 @@ class KalshiAPI:
 
         return available
 
-    async def get_futures_markets(self, series_ticker: str) -> list[dict]:
+    async def get_futures_markets(self, series_ticker: str) -> list[FuturesOption]:
         """Fetch open markets for a futures/props series, sorted by probability."""
         data = await self._cached_request(
             f"{BASE_URL}/markets",
@@ -1609,23 +1638,25 @@ class KalshiAPI:
 
         options = []
         for m in data["markets"]:
-            yes_price = float(m.get("yes_ask_dollars") or m.get("last_price_dollars") or "0")
+            yes_price = market_yes_price(m)
             if not (0.02 <= yes_price <= 0.98):
                 continue
             decimal_odds = round(1.0 / yes_price, 3)
             american = decimal_to_american(decimal_odds)
-            options.append({
-                "ticker": m.get("ticker"),
-                "title": m.get("yes_sub_title") or m.get("title", ""),
-                "yes_price": yes_price,
-                "decimal_odds": decimal_odds,
-                "american_odds": american,
-                "close_time": m.get("close_time") or m.get("expected_expiration_time"),
-                "event_ticker": m.get("event_ticker", ""),
-            })
+            options.append(FuturesOption(
+                ticker=m.get("ticker"),
+                title=m.get("yes_sub_title") or m.get("title", ""),
+                yes_price=yes_price,
+                decimal_odds=decimal_odds,
+                american_odds=american,
+                odds_str=format_american(american),
+                prob_str=f"{yes_price * 100:.0f}%",
+                close_time=m.get("close_time") or m.get("expected_expiration_time"),
+                event_ticker=m.get("event_ticker", ""),
+            ))
 
         # Sort by probability descending (favorites first)
-        options.sort(key=lambda o: o["yes_price"], reverse=True)
+        options.sort(key=attrgetter("yes_price"), reverse=True)
         return options
 
     async def discover_available(self, force: bool = False) -> dict:
@@ -1642,6 +1673,12 @@ class KalshiAPI:
         # Check for cached discovery result first
         cache_key = "kalshi:discovery:all"
         if not force:
+            if self._mem_discovery is not None:
+                data, ts = self._mem_discovery
+                if time.monotonic() - ts < DISCOVERY_TTL:
+                    log.debug("Discovery cache HIT (in-memory)")
+                    self.schedule_markets_prewarm()
+                    return data
             async with aiosqlite.connect(DB_PATH) as db:
                 cursor = await db.execute(
                     "SELECT data, fetched_at FROM games_cache WHERE game_id = ?",
@@ -1660,6 +1697,8 @@ class KalshiAPI:
                                 "Discovery cache HIT (age %.0fs): %d games, %d futures",
                                 age, len(cached.get("games", {})), len(cached.get("futures", {})),
                             )
+                            # Backdate so the in-memory copy expires with the row
+                            self._mem_discovery = (cached, time.monotonic() - age)
                             # Markets cache has a shorter TTL — pre-warm in background
                             # so games load instantly when the user picks a sport.
                             self.schedule_markets_prewarm()
@@ -1681,10 +1720,11 @@ class KalshiAPI:
             for ticker in info["series"].values():
                 game_series_to_sport[ticker] = sk
 
+        # Futures series ticker → (category, market name) in one lookup
         futures_series_to_cat = {}
         for sk, info in FUTURES.items():
-            for ticker in info["markets"].values():
-                futures_series_to_cat[ticker] = sk
+            for name, ticker in info["markets"].items():
+                futures_series_to_cat[ticker] = (sk, name)
 
         games_available = {}
         futures_available = {}
@@ -1703,7 +1743,7 @@ class KalshiAPI:
                 # so discovery never shows a sport whose games have all ended.
                 if exp:
                     try:
-                        exp_dt = datetime.fromisoformat(exp.replace("Z", "+00:00"))
+                        exp_dt = parse_iso_utc(exp)
                         if exp_dt > now:
                             if sk not in games_available:
                                 games_available[sk] = {"next_time": None}
@@ -1717,16 +1757,11 @@ class KalshiAPI:
 
             # Check if it's a futures market
             elif st in futures_series_to_cat:
-                cat_key = futures_series_to_cat[st]
-                if cat_key not in futures_available:
-                    futures_available[cat_key] = {}
-                # Match market name from FUTURES dict
-                for name, ticker in FUTURES[cat_key]["markets"].items():
-                    if ticker == st:
-                        futures_available[cat_key][name] = True
-                        break
+                cat_key, name = futures_series_to_cat[st]
+                futures_available.setdefault(cat_key, {})[name] = True
 
         result = {"games": games_available, "futures": futures_available}
+        self._mem_discovery = (result, time.monotonic())
         game_names = [SPORTS.get(k, {}).get("label", k) for k in games_available]
         log.info(
             "Discovery complete: %d game sports (%s), %d futures sports",
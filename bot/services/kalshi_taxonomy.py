@@ -31,6 +31,7 @@ tested in isolation (see ``test_taxonomy.py``).
 
 from __future__ import annotations
 
+import functools
 import re
 from dataclasses import dataclass
 
@@ -206,6 +207,7 @@ _RULES: list[tuple[re.Pattern, SeriesClass]] = (
 # and should always classify as GAME regardless of other tokens in the ticker.
 _GAME_SUFFIXES = ("GAME", "GAMES", "MATCH", "FIGHT", "BOUT", "RACE", "H2H")
 _DERIVATIVE_SUFFIXES = ("SPREAD", "TOTAL", "TEAMTOTAL")
+_GAME_LINES = SeriesClass(GAME, SUB_GAME_LINES)
 
 # Date fingerprint inside an event ticker, e.g. "26FEB14" — present on real
 # games, absent on season-long futures.
@@ -220,29 +222,37 @@ def classify(series_ticker: str, event_ticker: str = "", title: str = "") -> Ser
         event_ticker:  optional; used to detect a date (game) vs no date (future).
         title:         optional; rarely needed, used only as a tie breaker.
     """
-    t = (series_ticker or "").upper()
+    klass = _classify_ticker((series_ticker or "").upper())
+    if klass is not None:
+        return klass
+
+    # 3. Fallbacks based on whether the event is dated.
+    #    A dated event with no recognised token is treated as a game-level
+    #    market; an undated one is an unclassified future/outright.
     et = (event_ticker or "").upper()
+    if et and _EVENT_DATE_RE.search(et):
+        return SeriesClass(GAME, SUB_GAME_PROP)
+    return SeriesClass(FUTURES, SUB_OUTRIGHT)
+
+
+@functools.lru_cache(maxsize=4096)
+def _classify_ticker(t: str) -> SeriesClass | None:
+    """Steps 1-2 of classify, which depend on the series ticker alone.
 
+    Every market in a series shares the answer, so it is cached per ticker
+    instead of re-running the rule table for each market. None means no rule
+    matched and the event-date fallback decides.
+    """
     # 1. Core game lines: ticker ends in a game/derivative suffix. These are the
     #    moneyline/spread/total markets that drive the matchup view.
-    for sfx in _GAME_SUFFIXES:
-        if t.endswith(sfx):
-            return SeriesClass(GAME, SUB_GAME_LINES)
-    for sfx in _DERIVATIVE_SUFFIXES:
-        if t.endswith(sfx):
-            return SeriesClass(GAME, SUB_GAME_LINES)
+    if t.endswith(_GAME_SUFFIXES) or t.endswith(_DERIVATIVE_SUFFIXES):
+        return _GAME_LINES
 
     # 2. Token rule table (most specific → most general).
     for pattern, klass in _RULES:
         if pattern.search(t):
             return klass
-
-    # 3. Fallbacks based on whether the event is dated.
-    #    A dated event with no recognised token is treated as a game-level
-    #    market; an undated one is an unclassified future/outright.
-    if et and _EVENT_DATE_RE.search(et):
-        return SeriesClass(GAME, SUB_GAME_PROP)
-    return SeriesClass(FUTURES, SUB_OUTRIGHT)
+    return None
 
 
 # Ordered list of futures subtypes for stable menu display.
@@ -1,21 +1,110 @@
+import time
+
 from bot.db import models
 
+# Short-lived read cache for get_balance. Every write through this module
+# drops the affected entry; code that changes balances directly in models
+# must call invalidate_balance() afterwards.
+_BALANCE_TTL = 5
+_balance_cache: dict[int, tuple[float, int]] = {}
+
+
+def invalidate_balance(discord_id: int | None = None) -> None:
+    """Drop the cached balance for one user, or for everyone if None."""
+    if discord_id is None:
+        _balance_cache.clear()
+    else:
+        _balance_cache.pop(discord_id, None)
+
 
 async def get_balance(discord_id: int) -> int:
+    cached = _balance_cache.get(discord_id)
+    if cached and time.monotonic() - cached[0] < _BALANCE_TTL:
+        return cached[1]
     user = await models.get_or_create_user(discord_id)
+    _balance_cache[discord_id] = (time.monotonic(), user["balance"])
     return user["balance"]
 
 
 async def deposit(discord_id: int, amount: int) -> int:
     await models.get_or_create_user(discord_id)
-    return await models.update_balance(discord_id, amount)
+    balance = await models.update_balance(discord_id, amount)
+    _balance_cache.pop(discord_id, None)
+    return balance
 
 
-async def withdraw(discord_id: int, amount: int) -> int | None:
+async def replace_hold(
+    discord_id: int, reservation_id: int | None, previous: float, amount: float
+) -> tuple[int | None, float]:
+    """Swap a held stake (``previous`` under ``reservation_id``) for ``amount``.
+
+    With no reservation yet this opens one; otherwise only the difference
+    moves, in one write. Returns ``(reservation_id, balance)`` as
+    try_reserve does.
+    """
+    if reservation_id is None:
+        return await try_reserve(discord_id, amount)
+    return await try_reserve(discord_id, amount - previous, reservation_id)
+
+
+async def try_reserve(
+    discord_id: int, amount: float, reservation_id: int | None = None
+) -> tuple[int | None, float]:
+    """Hold ``amount`` of a user's balance for a game in progress.
+
+    Passing an existing ``reservation_id`` adds to that hold (doubling down).
+    Returns ``(reservation_id, balance)``; the id is None if the user can't
+    cover it. The balance is read in the same transaction either way, so
+    the "Not enough" path needs no second lookup.
+    """
+    reservation_id, balance = await models.reserve_funds(
+        discord_id, amount, reservation_id
+    )
+    _balance_cache[discord_id] = (time.monotonic(), balance)
+    return reservation_id, balance
+
+
+async def settle_many(entries: list[tuple[int, float | None]]) -> dict[int, int]:
+    """Close several ``(reservation_id, payout)`` holds in one write.
+
+    ``payout`` is the total returned to the player (0 for a loss); None
+    refunds the held amount. Returns ``{discord_id: new_balance}``.
+    """
+    balances = await models.settle_reservations(entries)
+    for discord_id in balances:
+        _balance_cache.pop(discord_id, None)
+    return balances
+
+
+async def release_many(reservation_ids: list[int]) -> dict[int, int]:
+    """Refund held reservations in full."""
+    return await settle_many([(rid, None) for rid in reservation_ids])
+
+
+async def release_all() -> int:
+    """Refund every open reservation. Called on startup for abandoned games."""
+    count = await models.release_all_reservations()
+    invalidate_balance()
+    return count
+
+
+async def try_withdraw(discord_id: int, amount: int) -> tuple[bool, int]:
+    """Withdraw if the user can cover it; returns ``(ok, balance)``.
+
+    The balance is the new one on success and the unchanged one otherwise,
+    so callers can report it without another lookup.
+    """
     user = await models.get_or_create_user(discord_id)
     if user["balance"] < amount:
-        return None
-    return await models.update_balance(discord_id, -amount)
+        return False, user["balance"]
+    balance = await models.update_balance(discord_id, -amount)
+    _balance_cache.pop(discord_id, None)
+    return True, balance
+
+
+async def withdraw(discord_id: int, amount: int) -> int | None:
+    ok, balance = await try_withdraw(discord_id, amount)
+    return balance if ok else None
 
 
 async def record_game(
@@ -33,4 +122,6 @@ async def record_game(
 async def add_voice_reward(discord_id: int, minutes: int, reward: int) -> int:
     await models.get_or_create_user(discord_id)
     await models.add_voice_minutes(discord_id, minutes)
-    return await models.update_balance(discord_id, reward)
+    balance = await models.update_balance(discord_id, reward)
+    _balance_cache.pop(discord_id, None)
+    return balance
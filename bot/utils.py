@@ -1,3 +1,5 @@
+import functools
+import re
 from datetime import datetime, timezone
 from bot.constants import TZ_PT, TZ_ET, PICK_LABELS
 
@@ -9,21 +11,56 @@ def fmt_money(amount: float) -> str:
     return f"${amount:,.2f}"
 
 
+def truncate(s: str, n: int = 100) -> str:
+    """Cut ``s`` to at most ``n`` characters, ending in "..." if shortened."""
+    return s if len(s) <= n else s[:n - 3] + "..."
+
+
+# Plain digits, or digits grouped in threes by commas ("1,000", "12,500,000")
+_WAGER_RE = re.compile(r"\d+|\d{1,3}(?:,\d{3})+", re.ASCII)
+
+
+def parse_wager(raw: str) -> int | None:
+    """Parse a whole-dollar wager such as "50", "$50" or "$1,000"; None if invalid."""
+    s = raw.strip().removeprefix("$").strip()
+    return int(s.replace(",", "")) if _WAGER_RE.fullmatch(s) else None
+
+
 def valid_bet(bet: float) -> bool:
     """Return True if the bet is positive and has at most 2 decimal places."""
     return bet > 0 and abs(bet - round(bet, 2)) < 1e-9
 
+
+def _fmt_clock(dt: datetime) -> str:
+    """Format a time as '7:05 PM' without strftime's platform-specific flags."""
+    return f"{(dt.hour - 1) % 12 + 1}:{dt.minute:02d} {'PM' if dt.hour >= 12 else 'AM'}"
+
+
+# Sized above the number of distinct close/expiry stamps on a full board:
+# callers sweep every open market in turn, and an LRU smaller than that
+# cycle evicts each entry just before it is needed again.
+@functools.lru_cache(maxsize=8192)
+def parse_iso_utc(s: str) -> datetime:
+    """Parse an ISO timestamp, accepting a trailing 'Z' for UTC."""
+    return datetime.fromisoformat(s[:-1] + "+00:00" if s.endswith("Z") else s)
+
+
+# Fixed offsets (no DST), so ET is always PT shifted by the same amount.
+_PT_TO_ET = TZ_ET.utcoffset(None) - TZ_PT.utcoffset(None)
+
+
+@functools.lru_cache(maxsize=512)
 def format_game_time(commence_str: str) -> str:
     """Format a commence_time string into PT / ET display."""
     try:
-        ct = datetime.fromisoformat(commence_str.replace("Z", "+00:00"))
+        ct = parse_iso_utc(commence_str)
         pt_dt = ct.astimezone(TZ_PT)
-        et_dt = ct.astimezone(TZ_ET)
-        pt_str = pt_dt.strftime("%-m/%-d %-I:%M %p PT")
+        et_dt = pt_dt + _PT_TO_ET
+        pt_str = f"{pt_dt.month}/{pt_dt.day} {_fmt_clock(pt_dt)} PT"
         if pt_dt.date() == et_dt.date():
-            et_str = et_dt.strftime("%-I:%M %p ET")
+            et_str = f"{_fmt_clock(et_dt)} ET"
         else:
-            et_str = et_dt.strftime("%-m/%-d %-I:%M %p ET")
+            et_str = f"{et_dt.month}/{et_dt.day} {_fmt_clock(et_dt)} ET"
         return f"{pt_str} / {et_str}"
     except (ValueError, TypeError):
         return "TBD"
@@ -42,9 +79,12 @@ def format_game_time_with_label(commence_str: str, sport_key: str = "") -> str:
 
 def format_pick_label(bet: dict) -> str:
     """Format a bet's pick into a display label including point info."""
-    pick = bet.get("pick", "")
+    return _format_pick_label(bet.get("pick", ""), bet.get("point"))
+
+
+@functools.lru_cache(maxsize=2048)
+def _format_pick_label(pick: str, point: float | None) -> str:
     label = PICK_LABELS.get(pick, pick.capitalize())
-    point = bet.get("point")
     if point is not None:
         if pick in ("spread_home", "spread_away"):
             label += f" {point:+g}"
@@ -58,6 +98,7 @@ def format_matchup(home: str, away: str) -> str:
     return f"{away} @ {home}"
 
 
+@functools.lru_cache(maxsize=2048)
 def decimal_to_american(decimal_odds: float) -> int:
     """Convert decimal odds to American odds."""
     if decimal_odds <= 1.0:
@@ -73,6 +114,7 @@ def format_american(odds: int) -> str:
     return f"{odds:+d}" if odds else "?"
 
 
+@functools.lru_cache(maxsize=1024)
 def format_american_with_prob(odds: int) -> str:
     """Format American odds with implied probability, e.g. '+150 (40%)'."""
     if not odds:
@@ -0,0 +1,25 @@
+import pytest
+
+from bot.utils import parse_wager
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("50", 50),
+    (" 50 ", 50),
+    ("$50", 50),
+    ("$ 50", 50),
+    ("1,000", 1000),
+    ("$1,000", 1000),
+    ("12,500,000", 12500000),
+    ("0", 0),
+])
+def test_parse_wager_accepts(raw, expected):
+    assert parse_wager(raw) == expected
+
+
+@pytest.mark.parametrize("raw", [
+    "", "$", "abc", "50.00", "-5", "+5", "1_000", "²",
+    "1,0,0", ",5", "5,", "1,00", "1000,000", "1,,000", "$$50",
+])
+def test_parse_wager_rejects(raw):
+    assert parse_wager(raw) is None